@@ -0,0 +1,38 @@
+"""
+Copyright 2024 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""Dataplex Utils Metadata Wizard constants, parsed once and shared by all modules
+   2024 Google
+"""
+# Standard library imports
+import toml
+import pkgutil
+
+# Load constants
+constants = toml.loads(pkgutil.get_data(__package__, "constants.toml").decode())
+
+# Generation strategies
+STRATEGY_NAIVE = constants["GENERATION_STRATEGY"]["NAIVE"]
+STRATEGY_DOCUMENTED = constants["GENERATION_STRATEGY"]["DOCUMENTED"]
+STRATEGY_DOCUMENTED_THEN_REST = constants["GENERATION_STRATEGY"]["DOCUMENTED_THEN_REST"]
+STRATEGY_RANDOM = constants["GENERATION_STRATEGY"]["RANDOM"]
+STRATEGY_ALPHABETICAL = constants["GENERATION_STRATEGY"]["ALPHABETICAL"]
+
+# Values read on every table or column
+AI_WARNING = constants["OUTPUT_CLAUSES"]["AI_WARNING"]
+NUM_ROWS_TO_SAMPLE = constants["DATA"]["NUM_ROWS_TO_SAMPLE"]
+MAX_COLUMN_DESC_LENGTH = constants["DATA"]["MAX_COLUMN_DESC_LENGTH"]
+PDF_MIME_TYPE = constants["DATA"]["PDF_MIME_TYPE"]
+ASPECT_TEMPLATE_NAME = constants["ASPECT_TEMPLATE"]["name"]
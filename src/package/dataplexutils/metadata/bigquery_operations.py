@@ -18,8 +18,9 @@ limitations under the License.
 """
 # Standard library imports
 import logging
-import toml
-import pkgutil
+import time
+import json
+import threading
 
 # Cloud imports
 from google.cloud.exceptions import NotFound
@@ -27,17 +28,27 @@ from google.cloud import bigquery
 from google.api_core.exceptions import BadRequest, Forbidden
 
 # Load constants
-constants = toml.loads(pkgutil.get_data(__name__, "constants.toml").decode())
+from ._constants import constants
 # Logger
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(constants["LOGGING"]["WIZARD_LOGGER"])
 
+# Table metadata is read several times per run (existence check, schema,
+# description, documented pass, then the rest, then columns) and changes
+# rarely, so one get_table result is reused for a while
+_TABLE_CACHE_TTL_SECONDS = 300
+_TABLE_CACHE_MAX_SIZE = 1024
+
 class BigQueryOperations:
     """BigQuery-specific operations."""
 
     def __init__(self, client):
         """Initialize with reference to main client."""
         self._client = client
+        self._table_cache = {}
+        self._table_cache_lock = threading.Lock()
+        self._job_queries = {}
+        self._job_queries_lock = threading.Lock()
 
     def table_exists(self, table_fqn: str) -> None:
         """Checks if a specified BigQuery table exists.
@@ -49,11 +60,7 @@ class BigQueryOperations:
         Raises:
             NotFound: If the specified table does not exist.
         """
-        try:
-            self._client._cloud_clients[constants["CLIENTS"]["BIGQUERY"]].get_table(table_fqn)
-        except NotFound:
-            logger.error(f"Table {table_fqn} is not found.")
-            raise NotFound(message=f"Table {table_fqn} is not found.")
+        self._get_table(table_fqn)
 
     def get_table_schema(self, table_fqn):
         """Retrieves the schema of a BigQuery table.
@@ -71,23 +78,76 @@ class BigQueryOperations:
             NotFound: If the specified table does not exist.
             Exception: If there is an error retrieving the schema.
         """
+        schema_fields = self.get_table_schema_fields(table_fqn)
+        flattened_schema = [
+            {"name": field.name, "type": field.field_type}
+            for field in schema_fields
+        ]
+        return flattened_schema, schema_fields
+
+    def get_table_schema_fields(self, table_fqn):
+        """Retrieves the schema fields of a BigQuery table without flattening them.
+
+        Args:
+            table_fqn (str): The fully qualified name of the table
+                (e.g., 'project.dataset.table')
+
+        Returns:
+            list: Original BigQuery SchemaField objects
+
+        Raises:
+            NotFound: If the specified table does not exist.
+        """
+        return self._get_table(table_fqn).schema
+
+    def _get_table(self, table_fqn):
+        """Retrieves a BigQuery table, reusing a recent result for the same table.
+
+        The returned table is shared, callers that change it must fetch their
+        own copy from the BigQuery client.
+
+        Args:
+            table_fqn (str): The fully qualified name of the table
+                (e.g., 'project.dataset.table')
+
+        Returns:
+            google.cloud.bigquery.Table: The table
+
+        Raises:
+            NotFound: If the specified table does not exist.
+        """
+        with self._table_cache_lock:
+            cached = self._table_cache.get(table_fqn)
+        if cached is not None and time.monotonic() - cached[0] < _TABLE_CACHE_TTL_SECONDS:
+            return cached[1]
+
         try:
-            table = self._client._cloud_clients[constants["CLIENTS"]["BIGQUERY"]].get_table(
-                table_fqn
-            )
-            schema_fields = table.schema
-            flattened_schema = [
-                {"name": field.name, "type": field.field_type}
-                for field in schema_fields
-            ]
-            return flattened_schema, table.schema
+            table = self._client._bigquery_client.get_table(table_fqn)
         except NotFound:
             logger.error(f"Table {table_fqn} is not found.")
             raise NotFound(message=f"Table {table_fqn} is not found.")
+        self._store_table(table_fqn, table)
+        return table
+
+    def _store_table(self, table_fqn, table):
+        """Caches a freshly fetched or updated BigQuery table."""
+        now = time.monotonic()
+        with self._table_cache_lock:
+            if len(self._table_cache) >= _TABLE_CACHE_MAX_SIZE:
+                for key in [key for key, value in self._table_cache.items()
+                            if now - value[0] >= _TABLE_CACHE_TTL_SECONDS]:
+                    del self._table_cache[key]
+                if len(self._table_cache) >= _TABLE_CACHE_MAX_SIZE:
+                    # Still full of fresh tables, drop the oldest one
+                    del self._table_cache[next(iter(self._table_cache))]
+            self._table_cache[table_fqn] = (now, table)
 
     def get_table_sample(self, table_fqn, num_rows_to_sample):
         """Retrieves a sample of rows from a BigQuery table.
 
+        Rows of regular tables are read with tables.getData permission only;
+        views and other tables without storage to read from are queried.
+
         Args:
             table_fqn (str): The fully qualified name of the table
                 (e.g., 'project.dataset.table')
@@ -102,9 +162,25 @@ class BigQueryOperations:
             Exception: If there is an error retrieving the sample
         """
         try:
-            bq_client = self._client._cloud_clients[constants["CLIENTS"]["BIGQUERY"]]
-            query = f"SELECT * FROM `{table_fqn}` LIMIT {num_rows_to_sample}"
-            return bq_client.query(query).to_dataframe().to_json()
+            bq_client = self._client._bigquery_client
+            table = self._get_table(table_fqn)
+            if table.table_type == "TABLE":
+                # Reads straight from table storage, without running a query
+                # job; the cached table carries the schema, so the client does
+                # not fetch the table again
+                result = bq_client.list_rows(table, max_results=num_rows_to_sample)
+            else:
+                # Views, materialized views and external tables have no
+                # storage to list rows from and can only be queried
+                query = f"SELECT * FROM `{table_fqn}` LIMIT {num_rows_to_sample}"
+                result = bq_client.query(query).result()
+            rows = list(result)
+            # Same column-oriented shape DataFrame.to_json produced, without
+            # going through pandas for a handful of rows
+            return json.dumps({
+                field.name: {str(index): row[field.name] for index, row in enumerate(rows)}
+                for field in result.schema
+            }, default=str)
         except (BadRequest, Forbidden) as e:
             logger.warning(f"BigQuery error when sampling table {table_fqn}: {e}")
             return "[]"
@@ -126,10 +202,7 @@ class BigQueryOperations:
             Exception: If there is an error retrieving the description
         """
         try:
-            table = self._client._cloud_clients[constants["CLIENTS"]["BIGQUERY"]].get_table(
-                table_fqn
-            )
-            return table.description
+            return self._get_table(table_fqn).description
         except Exception as e:
             logger.error(f"Exception: {e}.")
             raise e
@@ -149,7 +222,7 @@ class BigQueryOperations:
         """
         try:
             project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-            client = bigquery.Client(project=project_id)
+            client = self._client._bigquery_client
             table = client.get_table(f"{project_id}.{dataset_id}.{table_id}")
             
             # Get existing description and format the new one
@@ -161,7 +234,7 @@ class BigQueryOperations:
             )
             
             table.description = combined_description
-            client.update_table(table, ["description"])
+            self._store_table(table_fqn, client.update_table(table, ["description"]))
             
             logger.info(f"Updated description for table {table_fqn}")
             return True
@@ -185,7 +258,7 @@ class BigQueryOperations:
         """
         try:
             project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-            client = bigquery.Client(project=project_id)
+            client = self._client._bigquery_client
             table = client.get_table(f"{project_id}.{dataset_id}.{table_id}")
             
             schema = list(table.schema)
@@ -211,7 +284,7 @@ class BigQueryOperations:
                     break
             
             table.schema = schema
-            client.update_table(table, ["schema"])
+            self._store_table(table_fqn, client.update_table(table, ["schema"]))
             
             logger.info(f"Updated description for column {column_name} in table {table_fqn}")
             return True
@@ -232,16 +305,25 @@ class BigQueryOperations:
         Raises:
             Exception: If there is an error retrieving the job information beyond NotFound.
         """
+        # A finished job never changes, and ETL jobs writing several tables are
+        # reached from each of them, so only the query text is kept per job
+        key = (bq_job_id, job_location)
+        with self._job_queries_lock:
+            if key in self._job_queries:
+                return self._job_queries[key]
         try:
-            bq_client = self._client._cloud_clients[constants["CLIENTS"]["BIGQUERY"]]
+            bq_client = self._client._bigquery_client
             # Fetch the job details. Project ID is inferred from the client.
             job = bq_client.get_job(job_id=bq_job_id, location=job_location)
             # Check if the job has a query attribute
             if hasattr(job, 'query') and job.query:
-                return job.query
+                job_query = job.query
             else:
                 logger.warning(f"Job {bq_job_id} in location {job_location} does not have query information.")
-                return None
+                job_query = None
+            with self._job_queries_lock:
+                self._job_queries[key] = job_query
+            return job_query
         except NotFound:
             logger.warning(f"BigQuery job {bq_job_id} not found in location {job_location}.")
             return None
@@ -262,12 +344,12 @@ class BigQueryOperations:
             Exception: If there is an error updating the schema
         """
         try:
-            table = self._client._cloud_clients[constants["CLIENTS"]["BIGQUERY"]].get_table(
+            table = self._client._bigquery_client.get_table(
                 table_fqn
             )
             table.schema = schema
-            _ = self._client._cloud_clients[constants["CLIENTS"]["BIGQUERY"]].update_table(
-                table, ["schema"]
+            self._store_table(
+                table_fqn, self._client._bigquery_client.update_table(table, ["schema"])
             )
         except Exception as e:
             logger.error(f"Exception: {e}.")
@@ -20,10 +20,10 @@ from .version import __version__
 
 # Standard library imports
 import logging
-import toml
-import pkgutil
+import concurrent.futures
 
 # Cloud imports
+from google.protobuf.internal import api_implementation
 from google.cloud import bigquery
 from google.cloud import dataplex_v1
 from google.cloud import datacatalog_lineage_v1
@@ -39,10 +39,11 @@ from .review_operations import ReviewOperations
 from .utils import MetadataUtils
 
 # Load constants
-constants = toml.loads(pkgutil.get_data(__name__, "constants.toml").decode())
+from ._constants import constants
 # Logger
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(constants["LOGGING"]["WIZARD_LOGGER"])
+logger.info("protobuf implementation: %s", api_implementation.Type())
 
 class Client:
     """Represents the main metadata wizard client."""
@@ -64,13 +65,29 @@ class Client:
         self.llm_location = llm_location
 
         # Initialize cloud clients
+        self._bigquery_client = bigquery.Client()
+        self._data_scan_client = dataplex_v1.DataScanServiceClient()
+        self._lineage_client = datacatalog_lineage_v1.LineageClient()
+        self._catalog_client = dataplex_v1.CatalogServiceClient()
         self._cloud_clients = {
-            constants["CLIENTS"]["BIGQUERY"]: bigquery.Client(),
-            constants["CLIENTS"]["DATAPLEX_DATA_SCAN"]: dataplex_v1.DataScanServiceClient(),
-            constants["CLIENTS"]["DATA_CATALOG_LINEAGE"]: datacatalog_lineage_v1.LineageClient(),
-            constants["CLIENTS"]["DATAPLEX_CATALOG"]: dataplex_v1.CatalogServiceClient()
+            constants["CLIENTS"]["BIGQUERY"]: self._bigquery_client,
+            constants["CLIENTS"]["DATAPLEX_DATA_SCAN"]: self._data_scan_client,
+            constants["CLIENTS"]["DATA_CATALOG_LINEAGE"]: self._lineage_client,
+            constants["CLIENTS"]["DATAPLEX_CATALOG"]: self._catalog_client
         }
 
+        # Fan-out of per-table metadata lookups (lineage sources and processes,
+        # data scan jobs) shares one bounded pool, however many tables run at once
+        self._lookup_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._client_options._lookup_parallelism,
+            thread_name_prefix="dataplexutils-lookup",
+        )
+
+        # Prompt managers, bound to this client's options
+        self._table_prompt_mgr = PromptManager(PromtType.PROMPT_TYPE_TABLE, self._client_options)
+        self._column_prompt_mgr = PromptManager(PromtType.PROMPT_TYPE_COLUMN, self._client_options)
+        self._column_batch_prompt_mgr = PromptManager(PromtType.PROMPT_TYPE_COLUMN_BATCH, self._client_options)
+
         # Initialize operation classes
         self._utils = MetadataUtils(self)
         self._table_ops = TableOperations(self)
@@ -83,12 +100,24 @@ class Client:
     def generate_dataset_tables_descriptions(self, dataset_fqn, strategy="NAIVE", documentation_csv_uri=None):
         return self._table_ops.generate_dataset_tables_descriptions(dataset_fqn, strategy, documentation_csv_uri)
 
+    async def generate_dataset_tables_descriptions_async(self, dataset_fqn, strategy="NAIVE", documentation_csv_uri=None):
+        return await self._table_ops.generate_dataset_tables_descriptions_async(dataset_fqn, strategy, documentation_csv_uri)
+
     def regenerate_dataset_tables_descriptions(self, dataset_fqn, strategy="NAIVE", documentation_csv_uri=None):
         return self._table_ops.regenerate_dataset_tables_descriptions(dataset_fqn, strategy, documentation_csv_uri)
 
     def generate_table_description(self, table_fqn, documentation_uri=None, human_comments=None):
         return self._table_ops.generate_table_description(table_fqn, documentation_uri, human_comments)
 
+    def generate_tables_descriptions(self, table_fqns):
+        return self._table_ops.generate_tables_descriptions(table_fqns)
+
+    async def generate_table_description_async(self, table_fqn, documentation_uri=None, human_comments=None):
+        return await self._table_ops.generate_table_description_async(table_fqn, documentation_uri, human_comments)
+
+    async def generate_tables_descriptions_async(self, table_fqns):
+        return await self._table_ops.generate_tables_descriptions_async(table_fqns)
+
     def generate_columns_descriptions(self, table_fqn, documentation_uri=None, human_comments=None):
         return self._column_ops.generate_columns_descriptions(table_fqn, documentation_uri, human_comments)
 
@@ -113,15 +142,24 @@ class Client:
     def add_comment_to_column_draft_description(self, table_fqn, column_name, comment):
         return self._review_ops.add_comment_to_column_draft_description(table_fqn, column_name, comment)
 
+    def flush_comments(self):
+        return self._review_ops.flush_comments()
+
     def get_review_item_details(self, table_fqn: str, column_name: str = None):
         return self._review_ops.get_review_item_details(table_fqn, column_name)
 
+    def list_review_items(self, table_fqn: str, since_timestamp: str = None):
+        return self._review_ops.list_review_items(table_fqn, since_timestamp)
+
     def mark_table_for_regeneration(self, table_fqn: str):
         return self._dataplex_ops.mark_table_for_regeneration(table_fqn)
 
     def mark_column_for_regeneration(self, table_fqn: str, column_name: str):
         return self._dataplex_ops.mark_column_for_regeneration(table_fqn, column_name)
 
+    def refresh_data_scans(self):
+        return self._dataplex_ops.refresh_data_scans()
+
     def generate_dataset_tables_columns_descriptions(self, dataset_fqn, strategy="NAIVE", documentation_csv_uri=None):
         return self._column_ops.generate_dataset_tables_columns_descriptions(dataset_fqn, strategy, documentation_csv_uri)
 
@@ -132,4 +170,10 @@ class Client:
         return self._review_ops.reject_review_item(item_id)
         
     def edit_review_item(self, item_id: str, description: str):
-        return self._review_ops.edit_review_item(item_id, description) 
\ No newline at end of file
+        return self._review_ops.edit_review_item(item_id, description)
+
+    def bulk_reject_review_items(self, item_ids: list):
+        return self._review_ops.bulk_reject_review_items(item_ids)
+
+    def bulk_edit_review_items(self, items: list):
+        return self._review_ops.bulk_edit_review_items(items) 
\ No newline at end of file
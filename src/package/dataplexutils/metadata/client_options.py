@@ -15,12 +15,10 @@ limitations under the License.
 """
 
 
-import toml
-import pkgutil
 import json
 
 # Load constants from constants.toml located in the same package
-constants = toml.loads(pkgutil.get_data(__package__, "constants.toml").decode())
+from ._constants import constants
 
 class ClientOptions:
     """Represents the client options for the metadata wizard client."""
@@ -38,7 +36,12 @@ class ClientOptions:
         regenerate=False,
         top_values_in_description=True,
         description_handling=constants["DESCRIPTION_HANDLING"]["APPEND"],
-        description_prefix=constants["OUTPUT_CLAUSES"]["AI_WARNING"]
+        description_prefix=constants["OUTPUT_CLAUSES"]["AI_WARNING"],
+        max_workers=constants["CONCURRENCY"]["MAX_WORKERS"],
+        llm_parallelism=constants["CONCURRENCY"]["LLM_PARALLELISM"],
+        column_batch_size=constants["CONCURRENCY"]["COLUMN_BATCH_SIZE"],
+        lookup_parallelism=constants["CONCURRENCY"]["LOOKUP_PARALLELISM"],
+        batch_staging_uri=None
     ):
         self._use_lineage_tables = use_lineage_tables
         self._use_lineage_processes = use_lineage_processes
@@ -53,6 +56,11 @@ class ClientOptions:
         self._top_values_in_description = top_values_in_description
         self._description_handling = description_handling
         self._description_prefix = description_prefix
+        self._max_workers = max_workers
+        self._llm_parallelism = llm_parallelism
+        self._column_batch_size = column_batch_size
+        self._lookup_parallelism = lookup_parallelism
+        self._batch_staging_uri = batch_staging_uri
         
     def to_dict(self):
         """Convert the ClientOptions object to a dictionary."""
@@ -69,7 +77,12 @@ class ClientOptions:
             "regenerate": self._regenerate,
             "top_values_in_description": self._top_values_in_description,
             "description_handling": self._description_handling,
-            "description_prefix": self._description_prefix
+            "description_prefix": self._description_prefix,
+            "max_workers": self._max_workers,
+            "llm_parallelism": self._llm_parallelism,
+            "column_batch_size": self._column_batch_size,
+            "lookup_parallelism": self._lookup_parallelism,
+            "batch_staging_uri": self._batch_staging_uri
         }
     
     def __str__(self):
@@ -18,21 +18,34 @@ limitations under the License.
 """
 # Standard library imports
 import logging
-import toml
-import pkgutil
+import json
+import re
+import concurrent.futures
 
 # Cloud imports
 from google.cloud import bigquery
 
 # Local imports
-from .prompt_manager import PromtType, PromptManager
+from .prompt_manager import format_prompt
 
 # Load constants
-constants = toml.loads(pkgutil.get_data(__name__, "constants.toml").decode())
+from ._constants import (
+    constants,
+    AI_WARNING,
+    MAX_COLUMN_DESC_LENGTH,
+    STRATEGY_DOCUMENTED,
+    STRATEGY_DOCUMENTED_THEN_REST,
+    STRATEGY_NAIVE,
+    STRATEGY_RANDOM,
+    STRATEGY_ALPHABETICAL,
+)
 # Logger
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(constants["LOGGING"]["WIZARD_LOGGER"])
 
+# Markdown code fences the model sometimes wraps JSON answers in
+_JSON_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
 class ColumnOperations:
     """Column-specific operations."""
 
@@ -90,7 +103,7 @@ class ColumnOperations:
             if int_strategy not in constants["GENERATION_STRATEGY"].values():
                 raise ValueError(f"Invalid strategy: {strategy}.")
             
-            if int_strategy == constants["GENERATION_STRATEGY"]["DOCUMENTED"]:
+            if int_strategy == STRATEGY_DOCUMENTED:
                 if documentation_csv_uri is None:
                     raise ValueError("A documentation URI is required for the DOCUMENTED strategy.")
 
@@ -101,32 +114,33 @@ class ColumnOperations:
             else:
                 tables = self._client._table_ops._list_tables_in_dataset(dataset_fqn)
                 logger.debug(f"Tables to generate columns: {tables}")
+            tables_set = set(tables)
             
-            if int_strategy == constants["GENERATION_STRATEGY"]["DOCUMENTED"]:
+            if int_strategy == STRATEGY_DOCUMENTED:
                 tables_from_uri = self._client._table_ops._get_tables_from_uri(documentation_csv_uri)
                 for table in tables_from_uri:
-                    if table[0] not in tables:
+                    if table[0] not in tables_set:
                         raise ValueError(f"Table {table[0]} not found in dataset {dataset_fqn}.")
                     # Generate columns for this table
                     self.generate_columns_descriptions(table[0], table[1])
 
-            if int_strategy == constants["GENERATION_STRATEGY"]["DOCUMENTED_THEN_REST"]:
+            if int_strategy == STRATEGY_DOCUMENTED_THEN_REST:
                 tables_from_uri = self._client._table_ops._get_tables_from_uri(documentation_csv_uri)
                 for table in tables_from_uri:
-                    if table[0] not in tables:
+                    if table[0] not in tables_set:
                         raise ValueError(f"Table {table[0]} not found in dataset {dataset_fqn}.")
                     # Generate columns for this table
                     self.generate_columns_descriptions(table[0], table[1])
                     self._client._table_ops.generate_table_description(table[0])
 
-                tables_from_uri_first_elements = [table[0] for table in tables_from_uri]
+                tables_from_uri_first_elements = {table[0] for table in tables_from_uri}
                 for table in tables:
                     if table not in tables_from_uri_first_elements:
                         self.generate_columns_descriptions(table)
                         self._client._table_ops.generate_table_description(table)
             
-            if int_strategy in [constants["GENERATION_STRATEGY"]["NAIVE"], constants["GENERATION_STRATEGY"]["RANDOM"], constants["GENERATION_STRATEGY"]["ALPHABETICAL"]]:
-                tables_sorted = self._client._table_ops._order_tables_to_strategy(tables, int_strategy)
+            if int_strategy in (STRATEGY_NAIVE, STRATEGY_RANDOM, STRATEGY_ALPHABETICAL):
+                tables_sorted = self._client._table_ops._order_tables_to_strategy(tables, int_strategy, mutable=True)
                 for table in tables_sorted:
                     self.generate_columns_descriptions(table)
                     self._client._table_ops.generate_table_description(table)
@@ -153,92 +167,129 @@ class ColumnOperations:
         try:
             logger.info(f"Generating metadata for columns in table {table_fqn}.")
             self._client._bigquery_ops.table_exists(table_fqn)
-            table_schema_str, table_schema = self._client._bigquery_ops.get_table_schema(table_fqn)
-            table_sample = self._client._bigquery_ops.get_table_sample(
-                table_fqn, constants["DATA"]["NUM_ROWS_TO_SAMPLE"]
-            )
-
-            # Get additional information
-            table_quality = self._client._dataplex_ops.get_table_quality(
-                self._client._client_options._use_data_quality, table_fqn
-            )
-            table_profile = self._client._dataplex_ops.get_table_profile(
-                self._client._client_options._use_profile, table_fqn
-            )
-            try:
-                table_sources_info = self._client._dataplex_ops.get_table_sources_info(
-                    self._client._client_options._use_lineage_tables, table_fqn
-                )
-            except Exception as e:
-                logger.error(f"Error getting table sources info for table {table_fqn}: {e}")
-                table_sources_info = None
-            try:
-                job_sources_info = self._client._dataplex_ops.get_job_sources(
-                    self._client._client_options._use_lineage_processes, table_fqn
-                )
-            except Exception as e:
-                logger.error(f"Error getting job sources info for table {table_fqn}: {e}")
-                job_sources_info = None
+            # Same context as the table description, shared through its cache
+            context = self._client._table_ops._get_table_context(table_fqn)
+            table_schema_str = context["table_schema_str"]
+            table_schema = context["table_schema"]
+            table_sample = context["table_sample"]
+            table_quality = context["table_quality"]
+            table_profile = context["table_profile"]
+            table_sources_info = context["table_sources_info"]
+            job_sources_info = context["job_sources_info"]
 
             if documentation_uri == "":
                 documentation_uri = None
 
-            prompt_manager = PromptManager(
-                PromtType.PROMPT_TYPE_COLUMN, self._client._client_options
-            )
+            batch_size = self._client._client_options._column_batch_size
             # Get prompt
-            column_description_prompt = prompt_manager.get_promtp()
-            # We need to generate a new schema with the updated column
-            # descriptions and then swap it
-            updated_schema = []
-            updated_columns = []
+            # The single column prompt is also the fallback for columns missing from a batch answer
+            single_column_prompt = self._client._column_prompt_mgr.get_promtp()
+            if batch_size > 1:
+                column_description_prompt = self._client._column_batch_prompt_mgr.get_promtp()
+            else:
+                column_description_prompt = single_column_prompt
 
-            # Iterate over the columns in the table schema
-            for column in table_schema:
-                # Extract column information from the table profile
-                column_info = self._extract_column_info_from_table_profile(table_profile, column.name)
+            def should_generate(column):
+                return self._client._client_options._regenerate == True and self._client._dataplex_ops.check_if_column_should_be_regenerated(table_fqn, column.name) or self._client._client_options._regenerate == False
 
+            def get_human_comments(column):
                 if self._client._client_options._use_human_comments:
-                    human_comments = self._client._dataplex_ops.get_column_comment(table_fqn, column.name)
-                
+                    return self._client._dataplex_ops.get_column_comment(table_fqn, column.name)
+                return human_comments
+
+            def describe_column(column):
                 # Format the prompt with the column information
-                column_description_prompt_expanded = column_description_prompt.format(
+                column_description_prompt_expanded = format_prompt(
+                    single_column_prompt,
                     column_name=column.name,
                     table_fqn=table_fqn,
                     table_schema_str=table_schema_str,
                     table_sample=table_sample,
-                    table_profile=column_info,
+                    table_profile=self._extract_column_info_from_table_profile(table_profile, column.name),
                     table_quality=table_quality,
                     table_sources_info=table_sources_info,
                     job_sources_info=job_sources_info,
-                    human_comments=human_comments
+                    human_comments=get_human_comments(column)
+                )
+                return self._client._utils.llm_inference(
+                    column_description_prompt_expanded,
+                    documentation_uri=documentation_uri,
                 )
 
-                if self._client._client_options._regenerate == True and self._client._dataplex_ops.check_if_column_should_be_regenerated(table_fqn, column.name) or self._client._client_options._regenerate == False:
-                    column_description = self._client._utils.llm_inference(
-                        column_description_prompt_expanded,
-                        documentation_uri=documentation_uri,
-                    )
-                    if self._client._client_options._add_ai_warning:
-                        column_description = f"{constants['OUTPUT_CLAUSES']['AI_WARNING']}{column_description}"
-
-                    updated_schema.append(
-                        self._get_updated_column(column, column_description)
-                    )
-                    if self._client._client_options._stage_for_review:
-                        self._client._dataplex_ops.update_column_draft_description(table_fqn, column.name, column_description)
-                    updated_columns.append(column)
-                    logger.info(f"Generated column description: {column_description}.")
-                   # if self._client._client_options._regenerate:
-                   #     self._client._dataplex_ops.mark_column_as_regenerated(table_fqn, column.name)
-                   #     logger.info(f"Marked column {column.name} as regenerated in Dataplex catalog.")
-                    
+            def describe_columns(columns):
+                # The table context is the same for every column, so several
+                # columns share one prompt and the model answers with JSON
+                column_description_prompt_expanded = format_prompt(
+                    column_description_prompt,
+                    column_names=[column.name for column in columns],
+                    table_fqn=table_fqn,
+                    table_schema_str=table_schema_str,
+                    table_sample=table_sample,
+                    table_profile={
+                        column.name: self._extract_column_info_from_table_profile(table_profile, column.name)
+                        for column in columns
+                    },
+                    table_quality=table_quality,
+                    table_sources_info=table_sources_info,
+                    job_sources_info=job_sources_info,
+                    human_comments={column.name: get_human_comments(column) for column in columns}
+                )
+                response = self._client._utils.llm_inference(
+                    column_description_prompt_expanded,
+                    documentation_uri=documentation_uri,
+                )
+                try:
+                    descriptions = json.loads(_JSON_FENCE_RE.sub("", response.strip()))
+                    if not isinstance(descriptions, dict):
+                        raise ValueError("the answer is not a JSON object")
+                except ValueError as e:
+                    logger.warning(f"Could not parse the batch answer for table {table_fqn}, describing its columns one by one: {e}")
+                    descriptions = {}
+                return {
+                    column.name: descriptions[column.name]
+                    if isinstance(descriptions.get(column.name), str) and descriptions[column.name]
+                    else describe_column(column)
+                    for column in columns
+                }
+
+            def finish_column(column, column_description):
+                if self._client._client_options._add_ai_warning:
+                    column_description = f"{AI_WARNING}{column_description}"
+
+                if self._client._client_options._stage_for_review:
+                    self._client._dataplex_ops.update_column_draft_description(table_fqn, column.name, column_description)
+                logger.info(f"Generated column description: {column_description}.")
+                return self._get_updated_column(column, column_description)
+
+            # The columns are independent LLM calls, so they run concurrently.
+            # map keeps the schema order to generate the new schema with the
+            # updated column descriptions and then swap it
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._client._client_options._llm_parallelism
+            ) as executor:
+                generate = list(executor.map(should_generate, table_schema))
+                updated_columns = [column for column, selected in zip(table_schema, generate) if selected]
+                if batch_size > 1:
+                    batches = [updated_columns[i:i + batch_size] for i in range(0, len(updated_columns), batch_size)]
+                    descriptions = {}
+                    for batch_descriptions in executor.map(describe_columns, batches):
+                        descriptions.update(batch_descriptions)
+                    column_descriptions = [descriptions[column.name] for column in updated_columns]
+                else:
+                    column_descriptions = list(executor.map(describe_column, updated_columns))
+                updated_fields = iter(list(executor.map(finish_column, updated_columns, column_descriptions)))
+
+            updated_schema = []
+            for column, selected in zip(table_schema, generate):
+                if selected:
+                    updated_schema.append(next(updated_fields))
                 else:
-                    updated_schema.append(column)
                     logger.info(f"Column {column.name} will not be updated.")
+                    updated_schema.append(column)
 
             if not self._client._client_options._stage_for_review:
                 self._client._bigquery_ops.update_table_schema(table_fqn, updated_schema)
+                self._client._table_ops._invalidate_table_context(table_fqn)
             
             if self._client._client_options._regenerate:
                 for column in updated_columns:                    
@@ -349,7 +400,7 @@ class ColumnOperations:
         try:
             if self._client._client_options._add_ai_warning and column.description is not None:
                 try:
-                    index = column.description.index(constants['OUTPUT_CLAUSES']['AI_WARNING'])
+                    index = column.description.index(AI_WARNING)
                     column_description = column.description[:index] + column_description
                 except ValueError:
                     column_description = column.description + column_description
@@ -360,7 +411,7 @@ class ColumnOperations:
                 mode=column.mode,
                 default_value_expression=column.default_value_expression,
                 description=column_description[
-                        0 : constants["DATA"]["MAX_COLUMN_DESC_LENGTH"]
+                        0 : MAX_COLUMN_DESC_LENGTH
                     ],
                 fields=column.fields,
                 policy_tags=column.policy_tags,
@@ -16,18 +16,17 @@ limitations under the License.
 
 # Standard library imports
 import logging
-import toml
-import pkgutil
 import datetime
 import uuid
 import traceback
-import json
 import re
+import time
+import threading
+import functools
 
 # Cloud imports
 from google.cloud import dataplex_v1
 from google.cloud.dataplex_v1 import (
-    GetDataScanRequest,
     ListDataScanJobsRequest,
     GetDataScanJobRequest,
 )
@@ -37,17 +36,33 @@ import google.api_core.exceptions
 from google.cloud import datacatalog_lineage_v1
 
 # Load constants
-constants = toml.loads(pkgutil.get_data(__name__, "constants.toml").decode())
+from ._constants import constants, ASPECT_TEMPLATE_NAME
 # Logger
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(constants["LOGGING"]["WIZARD_LOGGER"])
 
+# Every entry update replaces aspects only; the request copies the mask, so one instance is shared
+_ASPECTS_FIELD_MASK = field_mask_pb2.FieldMask(paths=["aspects"])
+# Data scans of a location, indexed by scanned resource, are reused across the tables of a run
+_DATA_SCAN_INDEX_TTL_SECONDS = 300
+
+
+@functools.lru_cache(maxsize=4096)
+def _bq_resource_string(project_id, dataset_id, table_id):
+    return f"//bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+
+
 class DataplexOperations:
     """Dataplex-specific operations."""
 
     def __init__(self, client):
         """Initialize with reference to main client."""
         self._client = client
+        self._dataset_locations = {}
+        self._data_scan_indexes = {}
+        self._data_scan_indexes_lock = threading.Lock()
+        self._process_job_ids = {}
+        self._process_job_ids_lock = threading.Lock()
 
     def _check_if_exists_aspect_type(self, aspect_type_id: str):
         """Checks if a specified aspect type exists in Dataplex catalog.
@@ -63,7 +78,7 @@ class DataplexOperations:
                 beyond a NotFound error
         """
         # Create a client
-        client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
+        client = self._client._catalog_client
 
         # Initialize request argument(s)
         request = dataplex_v1.GetAspectTypeRequest(
@@ -87,13 +102,13 @@ class DataplexOperations:
             Exception: If there is an error creating the aspect type
         """
         # Create a client
-        client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
+        client = self._client._catalog_client
 
         # Initialize request argument(s)
         aspect_type = dataplex_v1.AspectType()
         full_metadata_template = {
             "type_": constants["ASPECT_TEMPLATE"]["type_"],
-            "name": constants["ASPECT_TEMPLATE"]["name"],
+            "name": ASPECT_TEMPLATE_NAME,
             "record_fields": constants["record_fields"]
         }
         metadata_template = dataplex_v1.AspectType.MetadataTemplate(full_metadata_template)
@@ -131,9 +146,9 @@ class DataplexOperations:
         """
         try:
             project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
+            client = self._client._catalog_client
 
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            entry_name = self._build_entry_name(table_fqn)
             aspect_type = f"""projects/dataplex-types/locations/global/aspectTypes/overview"""
             aspect_types = [aspect_type]
             old_overview = None
@@ -142,10 +157,10 @@ class DataplexOperations:
             try:
                 request = dataplex_v1.GetEntryRequest(name=entry_name, view=dataplex_v1.EntryView.CUSTOM, aspect_types=aspect_types)
                 current_entry = client.get_entry(request=request)
-                for i in current_entry.aspects:
-                    if i.endswith(f"""global.overview""") and current_entry.aspects[i].path == "":
-                        logger.info(f"Reading existing aspect {i} of table {table_fqn}")
-                        old_overview = dict(current_entry.aspects[i].data)
+                for aspect_key, existing_aspect in current_entry.aspects.items():
+                    if aspect_key.endswith(f"""global.overview""") and existing_aspect.path == "":
+                        logger.info(f"Reading existing aspect {aspect_key} of table {table_fqn}")
+                        old_overview = dict(existing_aspect.data)
                         logger.info(f"""old_overview: {old_overview["content"][1:50]}...""")
             except Exception as e:
                 logger.error(f"Exception: {e}.")
@@ -187,7 +202,7 @@ class DataplexOperations:
             # Initialize request argument(s)
             request = dataplex_v1.UpdateEntryRequest(
                 entry=entry,
-                update_mask=field_mask_pb2.FieldMask(paths=["aspects"]),
+                update_mask=_ASPECTS_FIELD_MASK,
             )
 
             # Make the request
@@ -218,7 +233,7 @@ class DataplexOperations:
             Exception: If there is an error updating the draft description
         """
         try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
+            client = self._client._catalog_client
             # Create new aspect content
             new_aspect_content = {
                 #"certified": "false",
@@ -239,14 +254,13 @@ class DataplexOperations:
             
             # Create the aspect
             new_aspect = dataplex_v1.Aspect()
-            new_aspect.aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_name = f"""{self._client._project_id}.global.{constants["ASPECT_TEMPLATE"]["name"]}"""
+            new_aspect.aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{ASPECT_TEMPLATE_NAME}"""
+            aspect_name = f"""{self._client._project_id}.global.{ASPECT_TEMPLATE_NAME}"""
             aspect_types = [new_aspect.aspect_type]
 
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
 
             entry = dataplex_v1.Entry()
-            entry.name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            entry.name = self._build_entry_name(table_fqn)
 
             # Check if the aspect already exists
             try:
@@ -259,10 +273,10 @@ class DataplexOperations:
             data_struct = struct_pb2.Struct()
             data_struct.update(new_aspect_content)
             new_aspect.data = data_struct
-            for i in entry.aspects:
-                if i.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") and entry.aspects[i].path == "":
-                    logger.info(f"Updating aspect {i} with old_values")
-                    new_aspect.data = entry.aspects[i].data
+            for aspect_key, existing_aspect in entry.aspects.items():
+                if aspect_key.endswith(f"""global.{ASPECT_TEMPLATE_NAME}""") and existing_aspect.path == "":
+                    logger.info(f"Updating aspect {aspect_key} with old_values")
+                    new_aspect.data = existing_aspect.data
                     update_data = {
                         "contents": description,
                         "generation-date": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
@@ -272,8 +286,9 @@ class DataplexOperations:
                     if metadata:
                         update_data.update(metadata)
                     new_aspect.data.update(update_data)
-                    logger.info(f"entry.aspects[aspect_name].data: {entry.aspects[i].data}")
+                    logger.info(f"entry.aspects[aspect_name].data: {existing_aspect.data}")
                     logger.info(f"new_aspect.data: {new_aspect.data}")
+                    break
 
             new_entry = dataplex_v1.Entry()
             new_entry.name = entry.name
@@ -282,7 +297,7 @@ class DataplexOperations:
             # Initialize request argument(s)  
             request = dataplex_v1.UpdateEntryRequest(
                 entry=new_entry,
-                update_mask=field_mask_pb2.FieldMask(paths=["aspects"]), 
+                update_mask=_ASPECTS_FIELD_MASK, 
                 allow_missing=False,
                 aspect_keys=[aspect_name]
             )
@@ -315,17 +330,16 @@ class DataplexOperations:
         """
         try:
             # Create a client
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
+            client = self._client._catalog_client
             
             # Get project and dataset IDs
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
             
             # Set up aspect types and entry name
             aspect_types = [
-                f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
+                f"""projects/{self._client._project_id}/locations/global/aspectTypes/{ASPECT_TEMPLATE_NAME}"""
             ]
             
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            entry_name = self._build_entry_name(table_fqn)
             
             # Get the entry with the draft aspect
             request = dataplex_v1.GetEntryRequest(
@@ -340,7 +354,7 @@ class DataplexOperations:
             # Find the draft description in the custom aspect
             for aspect_key, aspect in entry.aspects.items():
                 logger.info(f"Processing aspect: {aspect_key}")
-                if aspect.aspect_type.endswith(f"""aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}""") and aspect.path == "":
+                if aspect.aspect_type.endswith(f"""aspectTypes/{ASPECT_TEMPLATE_NAME}""") and aspect.path == "":
                     if "contents" in aspect.data:
                         overview = aspect.data["contents"]
                         logger.info(f"Found draft description: {overview[:50]}...")
@@ -383,7 +397,7 @@ class DataplexOperations:
             Exception: If there is an error updating the draft description
         """
         try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
+            client = self._client._catalog_client
 
             # Create new aspect content
             new_aspect_content = {
@@ -402,14 +416,13 @@ class DataplexOperations:
 
             # Create the aspect
             new_aspect = dataplex_v1.Aspect()
-            new_aspect.aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_name = f"""{self._client._project_id}.global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}"""
+            new_aspect.aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{ASPECT_TEMPLATE_NAME}"""
+            aspect_name = f"""{self._client._project_id}.global.{ASPECT_TEMPLATE_NAME}@Schema.{column_name}"""
             aspect_types = [new_aspect.aspect_type]
 
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
 
             entry = dataplex_v1.Entry()
-            entry.name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            entry.name = self._build_entry_name(table_fqn)
 
             # Check if the aspect already exists
             try:
@@ -423,17 +436,18 @@ class DataplexOperations:
             data_struct.update(new_aspect_content)
             new_aspect.data = data_struct
 
-            for i in entry.aspects:
-                logger.info(f"""i: {i} path: "{entry.aspects[i].path}" """)
-                if i.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}""") and entry.aspects[i].path == f"Schema.{column_name}":
-                    logger.info(f"Updating aspect {i} with new values")
-                    new_aspect.data = entry.aspects[i].data
+            for aspect_key, existing_aspect in entry.aspects.items():
+                logger.info(f"""aspect_key: {aspect_key} path: "{existing_aspect.path}" """)
+                if aspect_key.endswith(f"""global.{ASPECT_TEMPLATE_NAME}@Schema.{column_name}""") and existing_aspect.path == f"Schema.{column_name}":
+                    logger.info(f"Updating aspect {aspect_key} with new values")
+                    new_aspect.data = existing_aspect.data
                     new_aspect.data.update({
                         "contents": description,
                         "generation-date": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
                         "to-be-regenerated": "false",
                         "is-accepted": "false"
                     })
+                    break
 
             new_entry = dataplex_v1.Entry()
             new_entry.name = entry.name
@@ -442,7 +456,7 @@ class DataplexOperations:
             # Initialize request argument(s)  
             request = dataplex_v1.UpdateEntryRequest(
                 entry=new_entry,
-                update_mask=field_mask_pb2.FieldMask(paths=["aspects"]), 
+                update_mask=_ASPECTS_FIELD_MASK, 
                 allow_missing=False,
                 aspect_keys=[aspect_name]
             )
@@ -470,12 +484,11 @@ class DataplexOperations:
             bool: True if the table should be regenerated
         """
         try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
+            client = self._client._catalog_client
 
             entry = dataplex_v1.Entry()
-            entry.name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_types = [f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""]
+            entry.name = self._build_entry_name(table_fqn)
+            aspect_types = [f"""projects/{self._client._project_id}/locations/global/aspectTypes/{ASPECT_TEMPLATE_NAME}"""]
 
             try:
                 get_request = dataplex_v1.GetEntryRequest(name=entry.name, view=dataplex_v1.EntryView.CUSTOM, aspect_types=aspect_types)
@@ -484,9 +497,9 @@ class DataplexOperations:
                 logger.error(f"Exception: {e}.")
                 raise e
 
-            for i in entry.aspects:
-                if i.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") and entry.aspects[i].path == "":
-                    data_dict = entry.aspects[i].data
+            for aspect_key, existing_aspect in entry.aspects.items():
+                if aspect_key.endswith(f"""global.{ASPECT_TEMPLATE_NAME}""") and existing_aspect.path == "":
+                    data_dict = existing_aspect.data
                     return data_dict["to-be-regenerated"] == True
 
             return False
@@ -506,12 +519,11 @@ class DataplexOperations:
             bool: True if the column should be regenerated
         """
         try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
+            client = self._client._catalog_client
 
             entry = dataplex_v1.Entry()
-            entry.name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_types = [f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""]
+            entry.name = self._build_entry_name(table_fqn)
+            aspect_types = [f"""projects/{self._client._project_id}/locations/global/aspectTypes/{ASPECT_TEMPLATE_NAME}"""]
 
             try:
                 get_request = dataplex_v1.GetEntryRequest(name=entry.name, view=dataplex_v1.EntryView.CUSTOM, aspect_types=aspect_types)
@@ -520,9 +532,9 @@ class DataplexOperations:
                 logger.error(f"Exception: {e}.")
                 raise e
 
-            for i in entry.aspects:
-                if i.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}""") and entry.aspects[i].path == f"Schema.{column_name}":
-                    data_dict = entry.aspects[i].data
+            for aspect_key, existing_aspect in entry.aspects.items():
+                if aspect_key.endswith(f"""global.{ASPECT_TEMPLATE_NAME}@Schema.{column_name}""") and existing_aspect.path == f"Schema.{column_name}":
+                    data_dict = existing_aspect.data
                     return data_dict["to-be-regenerated"] == True
 
             return False
@@ -543,24 +555,23 @@ class DataplexOperations:
             list: List of comments or specific comment if comment_number provided
         """
         try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
+            client = self._client._catalog_client
 
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
+            entry_name = self._build_entry_name(table_fqn)
+            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{ASPECT_TEMPLATE_NAME}"""
             aspect_types = [aspect_type]
 
             request = dataplex_v1.GetEntryRequest(name=entry_name, view=dataplex_v1.EntryView.CUSTOM, aspect_types=aspect_types)
             entry = client.get_entry(request=request)
 
             comments = []
-            for aspect in entry.aspects:
-                if aspect.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}""") and entry.aspects[aspect].path == f"Schema.{column_name}":
-                    if "human-comments" in entry.aspects[aspect].data:
+            for aspect_key, aspect in entry.aspects.items():
+                if aspect_key.endswith(f"""global.{ASPECT_TEMPLATE_NAME}@Schema.{column_name}""") and aspect.path == f"Schema.{column_name}":
+                    if "human-comments" in aspect.data:
                         if comment_number is None:
-                            comments.extend(entry.aspects[aspect].data["human-comments"])
+                            comments.extend(aspect.data["human-comments"])
                         else:
-                            comments.append(entry.aspects[aspect].data["human-comments"][comment_number])
+                            comments.append(aspect.data["human-comments"][comment_number])
 
             return comments
 
@@ -579,11 +590,10 @@ class DataplexOperations:
             list: List of comments or specific comment if comment_number provided
         """
         try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
+            client = self._client._catalog_client
 
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
+            entry_name = self._build_entry_name(table_fqn)
+            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{ASPECT_TEMPLATE_NAME}"""
             aspect_types = [aspect_type]
 
             request = dataplex_v1.GetEntryRequest(name=entry_name, view=dataplex_v1.EntryView.CUSTOM, aspect_types=aspect_types)
@@ -591,7 +601,7 @@ class DataplexOperations:
 
             comments = []
             for aspect_key, aspect in entry.aspects.items():
-                if aspect_key.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") and aspect.path == "":
+                if aspect_key.endswith(f"""global.{ASPECT_TEMPLATE_NAME}""") and aspect.path == "":
                     if "human-comments" in aspect.data:
                         if comment_number is None:
                             comments.extend(aspect.data["human-comments"])
@@ -607,6 +617,9 @@ class DataplexOperations:
     def _get_dataset_location(self, table_fqn):
         """Gets the location of a dataset.
 
+        Locations are memoized per dataset, as they never change and every
+        entry name of a table depends on one.
+
         Args:
             table_fqn (str): The fully qualified name of the table
 
@@ -615,13 +628,30 @@ class DataplexOperations:
         """
         try:
             project_id, dataset_id, _ = self._client._utils.split_table_fqn(table_fqn)
-            return str(self._client._cloud_clients[constants["CLIENTS"]["BIGQUERY"]].get_dataset(
-                f"{project_id}.{dataset_id}"
-            ).location).lower()
+            dataset_fqn = f"{project_id}.{dataset_id}"
+            location = self._dataset_locations.get(dataset_fqn)
+            if location is None:
+                location = str(self._client._bigquery_client.get_dataset(
+                    dataset_fqn
+                ).location).lower()
+                self._dataset_locations[dataset_fqn] = location
+            return location
         except Exception as e:
             logger.error(f"Exception: {e}.")
             raise e
 
+    def _build_entry_name(self, table_fqn):
+        """Builds the Dataplex entry name of a BigQuery table.
+
+        Args:
+            table_fqn (str): The fully qualified name of the table
+
+        Returns:
+            str: The full resource name of the table entry
+        """
+        project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
+        return f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+
     def accept_column_draft_description(self, table_fqn, column_name):
         """Accepts the draft description for a column by:
            1. Reading the draft description from the custom review aspect.
@@ -640,14 +670,13 @@ class DataplexOperations:
         """
         try:
             logger.info(f"=== START: accept_column_draft_description for {table_fqn}.{column_name} ===")
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
+            client = self._client._catalog_client
             
-            aspect_type_id = constants["ASPECT_TEMPLATE"]["name"]
+            aspect_type_id = ASPECT_TEMPLATE_NAME
             aspect_type = f"projects/{self._client._project_id}/locations/global/aspectTypes/{aspect_type_id}"
             # Correct aspect name pattern for column aspects
             short_aspect_name_key = f"{aspect_type_id}@Schema.{column_name}"
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            entry_name = self._build_entry_name(table_fqn)
 
             # 1. Get the current entry with the specific aspect type
             try:
@@ -671,8 +700,8 @@ class DataplexOperations:
             current_aspect_data = None
 
             new_aspect = dataplex_v1.Aspect()
-            new_aspect.aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_name = f"""{self._client._project_id}.global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}"""
+            new_aspect.aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{ASPECT_TEMPLATE_NAME}"""
+            aspect_name = f"""{self._client._project_id}.global.{ASPECT_TEMPLATE_NAME}@Schema.{column_name}"""
             aspect_types=[new_aspect.aspect_type]
 
 
@@ -710,7 +739,7 @@ class DataplexOperations:
             
             request = dataplex_v1.UpdateEntryRequest(
                 entry=new_entry,
-                update_mask = field_mask_pb2.FieldMask(paths=["aspects"]), # Try updating the whole aspects field,
+                update_mask = _ASPECTS_FIELD_MASK, # Try updating the whole aspects field,
                 allow_missing=False, # We confirmed the aspect exists
                 aspect_keys=[aspect_name] # Specify exactly which aspect key to update
             )
@@ -756,9 +785,8 @@ class DataplexOperations:
             Exception: If there is an error constructing the resource string
         """
         try:
-            # Assumes _split_table_fqn is available via self._client._utils
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-            return f"//bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            # Both the split and the resource string are memoized per table
+            return _bq_resource_string(*self._client._utils.split_table_fqn(table_fqn))
         except Exception as e:
             logger.error(f"Exception constructing BQ resource string: {e}.")
             raise e
@@ -778,7 +806,7 @@ class DataplexOperations:
         """
         try:
             # Assumes DATAPLEX_DATA_SCAN client is available
-            scan_client = self._client._cloud_clients.get(constants["CLIENTS"]["DATAPLEX_DATA_SCAN"])
+            scan_client = self._client._data_scan_client
             if not scan_client:
                  logger.error("Dataplex Data Scan client not initialized.")
                  return []
@@ -797,9 +825,7 @@ class DataplexOperations:
             
             # Ensure the parent exists or handle potential errors during list_data_scans
             try:
-                 data_scans = scan_client.list_data_scans(
-                     parent=parent_resource
-                 )
+                 data_scan_index = self._get_data_scan_index(scan_client, parent_resource)
             except google.api_core.exceptions.NotFound:
                  logger.warning(f"Parent resource for data scans not found: {parent_resource}")
                  return []
@@ -809,13 +835,8 @@ class DataplexOperations:
 
             bq_resource_string = self._construct_bq_resource_string(table_fqn)
             logger.info(f"Looking for scans matching resource: {bq_resource_string}")
-            scan_references = []
-            count = 0
-            for scan in data_scans:
-                count += 1
-                if hasattr(scan, 'data') and hasattr(scan.data, 'resource') and scan.data.resource == bq_resource_string:
-                    logger.info(f"Found matching scan: {scan.name}")
-                    scan_references.append(scan.name)
+            scan_references = list(data_scan_index.get(bq_resource_string, []))
+            count = sum(len(names) for names in data_scan_index.values())
             logger.info(f"Checked {count} scans. Found {len(scan_references)} matching references.")
             return scan_references
         except Exception as e:
@@ -823,6 +844,43 @@ class DataplexOperations:
             # Return empty list instead of raising exception to allow the process to continue
             return []
 
+    def _get_data_scan_index(self, scan_client, parent_resource):
+        """Lists the data scans of a location, grouped by the resource they scan.
+
+        The listing is kept for a few minutes, so generating a whole dataset
+        lists the scans once instead of once per table.
+
+        Args:
+            scan_client: The Dataplex data scan client
+            parent_resource (str): The location to list the scans of
+
+        Returns:
+            dict: Scan names keyed by the scanned resource
+
+        Raises:
+            Exception: If there is an error listing the data scans
+        """
+        with self._data_scan_indexes_lock:
+            cached = self._data_scan_indexes.get(parent_resource)
+        if cached is not None and time.monotonic() - cached[0] < _DATA_SCAN_INDEX_TTL_SECONDS:
+            return cached[1]
+
+        data_scan_index = {}
+        for scan in scan_client.list_data_scans(parent=parent_resource):
+            data_scan_index.setdefault(scan.data.resource, []).append(scan.name)
+        with self._data_scan_indexes_lock:
+            self._data_scan_indexes[parent_resource] = (time.monotonic(), data_scan_index)
+        return data_scan_index
+
+    def refresh_data_scans(self):
+        """Drops the cached data scan listings.
+
+        Scans created or deleted since the last listing are picked up by the
+        next table instead of after the listing expires.
+        """
+        with self._data_scan_indexes_lock:
+            self._data_scan_indexes.clear()
+
     def get_table_profile(self, use_enabled, table_fqn):
         """Retrieves the profile information for a BigQuery table.
 
@@ -893,40 +951,42 @@ class DataplexOperations:
         """
         try:
             if use_enabled:
-                scan_client = self._client._cloud_clients[
-                    constants["CLIENTS"]["DATAPLEX_DATA_SCAN"]
-                ]
+                scan_client = self._client._data_scan_client
                 data_profile_results = []
                 data_quality_results = []
-                table_scan_references = self._get_table_scan_reference(table_fqn)
-                for table_scan_reference in table_scan_references:
-                    if table_scan_reference:
-                        for job in scan_client.list_data_scan_jobs(
-                            ListDataScanJobsRequest(
-                                parent=scan_client.get_data_scan(
-                                    GetDataScanRequest(name=table_scan_reference)
-                                ).name
-                            )
-                        ):
-                            job_result = scan_client.get_data_scan_job(
-                                request=GetDataScanJobRequest(
-                                    name=job.name, view="FULL"
+                table_scan_references = [
+                    reference
+                    for reference in self._get_table_scan_reference(table_fqn)
+                    if reference
+                ]
+                if table_scan_references:
+                    # Scans are independent, so their latest jobs are fetched
+                    # concurrently on the client's shared lookup pool
+                    job_results = list(
+                        self._client._lookup_executor.map(
+                            lambda reference: self._get_latest_scan_job_result(scan_client, reference),
+                            table_scan_references,
+                        )
+                    )
+                    for job_result in job_results:
+                        if job_result is None:
+                            continue
+                        # Convert only the result that is set, with the same
+                        # camelCase keys the whole job JSON used to have
+                        if "data_quality_result" in job_result:
+                            data_quality_results.append(
+                                dataplex_v1.DataQualityResult.to_dict(
+                                    job_result.data_quality_result,
+                                    preserving_proto_field_name=False,
                                 )
                             )
-                            if job_result.state == DataScanJob.State.SUCCEEDED:
-                                job_result_json = json.loads(
-                                    dataplex_v1.types.datascans.DataScanJob.to_json(
-                                        job_result
-                                    )
+                        if "data_profile_result" in job_result:
+                            data_profile_results.append(
+                                dataplex_v1.DataProfileResult.to_dict(
+                                    job_result.data_profile_result,
+                                    preserving_proto_field_name=False,
                                 )
-                                if "dataQualityResult" in job_result_json:
-                                    data_quality_results.append(
-                                        job_result_json["dataQualityResult"]
-                                    )
-                                if "dataProfileResult" in job_result_json:
-                                    data_profile_results.append(
-                                        job_result_json["dataProfileResult"]
-                                    )
+                            )
                 return {
                     "data_profile": data_profile_results,
                     "data_quality": data_quality_results,
@@ -940,6 +1000,28 @@ class DataplexOperations:
             logger.error(f"Exception: {e}.")
             raise e
 
+    def _get_latest_scan_job_result(self, scan_client, scan_name):
+        """Gets the full result of the latest successful job of a data scan.
+
+        Jobs are listed newest first in the basic view, which carries the
+        state, so only the job that is used is fetched with its results.
+
+        Args:
+            scan_client: The Dataplex data scan client
+            scan_name (str): The resource name of the data scan
+
+        Returns:
+            DataScanJob: The job with its results, or None if no job succeeded
+        """
+        for job in scan_client.list_data_scan_jobs(
+            ListDataScanJobsRequest(parent=scan_name)
+        ):
+            if job.state == DataScanJob.State.SUCCEEDED:
+                return scan_client.get_data_scan_job(
+                    request=GetDataScanJobRequest(name=job.name, view="FULL")
+                )
+        return None
+
     def get_table_sources_info(self, use_lineage_tables, table_fqn):
         """Gets source table information using Data Catalog Lineage API.
 
@@ -956,19 +1038,26 @@ class DataplexOperations:
 
         try:
             table_sources_info = []
-            # Assumes a _get_table_sources method exists or is added, similar to the backup
-            table_sources = self._get_table_sources(table_fqn) 
-            for table_source in table_sources:
-                # Assumes these helper methods exist on the BigQueryOperations part of the client
-                source_schema, _ = self._client._bigquery_ops.get_table_schema(table_source) 
-                source_description = self._client._bigquery_ops.get_table_description(table_source)
-                table_sources_info.append(
-                    {
-                        "source_table_name": table_source,
-                        "source_table_schema": source_schema,
-                        "source_table_description": source_description,
-                    }
-                )
+            table_sources = self._get_table_sources(table_fqn)
+            if table_sources:
+                bigquery_ops = self._client._bigquery_ops
+                # Sources are fetched concurrently on the client's shared lookup
+                # pool, one table read each; the description is then served
+                # from the table cache
+                executor = self._client._lookup_executor
+                futures = [
+                    (table_source, executor.submit(bigquery_ops.get_table_schema, table_source))
+                    for table_source in table_sources
+                ]
+                for table_source, schema_future in futures:
+                    source_schema, _ = schema_future.result()
+                    table_sources_info.append(
+                        {
+                            "source_table_name": table_source,
+                            "source_table_schema": source_schema,
+                            "source_table_description": bigquery_ops.get_table_description(table_source),
+                        }
+                    )
             # Check if the option should be disabled if no info was found
             if not table_sources_info:
                 logger.warning(f"No lineage source table info found for {table_fqn}, disabling option for subsequent prompts if applicable.")
@@ -989,7 +1078,7 @@ class DataplexOperations:
             list: A list of fully qualified names of source tables.
         """
         try:
-            lineage_client = self._client._cloud_clients[constants["CLIENTS"]["DATA_CATALOG_LINEAGE"]]
+            lineage_client = self._client._lineage_client
             target = datacatalog_lineage_v1.EntityReference()
             target.fully_qualified_name = f"bigquery:{table_fqn}"
             target_dataset_location = str(self._get_dataset_location(table_fqn)).lower()
@@ -1007,7 +1096,7 @@ class DataplexOperations:
                 if link.target == target:
                     source_fqn = link.source.fully_qualified_name
                     if source_fqn.startswith("bigquery:"):
-                         table_sources.append(source_fqn.replace("bigquery:", ""))
+                         table_sources.append(source_fqn.removeprefix("bigquery:"))
                     else:
                         logger.debug(f"Skipping non-BigQuery source: {source_fqn}")
 
@@ -1037,7 +1126,7 @@ class DataplexOperations:
 
         try:
             bq_process_sql = []
-            lineage_client = self._client._cloud_clients[constants["CLIENTS"]["DATA_CATALOG_LINEAGE"]]
+            lineage_client = self._client._lineage_client
             target = datacatalog_lineage_v1.EntityReference()
             target.fully_qualified_name = f"bigquery:{table_fqn}"
             dataset_location = self._get_dataset_location(table_fqn)
@@ -1057,8 +1146,8 @@ class DataplexOperations:
                 logger.error(f"Cannot find lineage links for table {table_fqn}: {e}")
                 return [] # Return empty list on error
 
-            # Ensure link_results.links exists and is iterable
-            links = [link.name for link in link_results] # Access links via the response object directly
+            # The pager is consumed once, fetching every page a single time
+            links = [link.name for link in link_results]
 
             if links:
                 logger.info(f"Found {len(links)} lineage links for {table_fqn}. Searching for processes.")
@@ -1070,28 +1159,30 @@ class DataplexOperations:
                     )
                 )
                 
-                lineage_processes_ids = [process.process for process in process_links]
+                # Several links usually belong to the same process
+                lineage_processes_ids = list(dict.fromkeys(process.process for process in process_links))
                 logger.info(f"Found {len(lineage_processes_ids)} associated processes.")
 
-                for process_id in lineage_processes_ids:
+                def get_process_query(process_id):
                     try:
-                        process_details = lineage_client.get_process(
-                            request=datacatalog_lineage_v1.GetProcessRequest(
-                                name=process_id,
-                            )
-                        )
-                        # Check if 'attributes' exists and contains 'bigquery_job_id'
-                        if hasattr(process_details, 'attributes') and "bigquery_job_id" in process_details.attributes:
-                            bq_job_id = process_details.attributes["bigquery_job_id"]
-                            logger.info(f"Found BigQuery Job ID {bq_job_id} for process {process_id}")
-                            # Assumes a helper method exists on BigQueryOperations
-                            job_query = self._client._bigquery_ops.get_job_query(bq_job_id, dataset_location)
-                            if job_query:
-                                bq_process_sql.append(job_query)
-                        else:
-                            logger.debug(f"Process {process_id} does not have a 'bigquery_job_id' attribute.")
+                        bq_job_id = self._get_process_bigquery_job_id(lineage_client, process_id)
+                        if bq_job_id is not None:
+                            return self._client._bigquery_ops.get_job_query(bq_job_id, dataset_location)
+                        logger.debug(f"Process {process_id} does not have a 'bigquery_job_id' attribute.")
                     except Exception as e:
                          logger.error(f"Error getting details for process {process_id}: {e}")
+                    return None
+
+                if lineage_processes_ids:
+                    # Each process costs a lineage and a BigQuery round-trip, resolve
+                    # them concurrently on the client's shared lookup pool
+                    bq_process_sql = [
+                        job_query
+                        for job_query in self._client._lookup_executor.map(
+                            get_process_query, lineage_processes_ids
+                        )
+                        if job_query
+                    ]
 
                 # Check if the option should be disabled if no info was found
                 if not bq_process_sql:
@@ -1106,6 +1197,37 @@ class DataplexOperations:
             logger.error(f"Exception getting job sources for {table_fqn}: {e}")
             return [] # Return empty list on error
 
+    def _get_process_bigquery_job_id(self, lineage_client, process_id):
+        """Gets the BigQuery job a lineage process was recorded for.
+
+        Processes are shared by the tables a job writes and do not change, so
+        each one is read once per client.
+
+        Args:
+            lineage_client: The Data Catalog lineage client
+            process_id (str): The resource name of the lineage process
+
+        Returns:
+            str: The BigQuery job ID, or None if the process is not a BigQuery job
+        """
+        with self._process_job_ids_lock:
+            if process_id in self._process_job_ids:
+                return self._process_job_ids[process_id]
+        process_details = lineage_client.get_process(
+            request=datacatalog_lineage_v1.GetProcessRequest(
+                name=process_id,
+            )
+        )
+        # Check if 'attributes' contains 'bigquery_job_id'
+        if "bigquery_job_id" in process_details.attributes:
+            bq_job_id = process_details.attributes["bigquery_job_id"]
+            logger.info(f"Found BigQuery Job ID {bq_job_id} for process {process_id}")
+        else:
+            bq_job_id = None
+        with self._process_job_ids_lock:
+            self._process_job_ids[process_id] = bq_job_id
+        return bq_job_id
+
     def mark_table_for_regeneration(self, table_fqn: str) -> bool:
         """Marks a table for regeneration by setting the to-be-regenerated flag in its metadata.
 
@@ -1119,13 +1241,12 @@ class DataplexOperations:
             Exception: If there is an error updating the table metadata in Dataplex
         """
         try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
+            client = self._client._catalog_client
 
             # Create entry name
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_name = f"""{self._client._project_id}.global.{constants["ASPECT_TEMPLATE"]["name"]}"""
+            entry_name = self._build_entry_name(table_fqn)
+            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{ASPECT_TEMPLATE_NAME}"""
+            aspect_name = f"""{self._client._project_id}.global.{ASPECT_TEMPLATE_NAME}"""
             aspect_types = [aspect_type]
 
             # Get existing entry with aspects
@@ -1141,10 +1262,10 @@ class DataplexOperations:
             new_aspect.aspect_type = aspect_type
 
             # Update or create aspect data
-            for i in entry.aspects:
-                if i.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") and entry.aspects[i].path=="":
-                    logger.info(f"Updating existing aspect {i}")
-                    new_aspect.data = entry.aspects[i].data
+            for aspect_key, existing_aspect in entry.aspects.items():
+                if aspect_key.endswith(f"""global.{ASPECT_TEMPLATE_NAME}""") and existing_aspect.path=="":
+                    logger.info(f"Updating existing aspect {aspect_key}")
+                    new_aspect.data = existing_aspect.data
                     new_aspect.data.update({
                         "generation-date": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
                         "to-be-regenerated": True
@@ -1174,7 +1295,7 @@ class DataplexOperations:
             # Update entry
             request = dataplex_v1.UpdateEntryRequest(
                 entry=new_entry,
-                update_mask=field_mask_pb2.FieldMask(paths=["aspects"]),
+                update_mask=_ASPECTS_FIELD_MASK,
                 allow_missing=False,
                 aspect_keys=[aspect_name]
             )
@@ -1201,13 +1322,12 @@ class DataplexOperations:
             Exception: If there is an error updating the table metadata in Dataplex
         """
         try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
+            client = self._client._catalog_client
 
             # Create entry name
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_name = f"""{self._client._project_id}.global.{constants["ASPECT_TEMPLATE"]["name"]}"""
+            entry_name = self._build_entry_name(table_fqn)
+            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{ASPECT_TEMPLATE_NAME}"""
+            aspect_name = f"""{self._client._project_id}.global.{ASPECT_TEMPLATE_NAME}"""
             aspect_types = [aspect_type]
 
             # Get existing entry with aspects
@@ -1223,10 +1343,10 @@ class DataplexOperations:
             new_aspect.aspect_type = aspect_type
 
             # Update or create aspect data
-            for i in entry.aspects:
-                if i.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") and entry.aspects[i].path=="":
-                    logger.info(f"Updating existing aspect {i}")
-                    new_aspect.data = entry.aspects[i].data
+            for aspect_key, existing_aspect in entry.aspects.items():
+                if aspect_key.endswith(f"""global.{ASPECT_TEMPLATE_NAME}""") and existing_aspect.path=="":
+                    logger.info(f"Updating existing aspect {aspect_key}")
+                    new_aspect.data = existing_aspect.data
                     new_aspect.data.update({
                         "generation-date": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
                         "to-be-regenerated": False
@@ -1256,7 +1376,7 @@ class DataplexOperations:
             # Update entry
             request = dataplex_v1.UpdateEntryRequest(
                 entry=new_entry,
-                update_mask=field_mask_pb2.FieldMask(paths=["aspects"]),
+                update_mask=_ASPECTS_FIELD_MASK,
                 allow_missing=False,
                 aspect_keys=[aspect_name]
             )
@@ -1284,13 +1404,12 @@ class DataplexOperations:
             Exception: If there is an error updating the column metadata in Dataplex
         """
         try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
+            client = self._client._catalog_client
 
             # Create entry name
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_name = f"""{self._client._project_id}.global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}"""
+            entry_name = self._build_entry_name(table_fqn)
+            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{ASPECT_TEMPLATE_NAME}"""
+            aspect_name = f"""{self._client._project_id}.global.{ASPECT_TEMPLATE_NAME}@Schema.{column_name}"""
             aspect_types = [aspect_type]
 
             # Get existing entry
@@ -1307,10 +1426,10 @@ class DataplexOperations:
             new_aspect.path = f"Schema.{column_name}"
 
             # Update or create aspect data
-            for i in entry.aspects:
-                if i.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}""") and entry.aspects[i].path == f"Schema.{column_name}":
-                    logger.info(f"Updating existing aspect {i}")
-                    new_aspect.data = entry.aspects[i].data
+            for aspect_key, existing_aspect in entry.aspects.items():
+                if aspect_key.endswith(f"""global.{ASPECT_TEMPLATE_NAME}@Schema.{column_name}""") and existing_aspect.path == f"Schema.{column_name}":
+                    logger.info(f"Updating existing aspect {aspect_key}")
+                    new_aspect.data = existing_aspect.data
                     new_aspect.data.update({
                         "generation-date": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
                         "to-be-regenerated": True
@@ -1340,7 +1459,7 @@ class DataplexOperations:
             # Update entry
             request = dataplex_v1.UpdateEntryRequest(
                 entry=new_entry,
-                update_mask=field_mask_pb2.FieldMask(paths=["aspects"]),
+                update_mask=_ASPECTS_FIELD_MASK,
                 allow_missing=False,
                 aspect_keys=[aspect_name]
             )
@@ -1368,13 +1487,12 @@ class DataplexOperations:
             Exception: If there is an error updating the column metadata in Dataplex
         """
         try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
+            client = self._client._catalog_client
 
             # Create entry name
-            entry_name = f"projects/{project_id}/locations/{self._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_name = f"""{self._client._project_id}.global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}"""
+            entry_name = self._build_entry_name(table_fqn)
+            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{ASPECT_TEMPLATE_NAME}"""
+            aspect_name = f"""{self._client._project_id}.global.{ASPECT_TEMPLATE_NAME}@Schema.{column_name}"""
             aspect_types = [aspect_type]
 
             # Get existing entry
@@ -1391,10 +1509,10 @@ class DataplexOperations:
             new_aspect.path = f"Schema.{column_name}"
 
             # Update or create aspect data
-            for i in entry.aspects:
-                if i.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}""") and entry.aspects[i].path == f"Schema.{column_name}":
-                    logger.info(f"Updating existing aspect {i}")
-                    new_aspect.data = entry.aspects[i].data
+            for aspect_key, existing_aspect in entry.aspects.items():
+                if aspect_key.endswith(f"""global.{ASPECT_TEMPLATE_NAME}@Schema.{column_name}""") and existing_aspect.path == f"Schema.{column_name}":
+                    logger.info(f"Updating existing aspect {aspect_key}")
+                    new_aspect.data = existing_aspect.data
                     new_aspect.data.update({
                         "generation-date": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
                         "to-be-regenerated": False
@@ -1424,7 +1542,7 @@ class DataplexOperations:
             # Update entry
             request = dataplex_v1.UpdateEntryRequest(
                 entry=new_entry,
-                update_mask=field_mask_pb2.FieldMask(paths=["aspects"]),
+                update_mask=_ASPECTS_FIELD_MASK,
                 allow_missing=False,
                 aspect_keys=[aspect_name]
             )
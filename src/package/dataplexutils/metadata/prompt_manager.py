@@ -16,17 +16,74 @@ limitations under the License.
 
 from enum import Enum
 import logging
-import toml
-import pkgutil
+import string
 
 # Load constants from constants.toml located in the same package
-constants = toml.loads(pkgutil.get_data(__package__, "constants.toml").decode())
+from ._constants import constants
 
 logger = logging.getLogger(constants["LOGGING"]["WIZARD_LOGGER"])
 
 class PromtType(Enum):
     PROMPT_TYPE_TABLE = 0
     PROMPT_TYPE_COLUMN = 1
+    PROMPT_TYPE_COLUMN_BATCH = 2
+
+def _prompt_options_key(client_options):
+    """Returns the client options that change the prompt text, as a hashable tuple."""
+    return (
+        client_options._use_profile,
+        client_options._use_data_quality,
+        client_options._use_lineage_tables,
+        client_options._use_lineage_processes,
+        client_options._use_ext_documents,
+        client_options._use_human_comments,
+        client_options._top_values_in_description,
+    )
+
+
+# Built prompt templates, keyed on the prompt type and the options that change
+# their text. There are only a few such combinations, so this stays small
+_prompt_templates = {}
+
+# Prompt templates split into literal text and field names, keyed on the template
+_parsed_templates = {}
+
+
+def _parse_template(template):
+    """Splits a prompt template into (literal text, field name) pairs."""
+    parsed = _parsed_templates.get(template)
+    if parsed is None:
+        parsed = []
+        for literal_text, field_name, format_spec, conversion in string.Formatter().parse(template):
+            if format_spec or conversion or (field_name is not None and not field_name.isidentifier()):
+                # Only plain {name} fields are pre-parsed
+                parsed = None
+                break
+            parsed.append((literal_text, field_name))
+        _parsed_templates[template] = parsed
+    return parsed
+
+
+def format_prompt(template, **values):
+    """Fills a prompt template like str.format, without parsing it again on every call.
+
+    Args:
+        template (str): The prompt template, with plain {name} fields
+        **values: The values of the template fields
+
+    Returns:
+        str: The expanded prompt
+    """
+    parsed = _parse_template(template)
+    if parsed is None:
+        return template.format(**values)
+    chunks = []
+    for literal_text, field_name in parsed:
+        chunks.append(literal_text)
+        if field_name is not None:
+            chunks.append(format(values[field_name]))
+    return "".join(chunks)
+
 
 class PromptManager:
     """Represents a prompt manager."""
@@ -35,11 +92,21 @@ class PromptManager:
         self._client_options = client_options
 
     def get_promtp(self):
+        key = (self._prompt_type, _prompt_options_key(self._client_options))
+        prompt = _prompt_templates.get(key)
+        if prompt is None:
+            prompt = self._build_prompt()
+            _prompt_templates[key] = prompt
+        return prompt
+
+    def _build_prompt(self):
         try:
             if self._prompt_type == PromtType.PROMPT_TYPE_TABLE:
                 return self._get_prompt_table()
             elif self._prompt_type == PromtType.PROMPT_TYPE_COLUMN:
                 return self._get_prompt_columns()
+            elif self._prompt_type == PromtType.PROMPT_TYPE_COLUMN_BATCH:
+                return self._get_prompt_columns_batch()
             else:
                 return None
         except Exception as e:
@@ -49,63 +116,35 @@ class PromptManager:
     def _get_prompt_table(self):
         try:
             # System
-            table_description_prompt = constants["PROMPTS"]["SYSTEM_PROMPT"]
+            parts = [constants["PROMPTS"]["SYSTEM_PROMPT"]]
             # Base
-            table_description_prompt = (
-                table_description_prompt
-                + constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_BASE"]
-            )
+            parts.append(constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_BASE"])
             # Additional metadata information
             if self._client_options._use_profile:
-                table_description_prompt = (
-                    table_description_prompt
-                    + constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_PROFILE"]
-                )
+                parts.append(constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_PROFILE"])
             if self._client_options._use_data_quality:
-                table_description_prompt = (
-                    table_description_prompt
-                    + constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_QUALITY"]
-                )
+                parts.append(constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_QUALITY"])
             if self._client_options._use_lineage_tables:
-                table_description_prompt = (
-                    table_description_prompt
-                    + constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_LINEAGE_TABLES"]
-                )
+                parts.append(constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_LINEAGE_TABLES"])
             if self._client_options._use_lineage_processes:
-                table_description_prompt = (
-                    table_description_prompt
-                    + constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_LINEAGE_PROCESSES"]
-                )
+                parts.append(constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_LINEAGE_PROCESSES"])
             if self._client_options._use_ext_documents:
-                table_description_prompt = (
-                    table_description_prompt
-                    + constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_DOCUMENT"]
-                )
+                parts.append(constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_DOCUMENT"])
 
             if self._client_options._use_human_comments:
-                table_description_prompt = (
-                    table_description_prompt
-                    + constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_HUMAN_COMMENTS"]
-                )
+                parts.append(constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_HUMAN_COMMENTS"])
             # Generation base
-            table_description_prompt = (
-                table_description_prompt
-                + constants["PROMPTS"]["TABLE_DESCRIPTION_GENERATION_BASE"]
-            )
+            parts.append(constants["PROMPTS"]["TABLE_DESCRIPTION_GENERATION_BASE"])
             # Generation with additional information
             if (
                 self._client_options._use_lineage_tables
                 or self._client_options._use_lineage_processes
             ):
-                table_description_prompt = (
-                    table_description_prompt
-                    + constants["PROMPTS"]["TABLE_DESCRIPTION_GENERATION_LINEAGE"]
-                )
+                parts.append(constants["PROMPTS"]["TABLE_DESCRIPTION_GENERATION_LINEAGE"])
             # Output format
-            table_description_prompt = (
-                table_description_prompt + constants["PROMPTS"]["OUTPUT_FORMAT_PROMPT"]
-            )
+            parts.append(constants["PROMPTS"]["OUTPUT_FORMAT_PROMPT"])
 
+            table_description_prompt = "".join(parts)
             logger.info(f"Table description prompt: {table_description_prompt}")
             return table_description_prompt
         except Exception as e:
@@ -115,51 +154,58 @@ class PromptManager:
     def _get_prompt_columns(self):
         try:
             # System
-            column_description_prompt = constants["PROMPTS"]["SYSTEM_PROMPT"]
+            parts = [constants["PROMPTS"]["SYSTEM_PROMPT"]]
             # Base
             if self._client_options._top_values_in_description == True:
-                column_description_prompt = (
-                    column_description_prompt
-                    + constants["PROMPTS"]["COLUMN_DESCRIPTION_PROMPT_BASE_WITH_EXAMPLES"]
-                )
+                parts.append(constants["PROMPTS"]["COLUMN_DESCRIPTION_PROMPT_BASE_WITH_EXAMPLES"])
             else:
-                column_description_prompt = (
-                    column_description_prompt
-                    + constants["PROMPTS"]["COLUMN_DESCRIPTION_PROMPT_BASE"]
-                )
+                parts.append(constants["PROMPTS"]["COLUMN_DESCRIPTION_PROMPT_BASE"])
                 
             # Additional metadata information
             if self._client_options._use_profile:
-                column_description_prompt = (
-                    column_description_prompt
-                    + constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_PROFILE"]
-                )
+                parts.append(constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_PROFILE"])
             if self._client_options._use_data_quality:
-                column_description_prompt = (
-                    column_description_prompt
-                    + constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_QUALITY"]
-                )
+                parts.append(constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_QUALITY"])
             if self._client_options._use_lineage_tables:
-                column_description_prompt = (
-                    column_description_prompt
-                    + constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_LINEAGE_TABLES"]
-                )
+                parts.append(constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_LINEAGE_TABLES"])
             if self._client_options._use_lineage_processes:
-                column_description_prompt = (
-                    column_description_prompt
-                    + constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_LINEAGE_PROCESSES"]
-                )
+                parts.append(constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_LINEAGE_PROCESSES"])
             if self._client_options._use_human_comments:
-                column_description_prompt = (
-                    column_description_prompt
-                    + constants["PROMPTS"]["COLUMN_DESCRIPTION_PROMPT_HUMAN_COMMENTS"]
-                )
+                parts.append(constants["PROMPTS"]["COLUMN_DESCRIPTION_PROMPT_HUMAN_COMMENTS"])
             # Output format
-            column_description_prompt = (
-                column_description_prompt + constants["PROMPTS"]["OUTPUT_FORMAT_PROMPT"]
-            )
+            parts.append(constants["PROMPTS"]["OUTPUT_FORMAT_PROMPT"])
+            column_description_prompt = "".join(parts)
             logger.info(f"Column description prompt: {column_description_prompt}")
             return column_description_prompt
         except Exception as e:
             logger.error(f"Exception: {e}.")
-            raise e 
\ No newline at end of file
+            raise e
+
+    def _get_prompt_columns_batch(self):
+        try:
+            # System
+            parts = [constants["PROMPTS"]["SYSTEM_PROMPT"]]
+            # Base
+            if self._client_options._top_values_in_description == True:
+                parts.append(constants["PROMPTS"]["COLUMN_DESCRIPTION_PROMPT_BATCH_BASE_WITH_TOP_VALUES"])
+            else:
+                parts.append(constants["PROMPTS"]["COLUMN_DESCRIPTION_PROMPT_BATCH_BASE"])
+            # Additional metadata information
+            if self._client_options._use_profile:
+                parts.append(constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_PROFILE"])
+            if self._client_options._use_data_quality:
+                parts.append(constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_QUALITY"])
+            if self._client_options._use_lineage_tables:
+                parts.append(constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_LINEAGE_TABLES"])
+            if self._client_options._use_lineage_processes:
+                parts.append(constants["PROMPTS"]["TABLE_DESCRIPTION_PROMPT_LINEAGE_PROCESSES"])
+            if self._client_options._use_human_comments:
+                parts.append(constants["PROMPTS"]["COLUMN_DESCRIPTION_PROMPT_BATCH_HUMAN_COMMENTS"])
+            # Output format
+            parts.append(constants["PROMPTS"]["COLUMN_DESCRIPTION_PROMPT_BATCH_OUTPUT_FORMAT"])
+            column_description_prompt = "".join(parts)
+            logger.info(f"Column batch description prompt: {column_description_prompt}")
+            return column_description_prompt
+        except Exception as e:
+            logger.error(f"Exception: {e}.")
+            raise e
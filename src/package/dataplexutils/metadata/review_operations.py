@@ -18,20 +18,22 @@ limitations under the License.
 """
 # Standard library imports
 import logging
-import toml
-import pkgutil
 import datetime
 import uuid
-import traceback
+import re
+import time
+import threading
+import itertools
+import collections
+import concurrent.futures
 
 # Cloud imports
 from google.cloud import dataplex_v1
 from google.protobuf import field_mask_pb2, struct_pb2
 import google.api_core.exceptions
-from google.protobuf.json_format import MessageToDict
 
 # Load constants
-constants = toml.loads(pkgutil.get_data(__name__, "constants.toml").decode())
+from ._constants import constants
 # Logger
 logging.basicConfig(
     level=logging.DEBUG,
@@ -40,29 +42,217 @@ logging.basicConfig(
 logger = logging.getLogger(constants["LOGGING"]["WIZARD_LOGGER"])
 logger.setLevel(logging.DEBUG)
 
+# Every entry update replaces aspects only; the request copies the mask, so one instance is shared
+_ASPECTS_FIELD_MASK = field_mask_pb2.FieldMask(paths=["aspects"])
+
+# Aspect key suffixes of the metadata wizard aspect, built once instead of per loop iteration
+_ASPECT_NAME = constants["ASPECT_TEMPLATE"]["name"]
+_TABLE_ASPECT_SUFFIX = f"global.{_ASPECT_NAME}"
+_COLUMN_ASPECT_SUFFIX_PREFIX = f"{_TABLE_ASPECT_SUFFIX}@Schema."
+# How long a fetched entry is reused, so the reads of one user action share a single GetEntry call
+_ENTRY_CACHE_TTL_SECONDS = 5
+_ENTRY_CACHE_MAX_SIZE = 1024
+# Review item IDs: 'table:{table_fqn}' or 'column:{table_fqn}:{column_name}'.
+# Table FQNs of table items may contain colons (domain-scoped projects).
+_REVIEW_ITEM_ID_RE = re.compile(
+    r"^(?:table:(?P<table_fqn>.+)|column:(?P<column_table_fqn>[^:]+):(?P<column_name>[^:]+))"
+)
+# Bulk review updates are processed in sequential batches to stay within Dataplex quotas
+_BULK_BATCH_SIZE = 100
+_BULK_MAX_WORKERS = 8
+
+# Skeleton of the aspect data of a first comment, copied instead of rebuilt on every call
+_EMPTY_COMMENTS_STRUCT = struct_pb2.Struct(
+    fields={"human-comments": struct_pb2.Value(list_value=struct_pb2.ListValue())}
+)
+
+def _new_comments_struct(comments: list) -> struct_pb2.Struct:
+    """Build aspect data holding the given human comments.
+
+    The Struct is copied from a prebuilt skeleton and the comments are
+    added to its list in place, rather than going through Struct.update,
+    which reflects over a Python dict.
+
+    Args:
+        comments (list): The comments to store
+
+    Returns:
+        Struct: Aspect data with a 'human-comments' list
+    """
+    data = struct_pb2.Struct()
+    data.CopyFrom(_EMPTY_COMMENTS_STRUCT)
+    values = data.fields["human-comments"].list_value.values
+    for comment in comments:
+        values.add().string_value = comment
+    return data
+
+def _append_comments(aspect, comments: list):
+    """Append human comments to the data of an aspect in place.
+
+    The comments are added to the underlying protobuf ListValue, so the
+    existing comment history is not copied out to a Python list and back.
+
+    Args:
+        aspect (Aspect): The aspect whose data holds the comments
+        comments (list): The comments to append
+    """
+    values = dataplex_v1.Aspect.pb(aspect).data.fields["human-comments"].list_value.values
+    for comment in comments:
+        values.add().string_value = comment
+
 class ReviewOperations:
     """Review-specific operations."""
 
     def __init__(self, client):
         """Initialize with reference to main client."""
         self._client = client
+        self._catalog_client = client._catalog_client
+        self._entry_cache = {}
+        self._entry_cache_lock = threading.Lock()
+        self._aspect_type = f"projects/{client._project_id}/locations/global/aspectTypes/{_ASPECT_NAME}"
+        self._table_aspect_name = f"{client._project_id}.{_TABLE_ASPECT_SUFFIX}"
+
+    def _entry_name_for(self, table_fqn: str) -> str:
+        """Get the Dataplex entry name of a BigQuery table.
+
+        Args:
+            table_fqn (str): The fully qualified name of the table
+
+        Returns:
+            str: The full resource name of the table entry
+        """
+        return self._client._dataplex_ops._build_entry_name(table_fqn)
+
+    def _column_aspect_name(self, column_name: str) -> str:
+        """Get the aspect key of the wizard aspect for a column.
+
+        Args:
+            column_name (str): The name of the column
+
+        Returns:
+            str: The column aspect key
+        """
+        return f"{self._table_aspect_name}@Schema.{column_name}"
+
+    def _get_entry(self, entry_name: str, aspect_type: str, path: str = None):
+        """Get a Dataplex entry restricted to the given aspect type.
+
+        Entries are cached for a few seconds so that the reads made while
+        serving a single request share one GetEntry call. The cache is
+        bounded and guarded by a lock, as the backend serves requests from
+        several threads. Writes made elsewhere do not clear the cache, so
+        read-modify-write paths call _invalidate_entry before reading.
+
+        Args:
+            entry_name (str): The full resource name of the entry
+            aspect_type (str): The aspect type to fetch with the entry
+            path (str, optional): Only fetch the aspects attached to this
+                path, e.g. 'Schema.column_name'
+
+        Returns:
+            Entry: The Dataplex entry
+        """
+        cache_key = (entry_name, aspect_type, path)
+        with self._entry_cache_lock:
+            cached = self._entry_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _ENTRY_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        client = self._catalog_client
+        request = dataplex_v1.GetEntryRequest(
+            name=entry_name,
+            view=dataplex_v1.EntryView.CUSTOM,  # IMPORTANT: Must remain CUSTOM - do not change to ALL or FULL as it breaks aspect filtering
+            aspect_types=[aspect_type],
+            paths=[path] if path is not None else None
+        )
+        entry = client.get_entry(request=request)
+        now = time.monotonic()
+        with self._entry_cache_lock:
+            if len(self._entry_cache) >= _ENTRY_CACHE_MAX_SIZE:
+                for key in [key for key, value in self._entry_cache.items()
+                            if now - value[0] >= _ENTRY_CACHE_TTL_SECONDS]:
+                    del self._entry_cache[key]
+                if len(self._entry_cache) >= _ENTRY_CACHE_MAX_SIZE:
+                    # Dicts keep insertion order, so the first key is the oldest read
+                    del self._entry_cache[next(iter(self._entry_cache))]
+            self._entry_cache[cache_key] = (now, entry)
+        return entry
+
+    def _get_entry_or_none(self, entry_name: str, aspect_type: str):
+        """Get a Dataplex entry like _get_entry, returning None if it does not exist.
+
+        Args:
+            entry_name (str): The full resource name of the entry
+            aspect_type (str): The aspect type to fetch with the entry
+
+        Returns:
+            Entry: The Dataplex entry or None if not found
+        """
+        try:
+            return self._get_entry(entry_name, aspect_type)
+        except google.api_core.exceptions.NotFound:
+            return None
+
+    def _invalidate_entry(self, entry_name: str):
+        """Drop all cached reads of an entry after it has been updated.
+
+        Args:
+            entry_name (str): The full resource name of the entry
+        """
+        with self._entry_cache_lock:
+            for cache_key in [key for key in self._entry_cache if key[0] == entry_name]:
+                del self._entry_cache[cache_key]
+
+    def _find_table_aspect(self, entry):
+        """Find the table-level metadata wizard aspect of an entry.
+
+        Args:
+            entry: The Dataplex entry containing aspects
+
+        Returns:
+            Aspect: The table-level aspect or None if not found
+        """
+        # Aspect keys are deterministic, so try the expected key first
+        aspect = entry.aspects.get(self._table_aspect_name)
+        if aspect is not None and aspect.path == "":
+            return aspect
+        for aspect_key, aspect in entry.aspects.items():
+            if aspect_key.endswith(_TABLE_ASPECT_SUFFIX) and aspect.path == "":
+                return aspect
+        return None
+
+    def _index_column_aspects(self, entry) -> dict:
+        """Index the column-level metadata wizard aspects of an entry by column name.
+
+        Args:
+            entry: The Dataplex entry containing aspects
+
+        Returns:
+            dict: Column aspects keyed by column name
+        """
+        column_aspects = {}
+        for aspect_key, aspect in entry.aspects.items():
+            _, separator, column_name = aspect_key.partition(_COLUMN_ASPECT_SUFFIX_PREFIX)
+            if separator:
+                column_aspects[column_name] = aspect
+        return column_aspects
+
+    def _build_search_query(self, dataset_fqn: str, aspect_predicate: str, search_query: str = None) -> str:
+        """Build a BigQuery search query filtered on the dataset and a wizard aspect field.
+
+        All filters are part of the query so that Dataplex evaluates them
+        server-side and only matching entries are returned.
 
-    def build_search_query_for_review(self, dataset_fqn: str, search_query: str = None) -> str:
-        """Build an effective query that always includes the dataset filter.
-        
-        This method ensures that the dataset_fqn is always included in the query,
-        even when no search_query is provided. If a search_query is provided,
-        it's combined with the dataset filter.
-        
         Args:
             dataset_fqn (str): The fully qualified name of the dataset (project_id.dataset_id)
+            aspect_predicate (str): Predicate on the wizard aspect, e.g. 'is-accepted=false'
             search_query (str, optional): Additional search criteria to filter results
-            
+
         Returns:
             str: The effective query string that includes the dataset filter
         """
         # Start with the base system filter
-        base_query = f"""system=BIGQUERY and aspect:global.{constants['ASPECT_TEMPLATE']['name']}.is-accepted=false"""
+        base_query = f"system=BIGQUERY and aspect:{_TABLE_ASPECT_SUFFIX}.{aspect_predicate}"
         
         # Always include the dataset filter
         dataset_filter = f"parent:{dataset_fqn}"
@@ -70,14 +260,14 @@ class ReviewOperations:
         # Combine filters
         if search_query is not None:
             # If search_query already contains the dataset filter, don't duplicate it
-            if f"parent:{dataset_fqn}" in search_query:
+            if dataset_filter in search_query:
                 return f"{base_query} AND {search_query}"
             else:
                 return f"{base_query} AND {dataset_filter} AND {search_query}"
         else:
             return f"{base_query} AND {dataset_filter}"
-        
-    def build_search_query_for_regeneration(self, dataset_fqn: str, search_query: str = None) -> str:
+
+    def build_search_query_for_review(self, dataset_fqn: str, search_query: str = None) -> str:
         """Build an effective query that always includes the dataset filter.
         
         This method ensures that the dataset_fqn is always included in the query,
@@ -91,21 +281,23 @@ class ReviewOperations:
         Returns:
             str: The effective query string that includes the dataset filter
         """
-        # Start with the base system filter
-        base_query = f"""system=BIGQUERY and aspect:global.{constants['ASPECT_TEMPLATE']['name']}.to-be-regenerated=true"""
+        return self._build_search_query(dataset_fqn, "is-accepted=false", search_query)
         
-        # Always include the dataset filter
-        dataset_filter = f"parent:{dataset_fqn}"
+    def build_search_query_for_regeneration(self, dataset_fqn: str, search_query: str = None) -> str:
+        """Build an effective query that always includes the dataset filter.
         
-        # Combine filters
-        if search_query is not None:
-            # If search_query already contains the dataset filter, don't duplicate it
-            if f"parent:{dataset_fqn}" in search_query:
-                return f"{base_query} AND {search_query}"
-            else:
-                return f"{base_query} AND {dataset_filter} AND {search_query}"
-        else:
-            return f"{base_query} AND {dataset_filter}"
+        This method ensures that the dataset_fqn is always included in the query,
+        even when no search_query is provided. If a search_query is provided,
+        it's combined with the dataset filter.
+        
+        Args:
+            dataset_fqn (str): The fully qualified name of the dataset (project_id.dataset_id)
+            search_query (str, optional): Additional search criteria to filter results
+            
+        Returns:
+            str: The effective query string that includes the dataset filter
+        """
+        return self._build_search_query(dataset_fqn, "to-be-regenerated=true", search_query)
 
     def get_review_items_for_dataset(self, dataset_fqn: str, search_query: str=None, page_size: int = 100, page_token: str = None) -> dict:
         """Get review items for a dataset based on search criteria.
@@ -119,18 +311,20 @@ class ReviewOperations:
             dict: Dictionary containing review items and pagination info
         """
         try:
-            logger.info(f"Processing search query: {search_query}")
+            logger.info("Processing search query: %s", search_query)
             
             review_items = []
             result_count = 0
+            # One timestamp for the whole page instead of one per review item
+            now_iso = datetime.datetime.now().isoformat()
             
             try:
-                client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
+                client = self._catalog_client
                 name = f"projects/{self._client._project_id}/locations/global"
 
-                logger.info(f"Building search query for dataset: {dataset_fqn} and search query: {search_query}")
+                logger.info("Building search query for dataset: %s and search query: %s", dataset_fqn, search_query)
                 query = self.build_search_query_for_review(dataset_fqn, search_query)
-                logger.info(f"Built search request - name: {name}, query: {query}")
+                logger.info("Built search request - name: %s, query: %s", name, query)
                 
                 request = dataplex_v1.SearchEntriesRequest(
                     name=name,
@@ -140,25 +334,32 @@ class ReviewOperations:
                 )
         
                 response = client.search_entries(request=request)
+                # Fetch only the requested page; iterating the pager itself
+                # would transparently walk through every remaining page
+                page = next(response.pages)
                 logger.info("Got search response")
                 
-                for result in response:
-                    if not hasattr(result, 'dataplex_entry'):
-                        logger.info("Result has no dataplex_entry, skipping")
+                # Read the underlying protobuf message directly; proto-plus
+                # marshaling on every field access is costly for wide entries
+                page_pb = dataplex_v1.SearchEntriesResponse.pb(page)
+                for result_pb in page_pb.results:
+                    if not result_pb.HasField('dataplex_entry'):
+                        logger.debug("Result has no dataplex_entry, skipping")
                         continue
                         
-                    entry = result.dataplex_entry
+                    entry = result_pb.dataplex_entry
                     if not entry.fully_qualified_name.startswith("bigquery:"):
-                        logger.info(f"Entry {entry.fully_qualified_name} is not a BigQuery table, skipping")
+                        logger.debug("Entry %s is not a BigQuery table, skipping", entry.fully_qualified_name)
                         continue
                         
-                    table_fqn = entry.fully_qualified_name.replace("bigquery:", "")
+                    table_fqn = entry.fully_qualified_name.removeprefix("bigquery:")
                     current_description = ""
                     
-                    if hasattr(entry, 'entry_source') and hasattr(entry.entry_source, 'description'):
+                    if entry.HasField('entry_source'):
                         current_description = entry.entry_source.description
                         # logger.info(f"Found description for {table_fqn}: {current_description}")
                     
+                    last_modified = entry.update_time.ToDatetime(tzinfo=datetime.timezone.utc).isoformat() if entry.HasField('update_time') else now_iso
                     review_item = {
                         "id": f"{table_fqn}#table",
                         "type": "table",
@@ -167,24 +368,27 @@ class ReviewOperations:
                         "draftDescription": "",  # Empty for list view
                         "isHtml": False,
                         "status": "current",
-                        "lastModified": entry.update_time.isoformat() if hasattr(entry, 'update_time') else datetime.datetime.now().isoformat(),
+                        "lastModified": last_modified,
                         "comments": [],  # Empty for list view
                         "markedForRegeneration": False  # Default for list view
                     }
                     review_items.append(review_item)
                     result_count += 1
-                    logger.info(f"Added review item for table {table_fqn}")
+                    logger.debug("Added review item for table %s", table_fqn)
                 
                     # Check for column-level metadata tags
+                    schema_by_name = None
                     for aspect_key, aspect in entry.aspects.items():
-                        if aspect_key.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") and aspect.path.startswith("Schema."):
+                        if aspect.path.startswith("Schema.") and aspect_key.endswith(_TABLE_ASPECT_SUFFIX):
                             # Extract column name from path
-                            column_name = aspect.path.replace("Schema.", "")
-                            logger.info(f"Found column metadata for {column_name}")
+                            column_name = aspect.path.removeprefix("Schema.")
+                            logger.debug("Found column metadata for %s", column_name)
                             
-                            # Get column current description from BigQuery
-                            flat_schema, schema = self._client._bigquery_ops.get_table_schema(table_fqn)
-                            column = next((f for f in schema if f.name == column_name), None)
+                            # Get column current description from BigQuery, indexing the schema once per table
+                            if schema_by_name is None:
+                                schema = self._client._bigquery_ops.get_table_schema_fields(table_fqn)
+                                schema_by_name = {field.name: field for field in schema}
+                            column = schema_by_name.get(column_name)
                             current_description = column.description if column else ""
                             
                             column_review_item = {
@@ -195,18 +399,18 @@ class ReviewOperations:
                                 "draftDescription": "",  # Empty for list view
                                 "isHtml": False,
                                 "status": "current",
-                                "lastModified": entry.update_time.isoformat() if hasattr(entry, 'update_time') else datetime.datetime.now().isoformat(),
+                                "lastModified": last_modified,
                                 "comments": [],  # Empty for list view
                                 "markedForRegeneration": False  # Default for list view
                             }
                             review_items.append(column_review_item)
                             result_count += 1
-                            logger.info(f"Added review item for column {column_name}")
+                            logger.debug("Added review item for column %s", column_name)
                 
                 response_data = {
                     "items": review_items,
-                    "nextPageToken": response.next_page_token if hasattr(response, 'next_page_token') else None,
-                    "totalCount": response.total_size if hasattr(response, 'total_size') else result_count
+                    "nextPageToken": page_pb.next_page_token or None,
+                    "totalCount": page_pb.total_size or result_count
                 }
                 
                 return {"data": response_data}
@@ -219,6 +423,73 @@ class ReviewOperations:
             logger.error(f"Error getting review items for search query '{search_query}': {str(e)}")
             raise
 
+    def list_review_items(self, table_fqn: str, since_timestamp: str = None) -> dict:
+        """List the review items of a table whose wizard aspect changed after a given time.
+
+        Lets a review panel poll for changes: pass the 'maxUpdateTime' of the
+        previous response as since_timestamp and only newer items are returned.
+
+        Args:
+            table_fqn (str): The fully qualified name of the table
+            since_timestamp (str, optional): ISO 8601 timestamp; only aspects
+                updated after it are returned
+
+        Returns:
+            dict: The changed 'items' and the 'maxUpdateTime' seen on the entry
+        """
+        try:
+            entry_name = self._entry_name_for(table_fqn)
+            entry = self._get_entry(entry_name, self._aspect_type)
+            since = datetime.datetime.fromisoformat(since_timestamp) if since_timestamp else None
+            if since is not None and since.tzinfo is None:
+                since = since.replace(tzinfo=datetime.timezone.utc)
+
+            items = []
+            max_update_time = since
+            # Read timestamps and data from the raw protobuf, as in the review list
+            for aspect_key, aspect_pb in dataplex_v1.Entry.pb(entry).aspects.items():
+                # Table aspects end with the suffix, column aspects carry '@Schema.{column}' after it
+                if not (aspect_key.endswith(_TABLE_ASPECT_SUFFIX)
+                        or _COLUMN_ASPECT_SUFFIX_PREFIX in aspect_key):
+                    continue
+                if not aspect_pb.HasField("update_time"):
+                    continue
+                update_time = aspect_pb.update_time.ToDatetime(tzinfo=datetime.timezone.utc)
+                if max_update_time is None or update_time > max_update_time:
+                    max_update_time = update_time
+                if since is not None and update_time <= since:
+                    continue
+
+                fields = aspect_pb.data.fields
+                draft_description = fields["contents"].string_value if "contents" in fields else ""
+                if aspect_pb.path.startswith("Schema."):
+                    column_name = aspect_pb.path.removeprefix("Schema.")
+                    item = {
+                        "id": f"{table_fqn}#column#{column_name}",
+                        "type": "column",
+                        "name": f"{table_fqn}.{column_name}"
+                    }
+                else:
+                    item = {
+                        "id": f"{table_fqn}#table",
+                        "type": "table",
+                        "name": table_fqn
+                    }
+                item.update({
+                    "draftDescription": draft_description,
+                    "status": "draft" if draft_description else "current",
+                    "lastModified": update_time.isoformat()
+                })
+                items.append(item)
+
+            return {
+                "items": items,
+                "maxUpdateTime": max_update_time.isoformat() if max_update_time else since_timestamp
+            }
+        except Exception as e:
+            logger.error(f"Error listing review items for table {table_fqn}: {str(e)}")
+            raise
+
     def get_review_item_details(self, table_fqn: str, column_name: str = None) -> dict:
         """Get detailed information about a specific review item.
 
@@ -230,47 +501,44 @@ class ReviewOperations:
             dict: Detailed information about the review item
         """
         try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
+            entry_name = self._entry_name_for(table_fqn)
             
-            entry_name = f"projects/{project_id}/locations/{self._client._dataplex_ops._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            aspect_type = self._aspect_type
+            bigquery_ops = self._client._bigquery_ops
+            # The Dataplex entry and the BigQuery table are independent reads, so
+            # issue them concurrently. The schema read fetches the table once;
+            # the description is then served from the table cache
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                entry_future = executor.submit(self._get_entry, entry_name, aspect_type)
+                schema_future = executor.submit(bigquery_ops.get_table_schema_fields, table_fqn)
+            entry = entry_future.result()
             
-            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_types = [aspect_type]
-            request = dataplex_v1.GetEntryRequest(
-                name=entry_name,
-                view=dataplex_v1.EntryView.CUSTOM,  # IMPORTANT: Must remain CUSTOM - do not change to ALL or FULL as it breaks aspect filtering
-                aspect_types=aspect_types
-            )
-            entry = client.get_entry(request=request)
-            
-            # Extract tags from entry
-            tags = {}
-            if hasattr(entry, 'labels'):
-                tags.update(entry.labels)
-            if hasattr(entry, 'tags'):
-                tags.update(entry.tags)
+            # Extract tags from entry; Entry has no labels field of its own,
+            # source system labels live on entry_source
+            tags = dict(entry.entry_source.labels)
             
             # Get table schema first as we'll need it for both table and column details
-            flat_schema, schema = self._client._bigquery_ops.get_table_schema(table_fqn)
+            schema = schema_future.result()
             if not schema:
                 raise ValueError(f"Table {table_fqn} not found")
 
+            now_iso = datetime.datetime.now().isoformat()
+
             # If column_name is specified, return only that column's details
             if column_name:
                 column = next((f for f in schema if f.name == column_name), None)
                 if not column:
                     raise ValueError(f"Column {column_name} not found in table {table_fqn}")
                 
-                return self._get_column_details(entry, table_fqn, column, tags)
+                return self._get_column_details(entry, table_fqn, column, tags, now_iso)
             
             # Handle table details
-            current_description = self._client._bigquery_ops.get_table_description(table_fqn)
+            current_description = bigquery_ops.get_table_description(table_fqn)
             draft_description = None
             metadata = {
                 'certified': False,
                 'user_who_certified': '',
-                'generation_date': datetime.datetime.now().isoformat(),
+                'generation_date': now_iso,
                 'to_be_regenerated': False,
                 'external_document_uri': '',
                 'is-accepted': False,
@@ -279,9 +547,8 @@ class ReviewOperations:
 
             # Get table-level aspect data
             for aspect_key, aspect in entry.aspects.items():
-                if (aspect_key.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") 
+                if (aspect_key.endswith(_TABLE_ASPECT_SUFFIX) 
                     and aspect.path == "" 
-                    and hasattr(aspect, 'data')
                     and aspect.data):
                     
                     aspect_data = aspect.data
@@ -291,7 +558,7 @@ class ReviewOperations:
                         metadata.update({
                             'certified': aspect_data.get('certified', False),
                             'user_who_certified': aspect_data.get('user-who-certified', ''),
-                            'generation_date': aspect_data.get('generation-date', datetime.datetime.now().isoformat()),
+                            'generation_date': aspect_data.get('generation-date', now_iso),
                             'to_be_regenerated': aspect_data.get('to-be-regenerated', False),
                             'external_document_uri': aspect_data.get('external-document-uri', ''),
                             'is-accepted': aspect_data.get('is-accepted', False),
@@ -305,21 +572,17 @@ class ReviewOperations:
             negative_examples = self.get_negative_examples_to_table_draft_description(table_fqn) or []
             
             # Combine comments and negative examples
-            all_comments = [c for c in comments if isinstance(c, str)]
-            all_comments.extend([e for e in negative_examples if isinstance(e, str)])
+            all_comments = [c for c in itertools.chain(comments, negative_examples) if isinstance(c, str)]
 
             # Process all columns and include those with metadata
             columns_with_metadata = []
             
+            # Index the column aspects once instead of scanning all aspects per column
+            column_aspects = self._index_column_aspects(entry)
             for column in schema:
                 # Check if column has any aspects
-                has_aspects = any(
-                    aspect_key.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column.name}""")
-                    for aspect_key in entry.aspects.keys()
-                )
-                
-                if has_aspects:
-                    column_details = self._get_column_details(entry, table_fqn, column, dict(tags))
+                if column.name in column_aspects:
+                    column_details = self._get_column_details(entry, table_fqn, column, tags, now_iso, column_aspects)
                     if column_details:
                         columns_with_metadata.append(column_details)
 
@@ -331,7 +594,7 @@ class ReviewOperations:
                 "draftDescription": draft_description or "",
                 "isHtml": False,
                 "status": "draft" if draft_description else "current",
-                "lastModified": metadata.get('generation_date', datetime.datetime.now().isoformat()),
+                "lastModified": metadata.get('generation_date', now_iso),
                 "comments": all_comments,
                 "markedForRegeneration": metadata.get('to_be_regenerated', False),
                 "metadata": metadata,
@@ -340,11 +603,11 @@ class ReviewOperations:
             }
 
         except Exception as e:
-            logger.error(f"Error getting review item details for table {table_fqn} column {column_name}: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Error getting review item details for table %s column %s: %s", table_fqn, column_name, e)
             raise
 
-    def _get_column_details(self, entry, table_fqn: str, column, parent_tags: dict) -> dict:
+    def _get_column_details(self, entry, table_fqn: str, column, parent_tags: dict, now_iso: str = None,
+                            column_aspects: dict = None) -> dict:
         """Get column details from entry and column information.
         
         Args:
@@ -352,18 +615,25 @@ class ReviewOperations:
             table_fqn (str): The fully qualified name of the table
             column: The column schema object
             parent_tags (dict): Tags inherited from the parent table
+            now_iso (str, optional): Default generation date, computed if not provided
+            column_aspects (dict, optional): Column aspects of the entry from
+                _index_column_aspects, built from the entry if not provided
             
         Returns:
             dict: Column details including metadata and descriptions
         """
         try:
-            logger.debug(f"Getting column details for {column.name}")
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                logger.debug("Getting column details for %s", column.name)
+            if now_iso is None:
+                now_iso = datetime.datetime.now().isoformat()
             current_description = column.description or ""
             draft_description = None
             metadata = {
                 'certified': False,
                 'user_who_certified': '',
-                'generation_date': datetime.datetime.now().isoformat(),
+                'generation_date': now_iso,
                 'to_be_regenerated': False,
                 'external_document_uri': '',
                 'is-accepted': False,
@@ -373,64 +643,71 @@ class ReviewOperations:
             comments = []
 
             # Find the draft description in the custom aspect for the specific column
-            for aspect_key, aspect in entry.aspects.items():
-                if (aspect_key.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column.name}""") 
-                    and aspect.path == f"Schema.{column.name}"
-                    and hasattr(aspect, 'data')):
+            column_path = f"Schema.{column.name}"
+            if column_aspects is None:
+                column_aspects = self._index_column_aspects(entry)
+            aspect = column_aspects.get(column.name)
+            if aspect is not None and aspect.path == column_path:
+                
+                aspect_data = aspect.data
+                
+                # Handle both dict and MapComposite types
+                if hasattr(aspect_data, 'get') or isinstance(aspect_data, dict):
+                    # Extract draft description
+                    if aspect_data.get("contents"):
+                        draft_description = aspect_data["contents"]
+                        
+                    # Extract metadata
+                    metadata_updates = {
+                        'certified': aspect_data.get('certified', False),
+                        'user_who_certified': aspect_data.get('user-who-certified', ''),
+                        'generation_date': aspect_data.get('generation-date', now_iso),
+                        'to_be_regenerated': aspect_data.get('to-be-regenerated', False),
+                        'external_document_uri': aspect_data.get('external-document-uri', '')
+                    }
                     
-                    aspect_data = aspect.data
+                    # --- Explicitly check and add acceptance status --- START
+                    raw_is_accepted = None
+                    raw_when_accepted = None
+                    if 'is-accepted' in aspect_data:
+                        raw_is_accepted = aspect_data['is-accepted']
+                        # Handle boolean true or string 'true'
+                        is_accepted_val = raw_is_accepted is True or str(raw_is_accepted).lower() == 'true'
+                        metadata_updates['is-accepted'] = is_accepted_val
+                        if debug_enabled:
+                            logger.debug("Column %s - Found 'is-accepted' in aspect data: %s -> %s", column.name, raw_is_accepted, is_accepted_val)
+                    else:
+                         if debug_enabled:
+                             logger.debug("Column %s - Key 'is-accepted' not found in aspect data.", column.name)
+                         metadata_updates['is-accepted'] = False # Default if key missing
+                         
+                    if 'when-accepted' in aspect_data:
+                         raw_when_accepted = aspect_data['when-accepted']
+                         metadata_updates['when-accepted'] = raw_when_accepted
+                         if debug_enabled:
+                             logger.debug("Column %s - Found 'when-accepted' in aspect data: %s", column.name, raw_when_accepted)
+                    else:
+                         if debug_enabled:
+                             logger.debug("Column %s - Key 'when-accepted' not found in aspect data.", column.name)
+                         metadata_updates['when-accepted'] = None # Default if key missing
+                    # --- Explicitly check and add acceptance status --- END
                     
-                    # Handle both dict and MapComposite types
-                    if hasattr(aspect_data, 'get') or isinstance(aspect_data, dict):
-                        # Extract draft description
-                        if aspect_data.get("contents"):
-                            draft_description = aspect_data["contents"]
-                            
-                        # Extract metadata
-                        metadata_updates = {
-                            'certified': aspect_data.get('certified', False),
-                            'user_who_certified': aspect_data.get('user-who-certified', ''),
-                            'generation_date': aspect_data.get('generation-date', datetime.datetime.now().isoformat()),
-                            'to_be_regenerated': aspect_data.get('to-be-regenerated', False),
-                            'external_document_uri': aspect_data.get('external-document-uri', '')
-                        }
-                        
-                        # --- Explicitly check and add acceptance status --- START
-                        raw_is_accepted = None
-                        raw_when_accepted = None
-                        if 'is-accepted' in aspect_data:
-                            raw_is_accepted = aspect_data['is-accepted']
-                            # Handle boolean true or string 'true'
-                            is_accepted_val = raw_is_accepted is True or str(raw_is_accepted).lower() == 'true'
-                            metadata_updates['is-accepted'] = is_accepted_val
-                            logger.debug(f"Column {column.name} - Found 'is-accepted' in aspect data: {raw_is_accepted} -> {is_accepted_val}")
-                        else:
-                             logger.debug(f"Column {column.name} - Key 'is-accepted' not found in aspect data.")
-                             metadata_updates['is-accepted'] = False # Default if key missing
-                             
-                        if 'when-accepted' in aspect_data:
-                             raw_when_accepted = aspect_data['when-accepted']
-                             metadata_updates['when-accepted'] = raw_when_accepted
-                             logger.debug(f"Column {column.name} - Found 'when-accepted' in aspect data: {raw_when_accepted}")
-                        else:
-                             logger.debug(f"Column {column.name} - Key 'when-accepted' not found in aspect data.")
-                             metadata_updates['when-accepted'] = None # Default if key missing
-                        # --- Explicitly check and add acceptance status --- END
-                        
-                        logger.debug(f"Column {column.name} - Metadata updates to apply: {metadata_updates}")
-                        metadata.update(metadata_updates)
-                        logger.debug(f"Column {column.name} - Metadata dict after update: {metadata}")
-                        
-                        # Extract comments
-                        if aspect_data.get('human-comments'):
-                            comments.extend([
-                                comment for comment in aspect_data['human-comments']
-                                if isinstance(comment, str)
-                            ])
-                        
-                        # Extract tags
-                        if aspect_data.get('tags'):
-                            column_tags.update(aspect_data['tags'])
+                    if debug_enabled:
+                        logger.debug("Column %s - Metadata updates to apply: %s", column.name, metadata_updates)
+                    metadata.update(metadata_updates)
+                    if debug_enabled:
+                        logger.debug("Column %s - Metadata dict after update: %s", column.name, metadata)
+                    
+                    # Extract comments
+                    if aspect_data.get('human-comments'):
+                        comments.extend([
+                            comment for comment in aspect_data['human-comments']
+                            if isinstance(comment, str)
+                        ])
+                    
+                    # Extract tags
+                    if aspect_data.get('tags'):
+                        column_tags.update(aspect_data['tags'])
 
             result = {
                 "type": "column",
@@ -440,7 +717,7 @@ class ReviewOperations:
                 "draftDescription": draft_description or "",
                 "isHtml": False,
                 "status": "draft" if draft_description else "current",
-                "lastModified": metadata.get('generation_date', datetime.datetime.now().isoformat()),
+                "lastModified": metadata.get('generation_date', now_iso),
                 "comments": comments,
                 "markedForRegeneration": metadata.get('to_be_regenerated', False),
                 "metadata": metadata,
@@ -450,8 +727,7 @@ class ReviewOperations:
             return result
             
         except Exception as e:
-            logger.error(f"Error getting column details for {column.name}: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Error getting column details for %s: %s", column.name, e)
             return None
 
     def get_comments_to_table_draft_description(self, table_fqn):
@@ -466,35 +742,20 @@ class ReviewOperations:
         try:
             logger.info(f"=== START: get_comments_to_table_draft_description for {table_fqn} ===")
             
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-            
-            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_types = [aspect_type]
-            entry_name = f"projects/{project_id}/locations/{self._client._dataplex_ops._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-
-            request = dataplex_v1.GetEntryRequest(
-                name=entry_name,
-                view=dataplex_v1.EntryView.CUSTOM,  # IMPORTANT: Must remain CUSTOM - do not change to ALL or FULL as it breaks aspect filtering
-                aspect_types=aspect_types
-            )
-            entry = client.get_entry(request=request)
+            aspect_type = self._aspect_type
+            entry_name = self._entry_name_for(table_fqn)
 
-            for aspect_key, aspect in entry.aspects.items():
-                if aspect_key.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") and aspect.path == "":
-                    if "human-comments" in aspect.data:
-                        raw_comments = aspect.data["human-comments"]
-                        validated_comments = []
-                        for comment in raw_comments:
-                            if isinstance(comment, str):
-                                validated_comments.append(comment)
-                        return validated_comments
+            entry = self._get_entry(entry_name, aspect_type)
+
+            aspect = self._find_table_aspect(entry)
+            if aspect is not None and "human-comments" in aspect.data:
+                raw_comments = aspect.data["human-comments"]
+                return [comment for comment in raw_comments if isinstance(comment, str)]
 
             return []
 
         except Exception as e:
-            logger.error(f"Error getting comments for table {table_fqn}: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Error getting comments for table %s: %s", table_fqn, e)
             return []
 
     def get_negative_examples_to_table_draft_description(self, table_fqn):
@@ -507,24 +768,14 @@ class ReviewOperations:
             list: List of negative examples associated with the draft description
         """
         try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-            
-            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_types = [aspect_type]
-            entry_name = f"projects/{project_id}/locations/{self._client._dataplex_ops._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-
-            request = dataplex_v1.GetEntryRequest(
-                name=entry_name,
-                view=dataplex_v1.EntryView.CUSTOM,  # IMPORTANT: Must remain CUSTOM - do not change to ALL or FULL as it breaks aspect filtering
-                aspect_types=aspect_types
-            )
-            entry = client.get_entry(request=request)
+            aspect_type = self._aspect_type
+            entry_name = self._entry_name_for(table_fqn)
 
-            for aspect_key, aspect in entry.aspects.items():
-                if aspect_key.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") and aspect.path == "":
-                    if "negative-examples" in aspect.data:
-                        return aspect.data["negative-examples"]
+            entry = self._get_entry(entry_name, aspect_type)
+
+            aspect = self._find_table_aspect(entry)
+            if aspect is not None and "negative-examples" in aspect.data:
+                return aspect.data["negative-examples"]
             
             return []
 
@@ -543,49 +794,24 @@ class ReviewOperations:
             bool: True if successful
         """
         try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
+            client = self._catalog_client
             
-            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_name = f"""{self._client._project_id}.global.{constants["ASPECT_TEMPLATE"]["name"]}"""
-            entry_name = f"projects/{project_id}/locations/{self._client._dataplex_ops._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            aspect_type = self._aspect_type
+            aspect_name = self._table_aspect_name
+            entry_name = self._entry_name_for(table_fqn)
             
             new_aspect = dataplex_v1.Aspect()
             new_aspect.aspect_type = aspect_type
             
-            try:
-                request = dataplex_v1.GetEntryRequest(
-                    name=entry_name,
-                    view=dataplex_v1.EntryView.CUSTOM,  # IMPORTANT: Must remain CUSTOM - do not change to ALL or FULL as it breaks aspect filtering
-                    aspect_types=[aspect_type]
-                )
-                entry = client.get_entry(request=request)
-                
-                aspect_found = False
-                for i in entry.aspects:
-                    if i.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") and entry.aspects[i].path == "":
-                        aspect_found = True
-                        new_aspect.data = entry.aspects[i].data
-                        existing_comments = list(new_aspect.data.get("human-comments", []))
-                        existing_comments.append(comment)
-                        new_aspect.data["human-comments"] = existing_comments
-                        break
-                
-                if not aspect_found:
-                    aspect_data = {
-                        "human-comments": [comment]
-                    }
-                    data_struct = struct_pb2.Struct()
-                    data_struct.update(aspect_data)
-                    new_aspect.data = data_struct
-                
-            except google.api_core.exceptions.NotFound:
-                aspect_data = {
-                    "human-comments": [comment]
-                }
-                data_struct = struct_pb2.Struct()
-                data_struct.update(aspect_data)
-                new_aspect.data = data_struct
+            # Read the entry fresh, the comments are appended to what is stored now
+            self._invalidate_entry(entry_name)
+            entry = self._get_entry_or_none(entry_name, aspect_type)
+            existing_aspect = self._find_table_aspect(entry) if entry is not None else None
+            if existing_aspect is not None:
+                new_aspect.data = existing_aspect.data
+                _append_comments(new_aspect, [comment])
+            else:
+                new_aspect.data = _new_comments_struct([comment])
             
             new_entry = dataplex_v1.Entry()
             new_entry.name = entry_name
@@ -593,17 +819,17 @@ class ReviewOperations:
             
             request = dataplex_v1.UpdateEntryRequest(
                 entry=new_entry,
-                update_mask=field_mask_pb2.FieldMask(paths=["aspects"]),
+                update_mask=_ASPECTS_FIELD_MASK,
                 allow_missing=False,
                 aspect_keys=[aspect_name]
             )
             
             response = client.update_entry(request=request)
+            self._invalidate_entry(entry_name)
             return True
             
         except Exception as e:
-            logger.error(f"Error updating comments: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Error updating comments: %s", e)
             return False
 
     def add_comment_to_column_draft_description(self, table_fqn, column_name, comment):
@@ -619,71 +845,67 @@ class ReviewOperations:
         """
         try:
             logger.info(f"=== START: add_comment_to_column_draft_description for {table_fqn}.{column_name} ===")
-            
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-            
-            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_name = f"""{self._client._project_id}.global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}"""
-            entry_name = f"projects/{project_id}/locations/{self._client._dataplex_ops._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            self._write_column_comments(table_fqn, {column_name: [comment]})
+            return True
+
+        except Exception as e:
+            logger.exception("Error adding comment to column %s in table %s: %s", column_name, table_fqn, e)
+            return False
+
+    def flush_comments(self):
+        """Kept for compatibility, comments are written when they are added."""
+        return None
+
+    def _write_column_comments(self, table_fqn: str, comments_by_column: dict):
+        """Append comments to the column aspects of a table with one UpdateEntry call.
+
+        Args:
+            table_fqn (str): The fully qualified name of the table
+            comments_by_column (dict): Lists of comments keyed by column name
+
+        Raises:
+            Exception: If the entry cannot be updated
+        """
+        client = self._catalog_client
+
+        aspect_type = self._aspect_type
+        entry_name = self._entry_name_for(table_fqn)
+
+        # Read the entry fresh, the comments are appended to what is stored now
+        self._invalidate_entry(entry_name)
+        entry = self._get_entry_or_none(entry_name, aspect_type)
+        existing_aspects = entry.aspects if entry is not None else {}
+
+        new_entry = dataplex_v1.Entry()
+        new_entry.name = entry_name
+        aspect_keys = []
+        for column_name, comments in comments_by_column.items():
+            aspect_name = self._column_aspect_name(column_name)
 
             new_aspect = dataplex_v1.Aspect()
             new_aspect.aspect_type = aspect_type
             new_aspect.path = f"Schema.{column_name}"
 
-            try:
-                request = dataplex_v1.GetEntryRequest(
-                    name=entry_name,
-                    view=dataplex_v1.EntryView.CUSTOM,  # IMPORTANT: Must remain CUSTOM - do not change to ALL or FULL as it breaks aspect filtering
-                    aspect_types=[aspect_type]
-                )
-                entry = client.get_entry(request=request)
-                
-                found_aspect = False
-                for i in entry.aspects:
-                    if i.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}""") and entry.aspects[i].path == f"Schema.{column_name}":
-                        found_aspect = True
-                        new_aspect.data = entry.aspects[i].data
-                        existing_comments = list(new_aspect.data.get("human-comments", []))
-                        existing_comments.append(comment)
-                        new_aspect.data["human-comments"] = existing_comments
-                        break
-                
-                if not found_aspect:
-                    aspect_data = {
-                        "human-comments": [comment]
-                    }
-                    data_struct = struct_pb2.Struct()
-                    data_struct.update(aspect_data)
-                    new_aspect.data = data_struct
-
-            except google.api_core.exceptions.NotFound:
-                aspect_data = {
-                    "human-comments": [comment]
-                }
-                data_struct = struct_pb2.Struct()
-                data_struct.update(aspect_data)
-                new_aspect.data = data_struct
+            existing_aspect = existing_aspects.get(aspect_name)
+            if existing_aspect is not None and existing_aspect.path == f"Schema.{column_name}":
+                new_aspect.data = existing_aspect.data
+                _append_comments(new_aspect, comments)
+            else:
+                new_aspect.data = _new_comments_struct(comments)
 
-            new_entry = dataplex_v1.Entry()
-            new_entry.name = entry_name
             new_entry.aspects[aspect_name] = new_aspect
+            aspect_keys.append(aspect_name)
 
-            request = dataplex_v1.UpdateEntryRequest(
-                entry=new_entry,
-                update_mask=field_mask_pb2.FieldMask(paths=["aspects"]),
-                allow_missing=False,
-                aspect_keys=[aspect_name]
-            )
-            
-            response = client.update_entry(request=request)
-            logger.info("Successfully updated entry")
-            return True
+        request = dataplex_v1.UpdateEntryRequest(
+            entry=new_entry,
+            update_mask=_ASPECTS_FIELD_MASK,
+            allow_missing=False,
+            aspect_keys=aspect_keys
+        )
 
-        except Exception as e:
-            logger.error(f"Error adding comment to column {column_name} in table {table_fqn}: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            return False
+        client.update_entry(request=request)
+        self._invalidate_entry(entry_name)
+        logger.info("Successfully updated entry")
 
     def _get_table_draft_description(self, table_fqn: str) -> str:
         """Get the draft description for a table.
@@ -695,23 +917,14 @@ class ReviewOperations:
             str: Draft description or None if not found
         """
         try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
+            aspect_type = self._aspect_type
+            entry_name = self._entry_name_for(table_fqn)
 
-            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_types = [aspect_type]
-            entry_name = f"projects/{project_id}/locations/{self._client._dataplex_ops._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
+            entry = self._get_entry(entry_name, aspect_type)
 
-            request = dataplex_v1.GetEntryRequest(
-                name=entry_name,
-                view=dataplex_v1.EntryView.CUSTOM,  # IMPORTANT: Must remain CUSTOM - do not change to ALL or FULL as it breaks aspect filtering
-                aspect_types=aspect_types
-            )
-            entry = client.get_entry(request=request)
-
-            for aspect_key, aspect in entry.aspects.items():
-                if aspect_key.endswith(f"""global.{constants["ASPECT_TEMPLATE"]["name"]}""") and aspect.path == "":
-                    return aspect.data["contents"]
+            aspect = self._find_table_aspect(entry)
+            if aspect is not None:
+                return aspect.data["contents"]
 
             return None
         except Exception as e:
@@ -729,43 +942,52 @@ class ReviewOperations:
             str: Draft description or None if not found
         """
         try:
-            logger.debug(f"Getting draft description for column {column_name}")
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-            project_id, dataset_id, table_id = self._client._utils.split_table_fqn(table_fqn)
-
-            aspect_type = f"""projects/{self._client._project_id}/locations/global/aspectTypes/{constants["ASPECT_TEMPLATE"]["name"]}"""
-            aspect_types = [aspect_type]
-            entry_name = f"projects/{project_id}/locations/{self._client._dataplex_ops._get_dataset_location(table_fqn)}/entryGroups/@bigquery/entries/bigquery.googleapis.com/projects/{project_id}/datasets/{dataset_id}/tables/{table_id}"
-
-            request = dataplex_v1.GetEntryRequest(
-                name=entry_name,
-                view=dataplex_v1.EntryView.CUSTOM,  # IMPORTANT: Must remain CUSTOM - do not change to ALL or FULL as it breaks aspect filtering
-                aspect_types=aspect_types
-            )
-            entry = client.get_entry(request=request)
+            logger.debug("Getting draft description for column %s", column_name)
+
+            aspect_type = self._aspect_type
+            entry_name = self._entry_name_for(table_fqn)
+
+            # Only the aspects of this column are needed, not those of every column
+            try:
+                entry = self._get_entry(entry_name, aspect_type, f"Schema.{column_name}")
+            except google.api_core.exceptions.InvalidArgument:
+                entry = self._get_entry(entry_name, aspect_type)
             
-            logger.debug(f"Available aspects: {list(entry.aspects.keys())}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Available aspects: %s", list(entry.aspects.keys()))
             
-            # Check for column aspects with different patterns
+            # Aspect keys are deterministic, so try the key the writers produce first
+            aspect = entry.aspects.get(self._column_aspect_name(column_name))
+            if aspect is not None:
+                logger.debug("Found aspect for column %s", column_name)
+                if aspect.data and isinstance(aspect.data, dict) and "contents" in aspect.data:
+                    return aspect.data["contents"]
+
+            # Fall back to matching keys written with other patterns
             aspect_patterns = [
-                f"""global.{constants["ASPECT_TEMPLATE"]["name"]}@Schema.{column_name}""",
-                f"""global.{constants["ASPECT_TEMPLATE"]["name"]}.Schema.{column_name}""",
+                f"""{_COLUMN_ASPECT_SUFFIX_PREFIX}{column_name}""",
+                f"""{_TABLE_ASPECT_SUFFIX}.Schema.{column_name}""",
                 f"""Schema.{column_name}"""
             ]
             
+            # Every pattern contains the last one, so a single pass over the keys
+            # finds all candidates; the patterns are then only tried on those
+            candidates = [
+                (aspect_key, aspect) for aspect_key, aspect in entry.aspects.items()
+                if aspect_patterns[-1] in aspect_key
+            ]
             for pattern in aspect_patterns:
-                for aspect_key, aspect in entry.aspects.items():
-                    if pattern in aspect_key and hasattr(aspect, 'data'):
-                        logger.debug(f"Found aspect for column {column_name}: {aspect_key}")
-                        logger.debug(f"Aspect data: {aspect.data}")
+                for aspect_key, aspect in candidates:
+                    if pattern in aspect_key:
+                        logger.debug("Found aspect for column %s: %s", column_name, aspect_key)
+                        logger.debug("Aspect data: %s", aspect.data)
                         if aspect.data and isinstance(aspect.data, dict) and "contents" in aspect.data:
                             return aspect.data["contents"]
 
-            logger.debug(f"No draft description found for column {column_name}")
+            logger.debug("No draft description found for column %s", column_name)
             return None
         except Exception as e:
-            logger.error(f"Error getting draft description for column {column_name} in table {table_fqn}: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Error getting draft description for column %s in table %s: %s", column_name, table_fqn, e)
             return None
 
     def reject_review_item(self, item_id: str) -> dict:
@@ -781,31 +1003,21 @@ class ReviewOperations:
             logger.info(f"Rejecting review item with ID: {item_id}")
             
             # Parse the item_id to determine if it's a table or column
-            parts = item_id.split(":")
-            if len(parts) < 2:
-                raise ValueError(f"Invalid item ID format: {item_id}")
-                
-            item_type = parts[0]
+            table_fqn, column_name = self._parse_review_item_id(item_id)
             
-            if item_type == "table":
+            if column_name is None:
                 # Format: table:project.dataset.table
-                table_fqn = ":".join(parts[1:])
                 # Mark the table for regeneration
                 self._client._dataplex_ops.mark_table_for_regeneration(table_fqn)
                 return {"success": True, "message": f"Table {table_fqn} marked for regeneration"}
-            elif item_type == "column":
+            else:
                 # Format: column:project.dataset.table:column_name
-                table_fqn = parts[1]
-                column_name = parts[2]
                 # Mark the column for regeneration
                 self._client._dataplex_ops.mark_column_for_regeneration(table_fqn, column_name)
                 return {"success": True, "message": f"Column {column_name} in table {table_fqn} marked for regeneration"}
-            else:
-                raise ValueError(f"Unknown item type: {item_type}")
                 
         except Exception as e:
-            logger.error(f"Error rejecting review item: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception("Error rejecting review item: %s", e)
             return {"success": False, "error": str(e)}
             
     def edit_review_item(self, item_id: str, description: str) -> dict:
@@ -822,92 +1034,220 @@ class ReviewOperations:
             logger.info(f"Editing review item with ID: {item_id}")
             
             # Parse the item_id to determine if it's a table or column
-            parts = item_id.split(":")
-            if len(parts) < 2:
-                raise ValueError(f"Invalid item ID format: {item_id}")
-                
-            item_type = parts[0]
-            
-            if item_type == "table":
-                # Format: table:project.dataset.table
-                table_fqn = ":".join(parts[1:])
-                # Update the table draft description
-                client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-                
-                # Get the entry
-                entry = self._client._dataplex_ops._get_entry(table_fqn)
-                if not entry:
-                    raise ValueError(f"Entry not found for table: {table_fqn}")
-                
-                # Update the draft description in the entry's aspects
-                aspects = entry.aspects
-                if not aspects:
-                    aspects = {}
-                
-                # Create or update the draft description aspect
-                draft_aspect_name = constants["DATAPLEX"]["DRAFT_DESCRIPTION_ASPECT_TYPE"]
-                if draft_aspect_name not in aspects:
-                    aspects[draft_aspect_name] = struct_pb2.Struct()
-                
-                aspects[draft_aspect_name].update({"description": description})
-                
-                # Update the entry
-                update_mask = field_mask_pb2.FieldMask(paths=["aspects"])
-                request = dataplex_v1.UpdateEntryRequest(
-                    entry=entry,
-                    update_mask=update_mask
-                )
-                
-                updated_entry = client.update_entry(request=request)
-                return {"success": True, "message": f"Table {table_fqn} description updated"}
-                
-            elif item_type == "column":
-                # Format: column:project.dataset.table:column_name
-                table_fqn = parts[1]
-                column_name = parts[2]
-                
-                # Update the column draft description
-                client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
-                
-                # Get the entry
-                entry = self._client._dataplex_ops._get_entry(table_fqn)
-                if not entry:
-                    raise ValueError(f"Entry not found for table: {table_fqn}")
-                
-                # Update the draft description in the entry's aspects
-                aspects = entry.aspects
-                if not aspects:
-                    aspects = {}
-                
-                # Create or update the draft column descriptions aspect
-                draft_aspect_name = constants["DATAPLEX"]["DRAFT_COLUMN_DESCRIPTIONS_ASPECT_TYPE"]
-                if draft_aspect_name not in aspects:
-                    aspects[draft_aspect_name] = struct_pb2.Struct()
-                
-                # Get existing column descriptions
-                column_descriptions = {}
-                if aspects[draft_aspect_name].fields:
-                    column_descriptions = MessageToDict(aspects[draft_aspect_name])
-                
-                # Update the specific column description
-                column_descriptions[column_name] = description
-                
-                # Update the aspect
-                aspects[draft_aspect_name].update(column_descriptions)
-                
-                # Update the entry
-                update_mask = field_mask_pb2.FieldMask(paths=["aspects"])
-                request = dataplex_v1.UpdateEntryRequest(
-                    entry=entry,
-                    update_mask=update_mask
-                )
-                
-                updated_entry = client.update_entry(request=request)
-                return {"success": True, "message": f"Column {column_name} in table {table_fqn} description updated"}
+            table_fqn, column_name = self._parse_review_item_id(item_id)
+
+            # Skip the write when the stored draft is unchanged. The entry is
+            # read fresh, other writers do not clear the entry cache
+            entry_name = self._entry_name_for(table_fqn)
+            self._invalidate_entry(entry_name)
+            entry = self._get_entry(entry_name, self._aspect_type)
+            if column_name is None:
+                aspect_name, aspect_path = self._table_aspect_name, ""
             else:
-                raise ValueError(f"Unknown item type: {item_type}")
-                
+                aspect_name, aspect_path = self._column_aspect_name(column_name), f"Schema.{column_name}"
+            aspect = entry.aspects.get(aspect_name)
+            if aspect is not None and aspect.path == aspect_path:
+                fields = dataplex_v1.Aspect.pb(aspect).data.fields
+                if "contents" in fields and fields["contents"].string_value == description:
+                    return {"success": True, "message": "no change", "skipped": True}
+
+            # The draft is the 'contents' of the wizard aspect; the update is
+            # sent on a new entry so the cached one is never modified
+            self._update_wizard_aspects(table_fqn, {column_name: {"contents": description}})
+            if column_name is None:
+                return {"success": True, "message": f"Table {table_fqn} description updated"}
+            return {"success": True, "message": f"Column {column_name} in table {table_fqn} description updated"}
+
         except Exception as e:
-            logger.error(f"Error editing review item: {str(e)}")
-            logger.error(traceback.format_exc())
-            return {"success": False, "error": str(e)} 
\ No newline at end of file
+            logger.exception("Error editing review item: %s", e)
+            return {"success": False, "error": str(e)}
+
+    def _parse_review_item_id(self, item_id: str):
+        """Split a review item ID into its table and column.
+
+        Args:
+            item_id (str): 'table:project.dataset.table' or
+                'column:project.dataset.table:column_name'
+
+        Returns:
+            tuple: The table FQN and the column name, None for table items
+
+        Raises:
+            ValueError: If the ID format is not recognized
+        """
+        match = _REVIEW_ITEM_ID_RE.match(item_id)
+        if match is None:
+            raise ValueError(f"Invalid item ID format: {item_id}")
+        if match.group("table_fqn") is not None:
+            return match.group("table_fqn"), None
+        return match.group("column_table_fqn"), match.group("column_name")
+
+    def _update_wizard_aspects(self, table_fqn: str, updates_by_column: dict):
+        """Update several wizard aspects of a table with a single UpdateEntry call.
+
+        Args:
+            table_fqn (str): The fully qualified name of the table
+            updates_by_column (dict): Aspect data updates keyed by column name,
+                with None as the key of the table-level aspect
+
+        Raises:
+            Exception: If the entry cannot be read or updated
+        """
+        client = self._catalog_client
+        entry_name = self._entry_name_for(table_fqn)
+        # Read the entry fresh, the stored aspects are written back whole
+        self._invalidate_entry(entry_name)
+        entry = self._get_entry(entry_name, self._aspect_type)
+        generation_date = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        new_entry = dataplex_v1.Entry()
+        new_entry.name = entry.name
+        aspect_keys = []
+        for column_name, update_data in updates_by_column.items():
+            new_aspect = dataplex_v1.Aspect()
+            new_aspect.aspect_type = self._aspect_type
+            if column_name is None:
+                aspect_name = self._table_aspect_name
+                aspect_path = ""
+            else:
+                aspect_name = self._column_aspect_name(column_name)
+                aspect_path = f"Schema.{column_name}"
+                new_aspect.path = aspect_path
+
+            update_data = {"generation-date": generation_date, **update_data}
+            existing_aspect = entry.aspects.get(aspect_name)
+            if existing_aspect is not None and existing_aspect.path == aspect_path:
+                # Copy the stored data, the entry may be shared through the cache
+                data_struct = struct_pb2.Struct()
+                data_struct.CopyFrom(dataplex_v1.Aspect.pb(existing_aspect).data)
+                data_struct.update(update_data)
+                new_aspect.data = data_struct
+            else:
+                aspect_data = {
+                    "certified": "false",
+                    "user-who-certified": "",
+                    "contents": "",
+                    "to-be-regenerated": False,
+                    "human-comments": [],
+                    "negative-examples": [],
+                    "external-document-uri": ""
+                }
+                aspect_data.update(update_data)
+                data_struct = struct_pb2.Struct()
+                data_struct.update(aspect_data)
+                new_aspect.data = data_struct
+
+            new_entry.aspects[aspect_name] = new_aspect
+            aspect_keys.append(aspect_name)
+
+        request = dataplex_v1.UpdateEntryRequest(
+            entry=new_entry,
+            update_mask=_ASPECTS_FIELD_MASK,
+            allow_missing=False,
+            aspect_keys=aspect_keys
+        )
+        try:
+            client.update_entry(request=request)
+        finally:
+            # Also after a failed write, so the next read sees what is stored
+            self._invalidate_entry(entry_name)
+        logger.info("Updated %d aspects of table %s", len(aspect_keys), table_fqn)
+
+    def _apply_bulk_updates(self, updates) -> dict:
+        """Apply aspect updates for many review items, one UpdateEntry per table.
+
+        Items are taken in batches of _BULK_BATCH_SIZE that run one after the
+        other. Within a batch the updates are grouped by table and the tables
+        are updated concurrently.
+
+        Args:
+            updates (iterable): (item_id, aspect data update) pairs
+
+        Returns:
+            dict: Result of the operation keyed by item ID
+        """
+        results = {}
+        updates = iter(updates)
+        while True:
+            batch = list(itertools.islice(updates, _BULK_BATCH_SIZE))
+            if not batch:
+                break
+
+            updates_by_table = collections.defaultdict(dict)
+            item_ids_by_table = collections.defaultdict(list)
+            for item_id, update_data in batch:
+                try:
+                    table_fqn, column_name = self._parse_review_item_id(item_id)
+                except ValueError as e:
+                    results[item_id] = {"success": False, "error": str(e)}
+                    continue
+                updates_by_table[table_fqn].setdefault(column_name, {}).update(update_data)
+                item_ids_by_table[table_fqn].append(item_id)
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=_BULK_MAX_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._update_wizard_aspects, table_fqn, updates_by_column): table_fqn
+                    for table_fqn, updates_by_column in updates_by_table.items()
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    table_fqn = futures[future]
+                    try:
+                        future.result()
+                        result = {"success": True}
+                    except Exception as e:
+                        logger.error("Error updating review items of table %s: %s", table_fqn, e)
+                        result = {"success": False, "error": str(e)}
+                    for item_id in item_ids_by_table[table_fqn]:
+                        results[item_id] = result
+        return results
+
+    def bulk_reject_review_items(self, item_ids: list) -> dict:
+        """Reject several review items, marking them for regeneration.
+
+        Items of the same table are written with a single UpdateEntry call.
+
+        Args:
+            item_ids (list): The IDs of the review items to reject
+
+        Returns:
+            dict: Overall success and the result of each item
+        """
+        logger.info("Rejecting %d review items", len(item_ids))
+        results = self._apply_bulk_updates(
+            (item_id, {"to-be-regenerated": True}) for item_id in item_ids
+        )
+        return {
+            "success": all(result["success"] for result in results.values()),
+            "results": results
+        }
+
+    def bulk_edit_review_items(self, items: list) -> dict:
+        """Edit the draft descriptions of several review items.
+
+        Items of the same table are written with a single UpdateEntry call.
+
+        Malformed items are not sent to Dataplex and get a failed result,
+        keyed by their ID or, without one, by their position in the list.
+
+        Args:
+            items (list): Dicts with the review item 'id' and its new 'description'
+
+        Returns:
+            dict: Overall success and the result of each item
+        """
+        logger.info("Editing %d review items", len(items))
+        results = {}
+        updates = []
+        for index, item in enumerate(items):
+            item_id = item.get("id") if isinstance(item, dict) else None
+            if not isinstance(item_id, str):
+                results[f"#{index}"] = {"success": False, "error": "Item has no 'id'"}
+            elif not isinstance(item.get("description"), str):
+                results[item_id] = {"success": False, "error": "Item has no 'description'"}
+            else:
+                updates.append((item_id, {"contents": item["description"]}))
+        results.update(self._apply_bulk_updates(updates))
+        return {
+            "success": all(result["success"] for result in results.values()),
+            "results": results
+        }
@@ -18,9 +18,14 @@ limitations under the License.
 """
 # Standard library imports
 import logging
-import toml
-import pkgutil
 import random
+import csv
+import urllib.parse
+import time
+import threading
+import concurrent.futures
+import asyncio
+import functools
 
 # Cloud imports
 from google.cloud import storage
@@ -28,20 +33,85 @@ from google.cloud import dataplex_v1
 import google.api_core.exceptions
 
 # Local imports
-from .prompt_manager import PromtType, PromptManager
+from .prompt_manager import format_prompt
 
 # Load constants
-constants = toml.loads(pkgutil.get_data(__name__, "constants.toml").decode())
+from ._constants import (
+    constants,
+    AI_WARNING,
+    NUM_ROWS_TO_SAMPLE,
+    ASPECT_TEMPLATE_NAME,
+    STRATEGY_NAIVE,
+    STRATEGY_DOCUMENTED,
+    STRATEGY_DOCUMENTED_THEN_REST,
+    STRATEGY_RANDOM,
+    STRATEGY_ALPHABETICAL,
+)
 # Logger
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(constants["LOGGING"]["WIZARD_LOGGER"])
 
+# Dataset table listings are reused across runs started shortly after each other
+_TABLE_LIST_CACHE_TTL_SECONDS = 300
+_TABLE_LIST_CACHE_MAX_SIZE = 1024
+# Parsed documentation CSVs, read once per DOCUMENTED_THEN_REST or regeneration run
+_DOCUMENTATION_CACHE_TTL_SECONDS = 300
+_DOCUMENTATION_CACHE_MAX_SIZE = 32
+# Table context shared by the table and column generation of the same table
+_TABLE_CONTEXT_CACHE_TTL_SECONDS = 60
+_TABLE_CONTEXT_CACHE_MAX_SIZE = 256
+# Largest page Dataplex search accepts, the default is 10 results per page
+_SEARCH_PAGE_SIZE = 1000
+_REGENERATION_QUERY_TEMPLATE = (
+    "system=BIGQUERY AND parent:{project_id}.{dataset_id} and "
+    f"aspect:global.{ASPECT_TEMPLATE_NAME}.to-be-regenerated=true"
+)
+
 class TableOperations:
     """Table-specific operations."""
 
     def __init__(self, client):
         """Initialize with reference to main client."""
         self._client = client
+        self._table_list_cache = {}
+        self._documentation_cache = {}
+        self._table_context_cache = {}
+        self._cache_lock = threading.Lock()
+
+    def _get_cached(self, cache, key, ttl_seconds, max_size, load):
+        """Returns a cached value, loading and storing it when missing or expired.
+
+        Args:
+            cache: The dict holding (timestamp, value) pairs
+            key: The key of the value
+            ttl_seconds: How long a stored value stays valid
+            max_size: The maximum number of values kept in the cache
+            load: Callable taking the key and returning a fresh value
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        with self._cache_lock:
+            cached = cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl_seconds:
+            return cached[1]
+
+        value = load(key)
+        now = time.monotonic()
+        with self._cache_lock:
+            if len(cache) >= max_size:
+                for stale_key in [stale_key for stale_key, stored in cache.items()
+                                  if now - stored[0] >= ttl_seconds]:
+                    del cache[stale_key]
+                if len(cache) >= max_size:
+                    del cache[next(iter(cache))]
+            cache[key] = (now, value)
+        return value
+
+    @functools.cached_property
+    def _storage_client(self):
+        """Cloud Storage client, created on first use and reused afterwards."""
+        return storage.Client()
 
     def regenerate_dataset_tables_descriptions(self, dataset_fqn, strategy="NAIVE", documentation_csv_uri=None):
         """Regenerates metadata on the tables of a whole dataset."""
@@ -64,77 +134,91 @@ class TableOperations:
         Raises:
             NotFound: If the specified table does not exist.
         """
-        logger.info(f"Generating metadata for dataset {dataset_fqn}")
-        logger.info(f"Settings: {self._client._client_options}")
+        logger.info("Generating metadata for dataset %s", dataset_fqn)
+        logger.info("Settings: %s", self._client._client_options)
         try:
-            logger.info(f"Strategy received: {strategy}")
-            logger.info(f"Available strategies: {constants['GENERATION_STRATEGY']}")
+            logger.info("Strategy received: %s", strategy)
+            logger.debug("Available strategies: %s", constants["GENERATION_STRATEGY"])
             
             # Validate strategy exists
             if strategy not in constants["GENERATION_STRATEGY"]:
                 raise ValueError(f"Invalid strategy: {strategy}. Valid strategies are: {list(constants['GENERATION_STRATEGY'].keys())}")
             
             int_strategy = constants["GENERATION_STRATEGY"][strategy]
-            logger.info(f"Strategy value: {int_strategy}")
+            logger.info("Strategy value: %s", int_strategy)
 
-            if int_strategy not in constants["GENERATION_STRATEGY"].values():
-                raise ValueError(f"Invalid strategy: {strategy}.")
-            
-            if int_strategy == constants["GENERATION_STRATEGY"]["DOCUMENTED"]:
+            # Both documented strategies read the CSV, check for it before listing the dataset
+            if int_strategy in (STRATEGY_DOCUMENTED, STRATEGY_DOCUMENTED_THEN_REST):
                 if documentation_csv_uri is None:
-                    raise ValueError("A documentation URI is required for the DOCUMENTED strategy.")
+                    raise ValueError(f"A documentation URI is required for the {strategy} strategy.")
+
+            regenerate = self._client._client_options._regenerate
 
-            if self._client._client_options._regenerate:
+            if regenerate:
                 tables = self._list_tables_in_dataset_for_regeneration(dataset_fqn)
-                logger.debug(f"Tables to regenerate: {tables}")
+                logger.debug("Tables to regenerate: %s", tables)
             else:
                 tables = self._list_tables_in_dataset(dataset_fqn)
-                logger.debug(f"Tables to generate: {tables}")
-                
-            if int_strategy == constants["GENERATION_STRATEGY"]["DOCUMENTED"]:
-                tables_from_uri = self._get_tables_from_uri(documentation_csv_uri)
-                if not self._client._client_options._regenerate:
+                logger.debug("Tables to generate: %s", tables)
+            tables_set = set(tables)
+
+            if int_strategy in (STRATEGY_DOCUMENTED, STRATEGY_DOCUMENTED_THEN_REST):
+                # A table listed twice in the CSV is generated once, with its last document
+                tables_from_uri = list({table[0]: table for table in self._get_tables_from_uri(documentation_csv_uri)}.values())
+                tables_from_uri_first_elements = {table[0] for table in tables_from_uri}
+                if not regenerate:
                     for table in tables_from_uri:
-                        if table[0] not in tables:
+                        if table[0] not in tables_set:
                             raise ValueError(f"Table {table} not found in dataset {dataset_fqn}.")
-                        self.generate_table_description(table[0], table[1])
-                if self._client._client_options._regenerate:
-                    tables_from_uri_first_elements = [table[0] for table in tables_from_uri]
+                    tables_to_generate = tables_from_uri
+                else:
+                    # The regeneration listing already searches on the to-be-regenerated
+                    # flag, so there is no need to check each table again
                     for table in tables:
-                        if self._check_if_table_should_be_regenerated(table):
-                            if table not in tables_from_uri_first_elements:
-                                raise ValueError(f"Table {table} not found in documentation")
-                            self.generate_table_description(table)
-
-            if int_strategy == constants["GENERATION_STRATEGY"]["DOCUMENTED_THEN_REST"]:
-                tables_from_uri = self._get_tables_from_uri(documentation_csv_uri)
-                if not self._client._client_options._regenerate:
-                    for table in tables_from_uri:
-                        if table not in tables:
-                            raise ValueError(f"Table {table} not found in dataset {dataset_fqn}.")
-                        self.generate_table_description(table[0], table[1])
-                tables_from_uri_first_elements = [table[0] for table in tables_from_uri]
-                if self._client._client_options._regenerate:
-                    for table in tables:
-                        if self._check_if_table_should_be_regenerated(table):
-                            if table not in tables_from_uri_first_elements:
-                                raise ValueError(f"Table {table} not found in documentation")
-                            self.generate_table_description(table)
-                for table in tables:
-                    if table not in tables_from_uri_first_elements:
-                        self.generate_table_description(table)
+                        if table not in tables_from_uri_first_elements:
+                            raise ValueError(f"Table {table} not found in documentation")
+                    tables_to_generate = [(table, None) for table in tables]
+
+                if int_strategy == STRATEGY_DOCUMENTED_THEN_REST:
+                    # The documented tables and the rest do not overlap, so both
+                    # phases share one pass over the thread pool
+                    tables_to_generate = tables_to_generate + [
+                        (table, None) for table in tables if table not in tables_from_uri_first_elements
+                    ]
+                self._generate_tables_descriptions(
+                    lambda table: self.generate_table_description(table[0], table[1]), tables_to_generate
+                )
             
-            if int_strategy in [constants["GENERATION_STRATEGY"]["NAIVE"], constants["GENERATION_STRATEGY"]["RANDOM"], constants["GENERATION_STRATEGY"]["ALPHABETICAL"]]:
-                tables_sorted = self._order_tables_to_strategy(tables, int_strategy)
-                for table in tables_sorted:
-                    self.generate_table_description(table)
+            if int_strategy in (STRATEGY_NAIVE, STRATEGY_RANDOM, STRATEGY_ALPHABETICAL):
+                tables_sorted = self._order_tables_to_strategy(tables, int_strategy, mutable=True)
+                self._generate_tables_descriptions(self.generate_table_description, tables_sorted)
 
         except Exception as e:
             logger.error(f"Exception: {e}.")
             raise e
 
-    def generate_table_description(self, table_fqn, documentation_uri=None, human_comments=None):
-        """Generates metadata for a table.
+    async def generate_dataset_tables_descriptions_async(self, dataset_fqn, strategy="NAIVE", documentation_csv_uri=None):
+        """Generates metadata on the tables of a whole dataset without blocking the event loop.
+
+        The BigQuery client has no asyncio API and the Vertex AI calls are
+        synchronous, so the run happens on a worker thread. Tables are still
+        generated concurrently on the thread pool sized by max_workers.
+
+        Args:
+            dataset_fqn: The fully qualified name of the dataset
+            (e.g., 'project.dataset')
+            strategy: The strategy to use for generation
+            documentation_csv_uri: Optional URI to documentation CSV
+
+        Returns:
+            None.
+        """
+        return await asyncio.to_thread(
+            self.generate_dataset_tables_descriptions, dataset_fqn, strategy, documentation_csv_uri
+        )
+
+    async def generate_table_description_async(self, table_fqn, documentation_uri=None, human_comments=None):
+        """Generates metadata for a table without blocking the event loop.
 
         Args:
             table_fqn: The fully qualified name of the table
@@ -142,76 +226,318 @@ class TableOperations:
             human_comments: Optional human comments to consider
 
         Returns:
-            str: Success message if description was generated
+            dict: The outcome of the generation
+        """
+        return await asyncio.to_thread(
+            self.generate_table_description, table_fqn, documentation_uri, human_comments
+        )
+
+    async def generate_tables_descriptions_async(self, table_fqns):
+        """Generates metadata for a list of tables with overlapping requests.
+
+        At most max_workers tables are in flight at once, so concurrent
+        generate_content calls stay within the Vertex AI quota.
+
+        Args:
+            table_fqns: The fully qualified names of the tables
+
+        Returns:
+            list: The outcome of the generation of each table, in the given order
 
         Raises:
-            NotFound: If the specified table does not exist.
+            Exception: The first error raised while generating a description,
+                once every table has been processed.
         """
-        logger.info(f"Generating metadata for table {table_fqn}.")
-        
-        self._client._bigquery_ops.table_exists(table_fqn)
-        # Get base information
-        logger.info(f"Getting schema for table {table_fqn}.")
-        table_schema_str, _ = self._client._bigquery_ops.get_table_schema(table_fqn)
-        logger.info(f"Getting sample for table {table_fqn}.")
-        table_sample = self._client._bigquery_ops.get_table_sample(
-            table_fqn, constants["DATA"]["NUM_ROWS_TO_SAMPLE"]
+        semaphore = asyncio.Semaphore(self._client._client_options._max_workers)
+
+        async def generate(table_fqn):
+            async with semaphore:
+                return await self.generate_table_description_async(table_fqn)
+
+        results = await asyncio.gather(
+            *(generate(table_fqn) for table_fqn in table_fqns), return_exceptions=True
         )
-        # Get additional information
-        logger.info(f"Getting table quality for table {table_fqn}.")
-        table_quality = self._get_table_quality(
-            self._client._client_options._use_data_quality, table_fqn
+        failures = [result for result in results if isinstance(result, Exception)]
+        if failures:
+            logger.error("Generation failed for %d of %d tables.", len(failures), len(results))
+            raise failures[0]
+        return results
+
+    def _gather(self, funcs):
+        """Runs independent calls concurrently.
+
+        Args:
+            funcs: Callables without arguments
+
+        Returns:
+            list: The results of the callables, in the order they were given
+
+        Raises:
+            Exception: The first error raised by a callable, in the given order.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(funcs)) as executor:
+            futures = [executor.submit(func) for func in funcs]
+            return [future.result() for future in futures]
+
+    def _get_table_context(self, table_fqn):
+        """Gets the metadata both table and column prompts are built from.
+
+        Generating the columns of a table right after its description reuses
+        the same context instead of fetching it again.
+
+        Args:
+            table_fqn: The fully qualified name of the table
+            (e.g., 'project.dataset.table')
+
+        Returns:
+            dict: The table schema string and fields, sample, quality,
+                profile and lineage information
+        """
+        options = self._client._client_options
+        key = (
+            table_fqn,
+            options._use_data_quality,
+            options._use_profile,
+            options._use_lineage_tables,
+            options._use_lineage_processes,
         )
-        logger.info(f"Getting table profile for table {table_fqn}.")
-        table_profile = self._get_table_profile(
-            self._client._client_options._use_profile, table_fqn
+        return self._get_cached(
+            self._table_context_cache, key,
+            _TABLE_CONTEXT_CACHE_TTL_SECONDS, _TABLE_CONTEXT_CACHE_MAX_SIZE,
+            lambda key: self._collect_table_context(table_fqn),
         )
+
+    def _invalidate_table_context(self, table_fqn):
+        """Drops the cached context of a table after its schema has been changed."""
+        with self._cache_lock:
+            for key in [key for key in self._table_context_cache if key[0] == table_fqn]:
+                del self._table_context_cache[key]
+
+    def _collect_table_context(self, table_fqn):
+        """Fetches the table context, bypassing the cache.
+
+        Args:
+            table_fqn: The fully qualified name of the table
+            (e.g., 'project.dataset.table')
+
+        Returns:
+            dict: The table schema string and fields, sample, quality,
+                profile and lineage information
+        """
+        # The metadata below comes from independent BigQuery, Dataplex and
+        # lineage calls, so fetch it concurrently
+        logger.info(f"Getting schema, sample, quality, profile and lineage for table {table_fqn}.")
+        use_profile = self._client._client_options._use_profile
+        use_data_quality = self._client._client_options._use_data_quality
+        (
+            (table_schema_str, table_schema),
+            table_sample,
+            profile_quality,
+            table_sources_info,
+            job_sources_info,
+        ) = self._gather([
+            lambda: self._client._bigquery_ops.get_table_schema(table_fqn),
+            lambda: self._client._bigquery_ops.get_table_sample(
+                table_fqn, NUM_ROWS_TO_SAMPLE
+            ),
+            # Profile and quality come from the same data scan jobs, read them once
+            lambda: self._client._dataplex_ops.get_table_profile_quality(
+                use_profile or use_data_quality, table_fqn
+            ),
+            lambda: self._get_table_sources_info_or_none(table_fqn),
+            lambda: self._get_job_sources_or_none(table_fqn),
+        ])
+        table_profile = profile_quality["data_profile"] if use_profile else None
+        table_quality = profile_quality["data_quality"] if use_data_quality else None
+        return {
+            "table_schema_str": table_schema_str,
+            "table_schema": table_schema,
+            "table_sample": table_sample,
+            "table_quality": table_quality,
+            "table_profile": table_profile,
+            "table_sources_info": table_sources_info,
+            "job_sources_info": job_sources_info,
+        }
+
+    def _get_table_sources_info_or_none(self, table_fqn):
+        """Gets the source tables info, or None if lineage cannot be read."""
         try:
             logger.info(f"Getting source tables for table {table_fqn}.")
-            table_sources_info = self._get_table_sources_info(
+            return self._get_table_sources_info(
                 self._client._client_options._use_lineage_tables, table_fqn
             )
         except Exception as e:
             logger.error(f"Error getting table sources info for table {table_fqn}: {e}")
-            table_sources_info = None
+            return None
+
+    def _get_job_sources_or_none(self, table_fqn):
+        """Gets the info of the jobs calculating the table, or None if lineage cannot be read."""
         try:
             logger.info(f"Getting jobs calculating for table {table_fqn}.")
-            job_sources_info = self._get_job_sources(
+            return self._get_job_sources(
                 self._client._client_options._use_lineage_processes, table_fqn
             )
         except Exception as e:
             logger.error(f"Error getting job sources info for table {table_fqn}: {e}")
-            job_sources_info = None
+            return None
+
+    def _generate_tables_descriptions(self, generate, tables):
+        """Generates the descriptions of several tables concurrently.
+
+        Generation is bound by BigQuery, Dataplex and Vertex AI round-trips,
+        so the tables are processed on a thread pool sized by the
+        max_workers client option. A failing table does not stop the others.
+
+        Args:
+            generate: Callable that generates the description of one table
+            tables: The tables to pass to generate, one call each
+
+        Raises:
+            Exception: The first error raised while generating a description,
+                once every table has been processed.
+        """
+        failures = []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._client._client_options._max_workers
+        ) as executor:
+            futures = {executor.submit(generate, table): table for table in tables}
+            for done, future in enumerate(concurrent.futures.as_completed(futures), start=1):
+                table = futures[future]
+                try:
+                    future.result()
+                    logger.info("Generated table %d of %d: %s", done, len(futures), table)
+                except Exception as e:
+                    logger.error("Generation failed for table %s: %s", table, e)
+                    failures.append(e)
+        if failures:
+            logger.error("Generation failed for %d of %d tables.", len(failures), len(futures))
+            raise failures[0]
+
+    def generate_tables_descriptions(self, table_fqns):
+        """Generates metadata for a list of tables.
+
+        When the batch_staging_uri client option is set and there are at least
+        LLM.BATCH_MIN_PROMPTS tables, all prompts go to Vertex AI in one batch
+        prediction job, which is billed at a lower rate than online requests.
+        Otherwise every table is generated with its own request.
+
+        Args:
+            table_fqns: The fully qualified names of the tables
+
+        Returns:
+            list: The outcome of the generation of each table, in the given order
+
+        Raises:
+            Exception: The first error raised while generating a description,
+                once every table has been processed.
+        """
+        staging_uri = self._client._client_options._batch_staging_uri
+        if not staging_uri or len(table_fqns) < constants["LLM"]["BATCH_MIN_PROMPTS"]:
+            results = {}
+
+            def generate(table_fqn):
+                results[table_fqn] = self.generate_table_description(table_fqn)
+
+            self._generate_tables_descriptions(generate, table_fqns)
+            return [results[table_fqn] for table_fqn in table_fqns]
+
+        logger.info("Generating metadata for %d tables with batch prediction.", len(table_fqns))
+        prompts = {}
+
+        def build(table_fqn):
+            prompts[table_fqn] = self._build_table_description_prompt(table_fqn)
 
+        self._generate_tables_descriptions(build, table_fqns)
+        table_descriptions = dict(zip(
+            table_fqns,
+            self._client._utils.batch_llm_inference(
+                [prompts[table_fqn] for table_fqn in table_fqns], staging_uri
+            ),
+        ))
+        results = {}
+
+        def persist(table_fqn):
+            table_description = table_descriptions[table_fqn]
+            if table_description is None:
+                raise RuntimeError(f"Batch prediction returned no description for table {table_fqn}.")
+            results[table_fqn] = self._persist_table_description(table_fqn, table_description)
+
+        self._generate_tables_descriptions(persist, table_fqns)
+        return [results[table_fqn] for table_fqn in table_fqns]
+
+    def generate_table_description(self, table_fqn, documentation_uri=None, human_comments=None):
+        """Generates metadata for a table.
+
+        Args:
+            table_fqn: The fully qualified name of the table
+            documentation_uri: Optional URI to documentation
+            human_comments: Optional human comments to consider
+
+        Returns:
+            str: Success message if description was generated
+
+        Raises:
+            NotFound: If the specified table does not exist.
+        """
+        logger.info(f"Generating metadata for table {table_fqn}.")
         if documentation_uri == "":
             documentation_uri = None
-            
+        table_description_prompt_expanded = self._build_table_description_prompt(table_fqn, human_comments)
+        table_description = self._client._utils.llm_inference(table_description_prompt_expanded, documentation_uri)
+        return self._persist_table_description(table_fqn, table_description)
+
+    def _build_table_description_prompt(self, table_fqn, human_comments=None):
+        """Builds the expanded table description prompt of a table.
+
+        Args:
+            table_fqn: The fully qualified name of the table
+            human_comments: Optional human comments to consider
+
+        Returns:
+            str: The prompt to send to the LLM
+
+        Raises:
+            NotFound: If the specified table does not exist.
+        """
+        self._client._bigquery_ops.table_exists(table_fqn)
+        fetch_human_comments = self._client._client_options._use_human_comments and human_comments is None
+        context, table_comment = self._gather([
+            lambda: self._get_table_context(table_fqn),
+            lambda: self._client._dataplex_ops.get_table_comment(table_fqn) if fetch_human_comments else None,
+        ])
+
         # Get human comments if enabled
-        if self._client._client_options._use_human_comments and human_comments is None:
-            logger.info(f"Getting human comments for table {table_fqn}.")
-            human_comments = self._client._dataplex_ops.get_table_comment(table_fqn)
+        if fetch_human_comments:
+            human_comments = table_comment
 
         # Get prompt
-        prompt_manager = PromptManager(
-            PromtType.PROMPT_TYPE_TABLE, self._client._client_options
-        )
-        table_description_prompt = prompt_manager.get_promtp()
-        
+        table_description_prompt = self._client._table_prompt_mgr.get_promtp()
+
         # Format prompt
-        table_description_prompt_expanded = table_description_prompt.format(
+        return format_prompt(
+            table_description_prompt,
             table_fqn=table_fqn,
-            table_schema_str=table_schema_str,
-            table_sample=table_sample,
-            table_profile=table_profile,
-            table_quality=table_quality,
-            table_sources_info=table_sources_info,
-            job_sources_info=job_sources_info,
+            table_schema_str=context["table_schema_str"],
+            table_sample=context["table_sample"],
+            table_profile=context["table_profile"],
+            table_quality=context["table_quality"],
+            table_sources_info=context["table_sources_info"],
+            job_sources_info=context["job_sources_info"],
             human_comments=human_comments
         )
 
-        table_description = self._client._utils.llm_inference(table_description_prompt_expanded, documentation_uri)
+    def _persist_table_description(self, table_fqn, table_description):
+        """Writes a generated table description according to the client options.
+
+        Args:
+            table_fqn: The fully qualified name of the table
+            table_description: The description returned by the LLM
+
+        Returns:
+            dict: The outcome of the generation
+        """
         if self._client._client_options._add_ai_warning:
-            table_description = f"{constants['OUTPUT_CLAUSES']['AI_WARNING']}{table_description}"
+            table_description = f"{AI_WARNING}{table_description}"
         
         # Update table
         # If we are not staging for review, we update the table in BigQuery and Dataplex catalog
@@ -223,10 +549,10 @@ class TableOperations:
             
         else:
             # If we are staging for review, we update the table in Dataplex catalog
-            if not self._client._dataplex_ops._check_if_exists_aspect_type(constants["ASPECT_TEMPLATE"]["name"]):
-                logger.info(f"Aspect type {constants['ASPECT_TEMPLATE']['name']} not exists. Attempting to create it")
-                self._client._dataplex_ops._create_aspect_type(constants["ASPECT_TEMPLATE"]["name"])
-                logger.info(f"Aspect type {constants['ASPECT_TEMPLATE']['name']} created")
+            if not self._client._dataplex_ops._check_if_exists_aspect_type(ASPECT_TEMPLATE_NAME):
+                logger.info(f"Aspect type {ASPECT_TEMPLATE_NAME} not exists. Attempting to create it")
+                self._client._dataplex_ops._create_aspect_type(ASPECT_TEMPLATE_NAME)
+                logger.info(f"Aspect type {ASPECT_TEMPLATE_NAME} created")
             self._client._dataplex_ops.update_table_draft_description(table_fqn, table_description)
             logger.info(f"Table {table_fqn} will not be updated in BigQuery.")
         # If we were regenerating a table, we mark it as regerated
@@ -255,52 +581,70 @@ class TableOperations:
         Raises:
             Exception: If there is an error reading the CSV file.
         """
-        try:
-            # Create a client to interact with Google Cloud Storage
-            storage_client = storage.Client()
-
-            # Get the bucket and blob names from the URI
-            bucket_name, blob_name = documentation_csv_uri.split("/", 3)[2:]
+        return list(self._get_cached(
+            self._documentation_cache, documentation_csv_uri,
+            _DOCUMENTATION_CACHE_TTL_SECONDS, _DOCUMENTATION_CACHE_MAX_SIZE,
+            self._get_tables_from_uri_uncached,
+        ))
 
-            # Get the bucket and blob objects
-            bucket = storage_client.get_bucket(bucket_name)
-            blob = bucket.blob(blob_name)
+    def _get_tables_from_uri_uncached(self, documentation_csv_uri):
+        """Reads the CSV file from Google Cloud Storage, bypassing the cache.
 
-            # Download the CSV file as a string
-            csv_data = blob.download_as_text()
-
-            # Split the CSV data into lines
-            lines = csv_data.split("\n")
+        Args:
+            documentation_csv_uri: The URI of the CSV file in Google Cloud Storage.
 
-            # Remove any empty lines
-            lines = [line for line in lines if line.strip()]
+        Returns:
+            A list of tables.
 
-            # Extract the table names from the lines
-            tables = [(line.split(",")[0], line.split(",")[1].strip()) for line in lines]
-            for table in tables:
-                logger.info(f"Table: {table[0]} doc: {table[1]}")
+        Raises:
+            Exception: If there is an error reading the CSV file.
+        """
+        try:
+            storage_client = self._storage_client
+
+            # Get the bucket and blob names from the gs:// URI
+            parsed_uri = urllib.parse.urlparse(documentation_csv_uri)
+            bucket_name, blob_name = parsed_uri.netloc, parsed_uri.path.lstrip("/")
+
+            # Reference the blob directly, reading it fails the same way if it does not exist
+            blob = storage_client.bucket(bucket_name).blob(blob_name)
+
+            # Stream the CSV file and extract the table names, skipping empty lines
+            with blob.open("rt", newline="") as csv_file:
+                tables = [
+                    (row[0], row[1].strip())
+                    for row in csv.reader(csv_file)
+                    if any(field.strip() for field in row)
+                ]
+            logger.info(f"Read {len(tables)} documented tables from {documentation_csv_uri}.")
+            logger.debug(f"Documented tables: {tables}")
             return tables
         except Exception as e:
             logger.error(f"Exception: {e}.")
             raise e
 
-    def _order_tables_to_strategy(self, tables, strategy):
+    def _order_tables_to_strategy(self, tables, strategy, mutable=False):
         """Orders tables according to the specified strategy.
 
         Args:
             tables: List of table names
             strategy: Strategy to use for ordering
+            mutable: Whether tables may be reordered in place, when the
+                caller does not need the original order anymore
 
         Returns:
             Ordered list of table names
         """
-        if strategy == constants["GENERATION_STRATEGY"]["NAIVE"]:
+        if strategy == STRATEGY_NAIVE:
             return tables
-        elif strategy == constants["GENERATION_STRATEGY"]["RANDOM"]:
-            tables_copy = tables.copy()
+        elif strategy == STRATEGY_RANDOM:
+            tables_copy = tables if mutable else list(tables)
             random.shuffle(tables_copy)
             return tables_copy
-        elif strategy == constants["GENERATION_STRATEGY"]["ALPHABETICAL"]:
+        elif strategy == STRATEGY_ALPHABETICAL:
+            if mutable:
+                tables.sort()
+                return tables
             return sorted(tables)
         else:
             return tables
@@ -314,7 +658,22 @@ class TableOperations:
         Returns:
             List of table names
         """
-        client = self._client._cloud_clients[constants["CLIENTS"]["BIGQUERY"]]
+        return list(self._get_cached(
+            self._table_list_cache, dataset_fqn,
+            _TABLE_LIST_CACHE_TTL_SECONDS, _TABLE_LIST_CACHE_MAX_SIZE,
+            self._list_tables_in_dataset_uncached,
+        ))
+
+    def _list_tables_in_dataset_uncached(self, dataset_fqn):
+        """Lists all tables in a given dataset, bypassing the cache.
+
+        Args:
+            dataset_fqn: The fully qualified name of the dataset
+
+        Returns:
+            List of table names
+        """
+        client = self._client._bigquery_client
         project_id, dataset_id = self._client._utils.split_dataset_fqn(dataset_fqn)
         dataset_ref = client.dataset(dataset_id, project=project_id)
         tables = client.list_tables(dataset_ref)
@@ -330,15 +689,16 @@ class TableOperations:
             List of table names that need regeneration
         """
         try:
-            client = self._client._cloud_clients[constants["CLIENTS"]["DATAPLEX_CATALOG"]]
+            client = self._client._catalog_client
             project_id, dataset_id = self._client._utils.split_dataset_fqn(dataset_fqn)
             name = f"projects/{project_id}/locations/global"
-            query = f"""system=BIGQUERY AND parent:{project_id}.{dataset_id} and aspect:global.{constants['ASPECT_TEMPLATE']['name']}.to-be-regenerated=true"""
+            query = _REGENERATION_QUERY_TEMPLATE.format(project_id=project_id, dataset_id=dataset_id)
             logger.info(f"Query: {query}")
             
             request = dataplex_v1.SearchEntriesRequest(
                 name=name,
-                query=query
+                query=query,
+                page_size=_SEARCH_PAGE_SIZE
             )
             
             table_names = []
@@ -346,7 +706,7 @@ class TableOperations:
                 search_results = client.search_entries(request=request)
                 for result in search_results:
                     if result.dataplex_entry.fully_qualified_name.startswith("bigquery:"):
-                        table_fqn = result.dataplex_entry.fully_qualified_name.replace("bigquery:", "")
+                        table_fqn = result.dataplex_entry.fully_qualified_name.removeprefix("bigquery:")
                         table_names.append(table_fqn)
                 return table_names
             except google.api_core.exceptions.PermissionDenied:
@@ -357,34 +717,6 @@ class TableOperations:
             logger.error(f"Error listing tables in dataset {dataset_fqn}: {e}")
             raise e 
 
-    def _get_table_quality(self, use_data_quality, table_fqn):
-        """Gets the quality information for a table.
-
-        Args:
-            use_data_quality (bool): Whether to use data quality information
-            table_fqn (str): The fully qualified name of the table
-
-        Returns:
-            dict: Table quality information or None if not available/enabled
-        """
-        if not use_data_quality:
-            return None
-        return self._client._dataplex_ops.get_table_quality(use_data_quality, table_fqn)
-
-    def _get_table_profile(self, use_profile, table_fqn):
-        """Gets the profile information for a table.
-
-        Args:
-            use_profile (bool): Whether to use profile information
-            table_fqn (str): The fully qualified name of the table
-
-        Returns:
-            dict: Table profile information or None if not available/enabled
-        """
-        if not use_profile:
-            return None
-        return self._client._dataplex_ops.get_table_profile(use_profile, table_fqn)
-
     def _get_table_sources_info(self, use_lineage_tables, table_fqn):
         """Gets the source table information.
 
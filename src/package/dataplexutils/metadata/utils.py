@@ -18,28 +18,113 @@ limitations under the License.
 """
 # Standard library imports
 import re
+import hashlib
 import logging
-import toml
-import pkgutil
 import time
+import random
+import functools
+import threading
+import json
+import uuid
+import urllib.parse
 
 # Cloud imports
 import vertexai
 from vertexai.generative_models import GenerationConfig, GenerativeModel, Part
 import vertexai.preview.generative_models as generative_models
+from vertexai.batch_prediction import BatchPredictionJob
+import google.api_core.exceptions
 
 # Load constants
-constants = toml.loads(pkgutil.get_data(__name__, "constants.toml").decode())
+from ._constants import constants, AI_WARNING, PDF_MIME_TYPE
 # Logger
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(constants["LOGGING"]["WIZARD_LOGGER"])
 
+_GENERATION_CONFIG = GenerationConfig(
+    temperature=constants["LLM"]["TEMPERATURE"],
+    top_p=constants["LLM"]["TOP_P"],
+    top_k=constants["LLM"]["TOP_K"],
+    candidate_count=constants["LLM"]["CANDIDATE_COUNT"],
+    max_output_tokens=constants["LLM"]["MAX_OUTPUT_TOKENS"],
+)
+_SAFETY_SETTINGS = {
+    generative_models.HarmCategory.HARM_CATEGORY_HATE_SPEECH: generative_models.HarmBlockThreshold.BLOCK_ONLY_HIGH,
+    generative_models.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: generative_models.HarmBlockThreshold.BLOCK_ONLY_HIGH,
+    generative_models.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: generative_models.HarmBlockThreshold.BLOCK_ONLY_HIGH,
+    generative_models.HarmCategory.HARM_CATEGORY_HARASSMENT: generative_models.HarmBlockThreshold.BLOCK_ONLY_HIGH,
+}
+
+# Transient errors worth retrying, anything else fails on the first attempt
+_RETRYABLE_LLM_ERRORS = (
+    google.api_core.exceptions.ServiceUnavailable,
+    google.api_core.exceptions.ResourceExhausted,
+    google.api_core.exceptions.DeadlineExceeded,
+    google.api_core.exceptions.InternalServerError,
+    google.api_core.exceptions.Aborted,
+)
+_LLM_MAX_BACKOFF_SECONDS = 30
+_LLM_REQUEST_TIMEOUT_SECONDS = constants["LLM"]["REQUEST_TIMEOUT_SECONDS"]
+_LLM_RESPONSE_CACHE_SIZE = constants["LLM"]["RESPONSE_CACHE_SIZE"]
+# Batch prediction requests carry the same generation settings as online ones
+_BATCH_GENERATION_CONFIG = {
+    "temperature": constants["LLM"]["TEMPERATURE"],
+    "topP": constants["LLM"]["TOP_P"],
+    "topK": constants["LLM"]["TOP_K"],
+    "candidateCount": constants["LLM"]["CANDIDATE_COUNT"],
+    "maxOutputTokens": constants["LLM"]["MAX_OUTPUT_TOKENS"],
+}
+
+_TABLE_FQN_RE = re.compile(r"^([^.]+)[\.:]([^.]+)\.([^.]+)")
+_DATASET_FQN_RE = re.compile(r"^([^.]+)\.([^.]+)")
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_table_fqn(table_fqn):
+    match = _TABLE_FQN_RE.match(table_fqn)
+    return match.group(1), match.group(2), match.group(3)
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_dataset_fqn(dataset_fqn):
+    match = _DATASET_FQN_RE.match(dataset_fqn)
+    return match.group(1), match.group(2)
+
+
 class MetadataUtils:
     """Utility functions for metadata operations."""
 
     def __init__(self, client):
         """Initialize with reference to main client."""
         self._client = client
+        self._models = {}
+        self._models_lock = threading.Lock()
+        self._document_parts = {}
+        self._responses = {}
+        self._responses_lock = threading.Lock()
+
+    def _get_model(self):
+        """Returns the generative model for the current settings, creating it on first use.
+
+        Returns:
+            tuple: The GenerativeModel to send prompts to and its model name
+        """
+        if self._client._client_options._use_ext_documents:
+            model_type = constants["LLM"]["LLM_VISION_TYPE"]
+        else:
+            model_type = constants["LLM"]["LLM_TYPE"]
+        key = (self._client._project_id, self._client.llm_location, model_type)
+        with self._models_lock:
+            model = self._models.get(key)
+            if model is None:
+                vertexai.init(
+                    project=self._client._project_id,
+                    location=self._client.llm_location,
+                    request_timeout=_LLM_REQUEST_TIMEOUT_SECONDS,
+                )
+                model = GenerativeModel(model_type)
+                self._models[key] = model
+        return model, model_type
 
     def split_table_fqn(self, table_fqn):
         """Splits a fully qualified table name into its components.
@@ -55,11 +140,7 @@ class MetadataUtils:
             Exception: If the table FQN cannot be parsed correctly
         """
         try:
-            pattern = r"^([^.]+)[\.:]([^.]+)\.([^.]+)"
-            #logger.debug(f"Splitting table FQN: {table_fqn}.")
-            match = re.search(pattern, table_fqn)
-            #logger.debug(f"Found 3 groups: {match.group(1)} {match.group(2)} {match.group(3)}")
-            return match.group(1), match.group(2), match.group(3)
+            return _split_table_fqn(table_fqn)
         except Exception as e:
             logger.error(f"Exception: {e}.")
             raise e
@@ -78,9 +159,7 @@ class MetadataUtils:
             Exception: If the dataset FQN cannot be parsed correctly
         """
         try:
-            pattern = r"^([^.]+)\.([^.]+)"
-            match = re.search(pattern, dataset_fqn)
-            return match.group(1), match.group(2)
+            return _split_dataset_fqn(dataset_fqn)
         except Exception as e:
             logger.error(f"Exception: {e}.")
             raise e
@@ -97,48 +176,48 @@ class MetadataUtils:
             str: The combined description
         """
         if not new_description:
-            logger.debug(f"No new description provided, returning old description: {old_description[:50]}...")
+            logger.debug("No new description provided, returning old description: %.50s...", old_description)
             return old_description
 
+        append = constants["DESCRIPTION_HANDLING"]["APPEND"]
+        prepend = constants["DESCRIPTION_HANDLING"]["PREPEND"]
+        replace = constants["DESCRIPTION_HANDLING"]["REPLACE"]
+
         # Convert description_handling to lowercase for case-insensitive comparison
         description_handling_lower = description_handling.lower() if description_handling else ""
         
-        logger.debug(f"Combining descriptions: old_description: {old_description[:50]}...")
-        logger.debug(f"new_description: {new_description[:50]}...")
-        logger.debug(f"description_handling: {description_handling}")
-        logger.debug(f"description_handling_lower: {description_handling_lower}")
-        logger.debug(f"constants[\"DESCRIPTION_HANDLING\"][\"APPEND\"]: {constants['DESCRIPTION_HANDLING']['APPEND']}")
-        logger.debug(f"constants[\"DESCRIPTION_HANDLING\"][\"PREPEND\"]: {constants['DESCRIPTION_HANDLING']['PREPEND']}")
-        logger.debug(f"constants[\"DESCRIPTION_HANDLING\"][\"REPLACE\"]: {constants['DESCRIPTION_HANDLING']['REPLACE']}")
-
-        if description_handling_lower == constants["DESCRIPTION_HANDLING"]["APPEND"]:
-            logger.debug(f"Using APPEND strategy")
+        logger.debug("Combining descriptions: old_description: %.50s...", old_description)
+        logger.debug("new_description: %.50s...", new_description)
+        logger.debug("description_handling: %s", description_handling)
+
+        if description_handling_lower == append:
+            logger.debug("Using APPEND strategy")
             if old_description:
                 try:
                     # Try to find the AI warning prefix in old description
-                    index = old_description.index(constants['OUTPUT_CLAUSES']['AI_WARNING'])
+                    index = old_description.index(AI_WARNING)
                     # If found, replace everything after the prefix
                     result = old_description[:index] + new_description
-                    logger.debug(f"Found AI warning prefix, replacing content after prefix: {result[:50]}...")
+                    logger.debug("Found AI warning prefix, replacing content after prefix: %.50s...", result)
                     return result
                 except ValueError:
                     # If no prefix found, append normally
                     result = old_description + new_description
-                    logger.debug(f"No AI warning prefix found, appending normally: {result[:50]}...")
+                    logger.debug("No AI warning prefix found, appending normally: %.50s...", result)
                     return result
-            logger.debug(f"No old description, returning new description: {new_description[:50]}...")
+            logger.debug("No old description, returning new description: %.50s...", new_description)
             return new_description
-        elif description_handling_lower == constants["DESCRIPTION_HANDLING"]["PREPEND"]:
-            logger.debug(f"Using PREPEND strategy")
+        elif description_handling_lower == prepend:
+            logger.debug("Using PREPEND strategy")
             result = new_description + old_description
-            logger.debug(f"Prepending new description: {result[:50]}...")
+            logger.debug("Prepending new description: %.50s...", result)
             return result
-        elif description_handling_lower == constants["DESCRIPTION_HANDLING"]["REPLACE"]:
-            logger.debug(f"Using REPLACE strategy")
-            logger.debug(f"Replacing old description with new description: {new_description[:50]}...")
+        elif description_handling_lower == replace:
+            logger.debug("Using REPLACE strategy")
+            logger.debug("Replacing old description with new description: %.50s...", new_description)
             return new_description
         else:
-            logger.debug(f"No valid description handling provided, returning old description: {old_description[:50]}...")
+            logger.debug("No valid description handling provided, returning old description: %.50s...", old_description)
             return old_description
 
     def llm_inference(self, prompt, documentation_uri=None):
@@ -153,48 +232,128 @@ class MetadataUtils:
         """
         retries = 3
         base_delay = 1
+        model, model_type = self._get_model()
+        # Generation is deterministic (temperature 0), so identical prompts,
+        # e.g. boilerplate columns repeated across tables, reuse the answer
+        response_key = (
+            model_type,
+            hashlib.sha1(prompt.encode("utf-8")).hexdigest(),
+            documentation_uri,
+        )
+        with self._responses_lock:
+            response = self._responses.get(response_key)
+        if response is not None:
+            return response
+        if documentation_uri is not None:
+            # Tables documented by the same file share one Part, so every
+            # request references the document identically
+            doc = self._document_parts.get(documentation_uri)
+            if doc is None:
+                doc = Part.from_uri(
+                    documentation_uri, mime_type=PDF_MIME_TYPE
+                )
+                self._document_parts[documentation_uri] = doc
+            contents = [doc, prompt]
+            safety_settings = _SAFETY_SETTINGS
+        else:
+            contents = prompt
+            safety_settings = None
         for attempt in range(retries + 1):
             try:
-                vertexai.init(project=self._client._project_id, location=self._client.llm_location)
-                if self._client._client_options._use_ext_documents:
-                    model = GenerativeModel(constants["LLM"]["LLM_VISION_TYPE"])
-                else:
-                    model = GenerativeModel(constants["LLM"]["LLM_TYPE"])
-
-                generation_config = GenerationConfig(
-                    temperature=constants["LLM"]["TEMPERATURE"],
-                    top_p=constants["LLM"]["TOP_P"],
-                    top_k=constants["LLM"]["TOP_K"],
-                    candidate_count=constants["LLM"]["CANDIDATE_COUNT"],
-                    max_output_tokens=constants["LLM"]["MAX_OUTPUT_TOKENS"],
+                responses = model.generate_content(
+                    contents,
+                    generation_config=_GENERATION_CONFIG,
+                    safety_settings=safety_settings,
+                    stream=False,
                 )
-                safety_settings = {
-                    generative_models.HarmCategory.HARM_CATEGORY_HATE_SPEECH: generative_models.HarmBlockThreshold.BLOCK_ONLY_HIGH,
-                    generative_models.HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: generative_models.HarmBlockThreshold.BLOCK_ONLY_HIGH,
-                    generative_models.HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: generative_models.HarmBlockThreshold.BLOCK_ONLY_HIGH,
-                    generative_models.HarmCategory.HARM_CATEGORY_HARASSMENT: generative_models.HarmBlockThreshold.BLOCK_ONLY_HIGH,
-                }
-                if documentation_uri is not None:
-                    doc = Part.from_uri(
-                        documentation_uri, mime_type=constants["DATA"]["PDF_MIME_TYPE"]
-                    )
-                    responses = model.generate_content(
-                        [doc, prompt],
-                        generation_config=generation_config,
-                        safety_settings=safety_settings,
-                        stream=False,
-                    )
-                else:
-                    responses = model.generate_content(
-                        prompt,
-                        generation_config=generation_config,
-                        stream=False,
-                    )
-                return responses.text
-            except Exception as e:
+                response = responses.text
+                with self._responses_lock:
+                    if len(self._responses) >= _LLM_RESPONSE_CACHE_SIZE:
+                        self._responses.pop(next(iter(self._responses)))
+                    self._responses[response_key] = response
+                return response
+            except _RETRYABLE_LLM_ERRORS as e:
                 if attempt == retries:
                     logger.error(f"Exception: {e}.")
                     raise e
                 else:
-                    # Exponential backoff - wait longer between each retry attempt
-                    time.sleep(base_delay * (2 ** attempt)) 
\ No newline at end of file
+                    # Exponential backoff with full jitter, so parallel workers
+                    # hitting the same quota do not retry in lockstep
+                    time.sleep(random.uniform(0, min(_LLM_MAX_BACKOFF_SECONDS, base_delay * (2 ** attempt))))
+            except Exception as e:
+                logger.error(f"Exception: {e}.")
+                raise e 
+
+    def batch_llm_inference(self, prompts, staging_uri):
+        """Performs LLM inference for many prompts with one Vertex AI batch prediction job.
+
+        The prompts are staged as a JSONL file under staging_uri, the job
+        writes its predictions next to it and the call returns once the job
+        has ended.
+
+        Args:
+            prompts (list): The prompts to send to the LLM
+            staging_uri (str): Cloud Storage folder for the job input and output
+                (e.g., 'gs://bucket/folder')
+
+        Returns:
+            list: The generated text of each prompt, in the given order. None
+                for prompts the job returned no text for.
+
+        Raises:
+            Exception: If the job cannot be submitted or does not succeed
+        """
+        try:
+            _, model_type = self._get_model()
+            storage_client = self._client._table_ops._storage_client
+            run_uri = f"{staging_uri.rstrip('/')}/{uuid.uuid4().hex}"
+            parsed_run_uri = urllib.parse.urlparse(run_uri)
+            bucket = storage_client.bucket(parsed_run_uri.netloc)
+            input_rows = [
+                json.dumps({
+                    "request": {
+                        "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+                        "generationConfig": _BATCH_GENERATION_CONFIG,
+                    }
+                })
+                for prompt in dict.fromkeys(prompts)
+            ]
+            bucket.blob(f"{parsed_run_uri.path.lstrip('/')}/input.jsonl").upload_from_string(
+                "\n".join(input_rows), content_type="application/jsonl"
+            )
+
+            job = BatchPredictionJob.submit(
+                source_model=model_type,
+                input_dataset=f"{run_uri}/input.jsonl",
+                output_uri_prefix=f"{run_uri}/output",
+            )
+            logger.info("Submitted batch prediction job %s for %d prompts.", job.resource_name, len(input_rows))
+            while not job.has_ended:
+                time.sleep(constants["LLM"]["BATCH_POLL_SECONDS"])
+                job.refresh()
+            if not job.has_succeeded:
+                raise RuntimeError(f"Batch prediction job {job.resource_name} failed: {job.error}")
+
+            # Rows echo their request, which is how answers are matched to prompts
+            responses = {}
+            parsed_output_uri = urllib.parse.urlparse(job.output_location)
+            for blob in storage_client.list_blobs(
+                parsed_output_uri.netloc, prefix=parsed_output_uri.path.lstrip("/")
+            ):
+                if not blob.name.endswith(".jsonl"):
+                    continue
+                for line in blob.download_as_text().splitlines():
+                    if not line:
+                        continue
+                    row = json.loads(line)
+                    try:
+                        prompt = row["request"]["contents"][0]["parts"][0]["text"]
+                        parts = row["response"]["candidates"][0]["content"]["parts"]
+                    except (KeyError, IndexError):
+                        logger.warning("Batch prediction row without a response: %.200s", row.get("status"))
+                        continue
+                    responses[prompt] = "".join(part.get("text", "") for part in parts)
+            return [responses.get(prompt) for prompt in prompts]
+        except Exception as e:
+            logger.error(f"Exception: {e}.")
+            raise e
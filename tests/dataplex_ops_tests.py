@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Copyright 2024 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""Dataplex Utils Metadata Wizard data scan listing test suite
+"""
+
+# OS Imports
+import types
+from unittest import mock
+import pytest
+
+# Package to test
+from dataplexutils.metadata.dataplex_operations import DataplexOperations
+
+
+_PARENT = "projects/test-project/locations/us"
+_RESOURCE = "//bigquery.googleapis.com/projects/p/datasets/d/tables/t"
+
+
+def _data_scan(name):
+    return types.SimpleNamespace(name=name, data=types.SimpleNamespace(resource=_RESOURCE))
+
+
+class TestDataScanListing:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self._scan_client = mock.MagicMock()
+        self._scan_client.list_data_scans.return_value = [_data_scan(f"{_PARENT}/dataScans/profile")]
+        client = mock.MagicMock()
+        client._data_scan_client = self._scan_client
+        self._dataplex_ops = DataplexOperations(client)
+
+    def test_data_scans_are_listed_once(self):
+        first = self._dataplex_ops._get_data_scan_index(self._scan_client, _PARENT)
+        second = self._dataplex_ops._get_data_scan_index(self._scan_client, _PARENT)
+
+        assert first == second == {_RESOURCE: [f"{_PARENT}/dataScans/profile"]}
+        self._scan_client.list_data_scans.assert_called_once_with(parent=_PARENT)
+
+    def test_refresh_data_scans_lists_again(self):
+        self._dataplex_ops._get_data_scan_index(self._scan_client, _PARENT)
+        self._scan_client.list_data_scans.return_value = [
+            _data_scan(f"{_PARENT}/dataScans/profile"),
+            _data_scan(f"{_PARENT}/dataScans/quality"),
+        ]
+
+        self._dataplex_ops.refresh_data_scans()
+        data_scan_index = self._dataplex_ops._get_data_scan_index(self._scan_client, _PARENT)
+
+        assert self._scan_client.list_data_scans.call_count == 2
+        assert data_scan_index == {
+            _RESOURCE: [f"{_PARENT}/dataScans/profile", f"{_PARENT}/dataScans/quality"]
+        }
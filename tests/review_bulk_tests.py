@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Copyright 2024 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""Dataplex Utils Metadata Wizard bulk review operations test suite
+"""
+
+# OS Imports
+from unittest import mock
+import pytest
+
+# Cloud imports
+from google.cloud import dataplex_v1
+
+# Package to test
+from dataplexutils.metadata import review_operations
+from dataplexutils.metadata.review_operations import ReviewOperations
+
+
+def _entry_name(table_fqn):
+    return f"projects/test-project/locations/us/entryGroups/@bigquery/entries/{table_fqn}"
+
+
+class TestBulkReviewOperations:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        client = mock.MagicMock()
+        client._project_id = "test-project"
+        client._dataplex_ops._build_entry_name.side_effect = _entry_name
+        client._catalog_client.get_entry.side_effect = (
+            lambda request: dataplex_v1.Entry(name=request.name)
+        )
+        self._catalog_client = client._catalog_client
+        self._review_ops = ReviewOperations(client)
+
+    def _updated_entries(self):
+        return {
+            call.kwargs["request"].entry.name: call.kwargs["request"]
+            for call in self._catalog_client.update_entry.call_args_list
+        }
+
+    def test_bulk_reject_groups_items_by_table(self):
+        result = self._review_ops.bulk_reject_review_items([
+            "table:p.d.t",
+            "column:p.d.t:a",
+            "column:p.d.t:b",
+            "column:p.d.u:a",
+        ])
+
+        assert result["success"]
+        assert len(result["results"]) == 4
+        assert self._catalog_client.update_entry.call_count == 2
+        requests = self._updated_entries()
+        assert len(requests[_entry_name("p.d.t")].aspect_keys) == 3
+        assert len(requests[_entry_name("p.d.u")].aspect_keys) == 1
+        aspect = requests[_entry_name("p.d.u")].entry.aspects[
+            "test-project.global.metadata-ai-generated@Schema.a"
+        ]
+        assert aspect.path == "Schema.a"
+        assert aspect.data["to-be-regenerated"] is True
+
+    def test_bulk_edit_runs_in_batches(self):
+        items = [
+            {"id": f"table:p.d.t{index}", "description": f"Description {index}"}
+            for index in range(5)
+        ]
+        # The same table in two batches is written once per batch
+        items.append({"id": "column:p.d.t0:a", "description": "Column a"})
+
+        with mock.patch.object(review_operations, "_BULK_BATCH_SIZE", 2):
+            result = self._review_ops.bulk_edit_review_items(items)
+
+        assert result["success"]
+        assert set(result["results"]) == {item["id"] for item in items}
+        assert self._catalog_client.update_entry.call_count == 6
+
+    def test_bulk_edit_reports_partial_failures(self):
+        def update_entry(request):
+            if request.entry.name == _entry_name("p.d.u"):
+                raise Exception("Quota exceeded")
+            return request.entry
+
+        self._catalog_client.update_entry.side_effect = update_entry
+
+        result = self._review_ops.bulk_edit_review_items([
+            {"id": "table:p.d.t", "description": "Table t"},
+            {"id": "column:p.d.u:a", "description": "Column a"},
+            {"id": "not-an-item", "description": "Invalid"},
+            {"id": "column:p.d.t:b"},
+            {"description": "No id"},
+        ])
+
+        results = result["results"]
+        assert not result["success"]
+        assert results["table:p.d.t"] == {"success": True}
+        assert not results["column:p.d.u:a"]["success"]
+        assert "Quota exceeded" in results["column:p.d.u:a"]["error"]
+        assert not results["not-an-item"]["success"]
+        assert not results["column:p.d.t:b"]["success"]
+        assert not results["#4"]["success"]
+        assert self._catalog_client.update_entry.call_count == 2
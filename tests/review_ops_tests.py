@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Copyright 2024 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""Dataplex Utils Metadata Wizard review listing and comments test suite
+"""
+
+# OS Imports
+import datetime
+from unittest import mock
+import pytest
+
+# Cloud imports
+from google.cloud import dataplex_v1
+
+# Package to test
+from dataplexutils.metadata.review_operations import ReviewOperations
+
+
+_TABLE_FQN = "p.d.t"
+_TABLE_ASPECT = "test-project.global.metadata-ai-generated"
+_COLUMN_ASPECT = f"{_TABLE_ASPECT}@Schema.a"
+
+
+def _entry_name(table_fqn):
+    return f"projects/test-project/locations/us/entryGroups/@bigquery/entries/{table_fqn}"
+
+
+def _add_aspect(entry, aspect_key, path, contents, update_time):
+    aspect_pb = dataplex_v1.Entry.pb(entry).aspects[aspect_key]
+    aspect_pb.path = path
+    aspect_pb.data.update({"contents": contents, "human-comments": []})
+    aspect_pb.update_time.FromDatetime(update_time)
+
+
+class TestReviewOperations:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        client = mock.MagicMock()
+        client._project_id = "test-project"
+        client._dataplex_ops._build_entry_name.side_effect = _entry_name
+        self._entry = dataplex_v1.Entry(name=_entry_name(_TABLE_FQN))
+        self._catalog_client = client._catalog_client
+        self._catalog_client.get_entry.side_effect = lambda request: self._entry
+        self._review_ops = ReviewOperations(client)
+
+    def test_list_review_items(self):
+        _add_aspect(self._entry, _TABLE_ASPECT, "", "Table draft",
+                    datetime.datetime(2024, 5, 1, 10, 0, 0))
+        _add_aspect(self._entry, _COLUMN_ASPECT, "Schema.a", "",
+                    datetime.datetime(2024, 5, 1, 12, 0, 0))
+        _add_aspect(self._entry, "dataplex-types.global.overview", "", "Overview",
+                    datetime.datetime(2024, 5, 1, 13, 0, 0))
+
+        result = self._review_ops.list_review_items(_TABLE_FQN)
+
+        items = {item["type"]: item for item in result["items"]}
+        assert len(result["items"]) == 2
+        assert items["table"]["name"] == _TABLE_FQN
+        assert items["table"]["draftDescription"] == "Table draft"
+        assert items["table"]["status"] == "draft"
+        assert items["column"]["name"] == f"{_TABLE_FQN}.a"
+        assert items["column"]["status"] == "current"
+        assert result["maxUpdateTime"] == "2024-05-01T12:00:00+00:00"
+
+    def test_list_review_items_since_timestamp(self):
+        _add_aspect(self._entry, _TABLE_ASPECT, "", "Table draft",
+                    datetime.datetime(2024, 5, 1, 10, 0, 0))
+        _add_aspect(self._entry, _COLUMN_ASPECT, "Schema.a", "Column draft",
+                    datetime.datetime(2024, 5, 1, 12, 0, 0))
+
+        result = self._review_ops.list_review_items(_TABLE_FQN, "2024-05-01T11:00:00")
+
+        assert [item["type"] for item in result["items"]] == ["column"]
+        assert result["maxUpdateTime"] == "2024-05-01T12:00:00+00:00"
+
+        result = self._review_ops.list_review_items(_TABLE_FQN, result["maxUpdateTime"])
+
+        assert result["items"] == []
+        assert result["maxUpdateTime"] == "2024-05-01T12:00:00+00:00"
+
+    def test_add_comment_to_column_is_written_before_returning(self):
+        result = self._review_ops.add_comment_to_column_draft_description(_TABLE_FQN, "a", "Too vague")
+
+        assert result is True
+        self._catalog_client.update_entry.assert_called_once()
+        request = self._catalog_client.update_entry.call_args.kwargs["request"]
+        assert list(request.aspect_keys) == [_COLUMN_ASPECT]
+        assert list(request.entry.aspects[_COLUMN_ASPECT].data["human-comments"]) == ["Too vague"]
+
+        self._review_ops.flush_comments()
+
+        self._catalog_client.update_entry.assert_called_once()
+
+    def test_add_comment_to_column_reports_write_failure(self):
+        self._catalog_client.update_entry.side_effect = Exception("Permission denied")
+
+        result = self._review_ops.add_comment_to_column_draft_description(_TABLE_FQN, "a", "Too vague")
+
+        assert result is False
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Copyright 2024 Google LLC
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+"""Dataplex Utils Metadata Wizard multi-table generation test suite
+"""
+
+# OS Imports
+import asyncio
+from unittest import mock
+import pytest
+
+# Package to test
+from dataplexutils.metadata.table_operations import TableOperations
+
+
+_TABLE_FQNS = [f"p.d.t{index}" for index in range(5)]
+
+
+def _generate(table_fqn, documentation_uri=None, human_comments=None):
+    if table_fqn == "p.d.broken":
+        raise RuntimeError(f"Table {table_fqn} not found")
+    return f"Generated {table_fqn}"
+
+
+class TestTablesGeneration:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self._client = mock.MagicMock()
+        self._client._client_options._max_workers = 2
+        self._client._client_options._batch_staging_uri = None
+        self._table_ops = TableOperations(self._client)
+
+    def test_generate_tables_descriptions(self):
+        with mock.patch.object(self._table_ops, "generate_table_description", side_effect=_generate):
+            results = self._table_ops.generate_tables_descriptions(_TABLE_FQNS)
+
+        assert results == [f"Generated {table_fqn}" for table_fqn in _TABLE_FQNS]
+
+    def test_generate_tables_descriptions_continues_after_failure(self):
+        with mock.patch.object(self._table_ops, "generate_table_description", side_effect=_generate) as generate:
+            with pytest.raises(RuntimeError):
+                self._table_ops.generate_tables_descriptions(["p.d.broken", *_TABLE_FQNS])
+
+        assert generate.call_count == len(_TABLE_FQNS) + 1
+
+    def test_generate_tables_descriptions_with_batch_prediction(self):
+        self._client._client_options._batch_staging_uri = "gs://bucket/staging"
+        self._client._utils.batch_llm_inference.side_effect = (
+            lambda prompts, staging_uri: [prompt.upper() for prompt in prompts]
+        )
+        table_fqns = [f"p.d.t{index}" for index in range(20)]
+
+        with mock.patch.object(self._table_ops, "_build_table_description_prompt",
+                               side_effect=lambda table_fqn: f"prompt {table_fqn}"), \
+                mock.patch.object(self._table_ops, "_persist_table_description",
+                                  side_effect=lambda table_fqn, description: description) as persist, \
+                mock.patch.object(self._table_ops, "generate_table_description") as generate:
+            results = self._table_ops.generate_tables_descriptions(table_fqns)
+
+        assert results == [f"PROMPT {table_fqn.upper()}" for table_fqn in table_fqns]
+        self._client._utils.batch_llm_inference.assert_called_once()
+        assert persist.call_count == len(table_fqns)
+        generate.assert_not_called()
+
+    def test_generate_tables_descriptions_async(self):
+        with mock.patch.object(self._table_ops, "generate_table_description", side_effect=_generate):
+            results = asyncio.run(self._table_ops.generate_tables_descriptions_async(_TABLE_FQNS))
+
+        assert results == [f"Generated {table_fqn}" for table_fqn in _TABLE_FQNS]
+
+    def test_generate_tables_descriptions_async_raises_first_failure(self):
+        with mock.patch.object(self._table_ops, "generate_table_description", side_effect=_generate) as generate:
+            with pytest.raises(RuntimeError):
+                asyncio.run(self._table_ops.generate_tables_descriptions_async([*_TABLE_FQNS, "p.d.broken"]))
+
+        assert generate.call_count == len(_TABLE_FQNS) + 1